@@ -6,9 +6,9 @@ from tkinter import ttk, messagebox
 import requests
 from requests.auth import HTTPBasicAuth
 
-# Import auth and config from main.py
+# Import auth and config from worklog_api.py
 try:
-    from main import get_session, read_text, BASE_URL
+    from worklog_api import get_session, read_text, BASE_URL
 except ImportError:
     BASE_URL = "https://higen-rnd.atlassian.net/rest/api/3/"
     
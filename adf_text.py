@@ -0,0 +1,240 @@
+"""
+adf_text.py
+Atlassian Document Format(ADF, Jira 댓글/설명의 JSON 문서)를 텍스트로 바꾸는 공용 엔진.
+
+- 재귀 대신 명시적인 스택으로 순회하므로 깊게 중첩된 목록도 재귀 한도(RecursionError) 없이 처리한다.
+- mode="flat": 모든 텍스트 조각을 공백 하나로 이어 붙인 한 줄 (worklog Comment 컬럼)
+- mode="block": 문단/제목/목록 항목/표 행마다 줄을 바꾸는 여러 줄 텍스트 (이슈 상세 팝업의 Description)
+  목록은 "-" / "1." 머리표와 들여쓰기, 표는 셀 사이 " | ", 코드 블록은 줄과 들여쓰기를 그대로 유지한다.
+- 멘션, 이모지, 상태(status), 날짜(date), 링크 카드(inlineCard)도 텍스트로 옮긴다.
+"""
+
+from datetime import datetime
+
+ADF_MODES = ("flat", "block")
+
+# block 모드에서 끝나면 줄을 바꾸는 노드
+_LINE_BLOCKS = frozenset((
+    "paragraph", "heading", "blockquote", "panel", "rule", "mediaSingle", "mediaGroup",
+    "blockCard", "embedCard", "taskItem", "decisionItem", "expand", "nestedExpand",
+))
+_LISTS = frozenset(("bulletList", "orderedList", "taskList", "decisionList"))
+_CELLS = frozenset(("tableCell", "tableHeader"))
+# 자식 순회를 마친 뒤 할 동작, 목록 항목 앞 머리표 표시
+_END_LINE, _END_LIST, _BULLET, _CELL_END, _ROW_END = range(1, 6)
+
+
+def inline_text(node: dict):
+    """텍스트로 옮길 수 있는 인라인 노드면 그 텍스트를, 아니면 None을 반환한다."""
+    ntype = node.get("type")
+    if ntype == "text":
+        return node.get("text") if "text" in node else None
+    attrs = node.get("attrs") or {}
+    if ntype == "emoji":
+        return attrs.get("shortName") or None
+    if ntype == "mention":
+        label = attrs.get("text") or attrs.get("displayName") or attrs.get("id")
+        return str(label) if label else None
+    if ntype == "status":
+        return attrs.get("text") or None
+    if ntype == "inlineCard":
+        return attrs.get("url") or None
+    if ntype == "date":
+        try:
+            return datetime.fromtimestamp(int(attrs.get("timestamp")) / 1000).date().isoformat()
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+    return None
+
+
+# 텍스트 외에 inline_text로 옮기는 인라인 노드
+_INLINE = frozenset(("emoji", "mention", "status", "inlineCard", "date"))
+# block 모드에서 노드 종류별 처리 (없으면 자식만 순회)
+_K_INLINE, _K_BREAK, _K_CODE, _K_LIST, _K_ROW, _K_CELL, _K_LINE = (
+    "inline", "break", "code", "list", "row", "cell", "line")
+_BLOCK_KINDS = {
+    **dict.fromkeys(_INLINE, _K_INLINE),
+    "hardBreak": _K_BREAK,
+    "codeBlock": _K_CODE,
+    **dict.fromkeys(_LISTS, _K_LIST),
+    "tableRow": _K_ROW,
+    **dict.fromkeys(_CELLS, _K_CELL),
+    **dict.fromkeys(_LINE_BLOCKS | {"listItem"}, _K_LINE),
+}
+
+
+def _child_nodes(node: dict):
+    """자식 노드 목록 (content → children 순). 없으면 None."""
+    content = node.get("content")
+    children = node.get("children")
+    if children.__class__ is not list:
+        return content if content.__class__ is list else None
+    if content.__class__ is not list:
+        return children
+    return content + children
+
+
+def _flat_text(adf) -> str:
+    texts = []
+    append = texts.append
+    # 노드마다 스택에 넣고 빼는 대신, 자식 목록의 반복자를 쌓아 두고 멈춘 자리부터 이어서 순회한다
+    stack = [iter(adf if adf.__class__ is list else (adf,))]
+    while stack:
+        for node in stack[-1]:
+            if node.__class__ is not dict:
+                if node.__class__ is list:
+                    stack.append(iter(node))
+                    break
+                continue
+            ntype = node.get("type")
+            if ntype == "text":
+                if "text" in node:
+                    append(node["text"])
+                continue
+            if ntype in _INLINE:
+                token = inline_text(node)
+                if token is not None:
+                    append(token)
+            children = _child_nodes(node)
+            if children:
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
+    return " ".join(texts).strip()
+
+
+class _BlockWriter:
+    """block 모드 출력. 인라인 텍스트를 모았다가 블록이 끝날 때 들여쓰기/머리표를 붙여 한 줄로 내보낸다."""
+
+    def __init__(self):
+        self.lines = []
+        self.buf = []
+        self.depth = 0
+        self.bullet = None
+        self.cells = 0
+
+    def end_line(self):
+        if self.cells:
+            # 표 셀 안의 문단은 줄을 바꾸지 않고 한 칸 띄운다
+            self.buf.append(" ")
+            return
+        if not self.buf:
+            return
+        text = "".join(self.buf).strip()
+        self.buf.clear()
+        if not text:
+            return
+        indent = "  " * max(0, self.depth - 1)
+        if self.bullet is not None:
+            text = f"{self.bullet} {text}"
+            self.bullet = None
+        elif self.depth:
+            text = "  " + text
+        self.lines.append(indent + text)
+
+    def code(self, text: str):
+        if self.cells:
+            self.buf.append(" ".join(text.split()))
+            return
+        self.end_line()
+        indent = "  " * self.depth
+        self.lines.extend(indent + line.rstrip() for line in text.splitlines() if line.strip())
+
+    def end_cell(self):
+        self.cells -= 1
+        self.buf[:] = ["".join(self.buf).rstrip(), " | "]
+
+    def end_row(self):
+        text = "".join(self.buf).rstrip()
+        if text.endswith("|"):
+            text = text[:-1]
+        self.buf[:] = [text]
+        self.end_line()
+
+
+def _block_text(adf) -> str:
+    out = _BlockWriter()
+    write = out.buf.append
+    kinds = _BLOCK_KINDS
+    # (자식 반복자, 다 돌고 나서 할 동작) 을 쌓아 두고 순회한다
+    stack = [(iter(adf if adf.__class__ is list else (adf,)), None)]
+    while stack:
+        for node in stack[-1][0]:
+            if node.__class__ is not dict:
+                if node.__class__ is tuple:
+                    # 목록 항목 앞의 머리표
+                    out.end_line()
+                    out.bullet = node[1]
+                elif node.__class__ is list:
+                    stack.append((iter(node), None))
+                    break
+                continue
+            ntype = node.get("type")
+            if ntype == "text":
+                if "text" in node:
+                    write(node["text"])
+                continue
+            kind = kinds.get(ntype)
+            if kind is _K_LINE:
+                stack.append((iter(_child_nodes(node) or ()), _END_LINE))
+            elif kind is None:
+                children = _child_nodes(node)
+                if not children:
+                    continue
+                stack.append((iter(children), None))
+            elif kind is _K_INLINE:
+                token = inline_text(node)
+                if token is not None:
+                    write(token)
+                continue
+            elif kind is _K_BREAK:
+                out.end_line()
+                continue
+            elif kind is _K_CODE:
+                out.code("".join(child.get("text", "") for child in node.get("content") or []
+                                 if child.__class__ is dict))
+                continue
+            elif kind is _K_LIST:
+                out.end_line()
+                out.depth += 1
+                start = (node.get("attrs") or {}).get("order") or 1
+                items = []
+                for i, item in enumerate(child for child in _child_nodes(node) or () if child.__class__ is dict):
+                    items.append((_BULLET, f"{start + i}." if ntype == "orderedList" else "-"))
+                    items.append(item)
+                stack.append((iter(items), _END_LIST))
+            elif kind is _K_ROW:
+                out.end_line()
+                stack.append((iter(_child_nodes(node) or ()), _ROW_END))
+            else:
+                out.cells += 1
+                stack.append((iter(_child_nodes(node) or ()), _CELL_END))
+            break
+        else:
+            action = stack.pop()[1]
+            if action == _END_LINE:
+                out.end_line()
+            elif action == _END_LIST:
+                out.end_line()
+                out.depth -= 1
+            elif action == _CELL_END:
+                out.end_cell()
+            elif action == _ROW_END:
+                out.end_row()
+    out.end_line()
+    return "\n".join(out.lines)
+
+
+def adf_to_text(adf, mode: str = "flat") -> str:
+    """
+    ADF 문서(dict/list)를 텍스트로 변환한다. 문자열이면 앞뒤 공백만 정리해서 반환한다.
+    mode는 "flat"(한 줄) 또는 "block"(블록마다 줄바꿈)이다.
+    """
+    if mode not in ADF_MODES:
+        raise ValueError(f"지원하지 않는 ADF 변환 방식입니다: {mode}")
+    if adf is None:
+        return ""
+    if isinstance(adf, str):
+        return adf.strip()
+    return _flat_text(adf) if mode == "flat" else _block_text(adf)
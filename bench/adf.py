@@ -0,0 +1,161 @@
+"""
+bench/adf.py
+ADF 텍스트 변환(adf_text.adf_to_text)의 속도를 큰 합성 문서로 측정한다.
+
+- wide: 문단/멘션/목록/표/코드 블록이 섞인 긴 설명 (--size 블록 묶음)
+- deep: --depth 단계로 중첩된 목록 (재귀 방식이면 RecursionError가 나는 깊이)
+- baseline: 이전의 재귀 방식 변환(extract_comment_text / 팝업의 extract_adf_text_with_newline)과 비교
+  (block 모드는 목록 머리표/들여쓰기, 표 셀 구분, 코드 줄 유지까지 하므로 이전 방식보다 하는 일이 많다)
+
+사용 예 (저장소 루트에서):
+    uv run python bench/adf.py
+    uv run python bench/adf.py --size 2000 --depth 5000 --runs 7
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adf_text import adf_to_text  # noqa: E402
+
+
+def _text(value: str) -> dict:
+    return {"type": "text", "text": value}
+
+
+def _para(*content) -> dict:
+    return {"type": "paragraph", "content": list(content)}
+
+
+def make_wide_doc(size: int) -> dict:
+    """문단, 멘션, 2단 목록, 3x3 표, 코드 블록을 size번 반복한 문서."""
+    content = []
+    for i in range(size):
+        content.append({"type": "heading", "attrs": {"level": 2}, "content": [_text(f"Section {i}")]})
+        content.append(_para(_text("담당: "), {"type": "mention", "attrs": {"id": f"acc-{i}", "text": f"@user{i}"}},
+                             _text(f" 작업 내용 {i} " * 5)))
+        content.append({"type": "bulletList", "content": [
+            {"type": "listItem", "content": [
+                _para(_text(f"item {i}.{j}")),
+                {"type": "orderedList", "content": [
+                    {"type": "listItem", "content": [_para(_text(f"sub {i}.{j}.{k}"))]} for k in range(3)
+                ]},
+            ]} for j in range(3)
+        ]})
+        content.append({"type": "table", "content": [
+            {"type": "tableRow", "content": [
+                {"type": "tableCell", "content": [_para(_text(f"r{r}c{c}"))]} for c in range(3)
+            ]} for r in range(3)
+        ]})
+        content.append({"type": "codeBlock", "content": [_text("def f():\n    return 1\n" * 3)]})
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def make_deep_doc(depth: int) -> dict:
+    node = _para(_text("leaf"))
+    for _ in range(depth):
+        node = {"type": "bulletList", "content": [{"type": "listItem", "content": [node]}]}
+    return {"type": "doc", "version": 1, "content": [node]}
+
+
+def baseline_flat(adf) -> str:
+    """이전 worklog_api.extract_comment_text (재귀)."""
+    texts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            ntype = node.get("type")
+            if ntype == "text" and "text" in node:
+                texts.append(node["text"])
+            elif ntype == "emoji":
+                short = (node.get("attrs") or {}).get("shortName")
+                if short:
+                    texts.append(short)
+            elif ntype == "mention":
+                m = node.get("attrs") or {}
+                label = m.get("text") or m.get("displayName") or m.get("id")
+                if label:
+                    texts.append(str(label))
+            for key in ("content", "children"):
+                if key in node and isinstance(node[key], list):
+                    for child in node[key]:
+                        walk(child)
+        elif isinstance(node, list):
+            for child in node:
+                walk(child)
+    walk(adf)
+    return " ".join(texts).strip()
+
+
+def baseline_block(adf) -> str:
+    """이전 main.py 팝업의 extract_adf_text_with_newline (재귀)."""
+    texts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            ntype = node.get("type")
+            if ntype == "text" and "text" in node:
+                texts.append(node["text"])
+            elif ntype in ("paragraph", "heading", "listItem"):
+                for key in ("content", "children"):
+                    if key in node and isinstance(node[key], list):
+                        for child in node[key]:
+                            walk(child)
+                texts.append("\n")
+            else:
+                for key in ("content", "children"):
+                    if key in node and isinstance(node[key], list):
+                        for child in node[key]:
+                            walk(child)
+        elif isinstance(node, list):
+            for child in node:
+                walk(child)
+    walk(adf)
+    return "\n".join(line.strip() for line in "".join(texts).splitlines() if line.strip())
+
+
+def measure(func, doc, runs: int):
+    """실행 시간(ms) 목록. RecursionError가 나면 None."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        try:
+            func(doc)
+        except RecursionError:
+            return None
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name: str, samples):
+    if samples is None:
+        print(f"{name:<22} RecursionError")
+    else:
+        print(f"{name:<22} median {statistics.median(samples):8.2f} ms  max {max(samples):8.2f} ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ADF 텍스트 변환 속도 측정")
+    parser.add_argument("--size", type=int, default=1000, help="wide 문서의 블록 묶음 수 (기본: 1000)")
+    parser.add_argument("--depth", type=int, default=3000, help="deep 문서의 목록 중첩 단계 (기본: 3000)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (기본: 5)")
+    args = parser.parse_args(argv)
+    runs = max(1, args.runs)
+
+    ok = True
+    for label, doc in (("wide", make_wide_doc(args.size)), ("deep", make_deep_doc(args.depth))):
+        print(f"[{label}]")
+        for mode, baseline in (("flat", baseline_flat), ("block", baseline_block)):
+            samples = measure(lambda d: adf_to_text(d, mode), doc, runs)
+            report(f"  adf_to_text {mode}", samples)
+            report(f"  baseline {mode}", measure(baseline, doc, runs))
+            ok &= samples is not None
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+bench/started.py
+worklog 시작일시(started) 변환의 행당 비용을 측정한다.
+
+- baseline: 이전 방식 (행마다 strptime 두 번: 표시 문자열 + 날짜)
+- decode cold: worklog_api.decode_started, 캐시를 비운 상태에서 (fromisoformat 한 번)
+- decode warm: 같은 값을 다시 변환할 때 (lru_cache 적중)
+- worklog_to_row: 행 변환 전체 (시작일시 외 필드 포함)
+
+시작일시는 --days일 동안 30분 단위 값으로 만들어, 실제 조회처럼 같은 값이 여러 행에 반복되게 한다.
+
+사용 예 (저장소 루트에서):
+    uv run python bench/started.py
+    uv run python bench/started.py --rows 200000 --days 30
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from worklog_api import decode_started, parse_started, worklog_to_row  # noqa: E402
+
+
+def make_started_values(rows: int, days: int) -> list:
+    base = datetime(2026, 6, 1, 8, 0)
+    slots = [base + timedelta(days=d, minutes=30 * m) for d in range(days) for m in range(20)]
+    return [slots[(i * 7919) % len(slots)].strftime("%Y-%m-%dT%H:%M:%S.000+0900") for i in range(rows)]
+
+
+def baseline(started_str: str) -> tuple:
+    """이전 format_started_kor + parse_started_date."""
+    dt = datetime.strptime(started_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+    weekdays = ["월", "화", "수", "목", "금", "토", "일"]
+    display = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}({weekdays[dt.weekday()]}) {dt.hour:02d}:{dt.minute:02d}"
+    day = datetime.strptime(started_str, "%Y-%m-%dT%H:%M:%S.%f%z").date().isoformat()
+    return display, day
+
+
+def clear_cache():
+    decode_started.cache_clear()
+    parse_started.cache_clear()
+
+
+def measure(func, values: list, runs: int, before=None) -> list:
+    """행당 시간(µs) 목록."""
+    samples = []
+    for _ in range(runs):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        samples.append((time.perf_counter() - start) * 1e6 / len(values))
+    return samples
+
+
+def report(name: str, samples: list):
+    print(f"{name:<16} median {statistics.median(samples):7.3f} µs/row  max {max(samples):7.3f} µs/row")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="worklog 시작일시 변환 비용 측정")
+    parser.add_argument("--rows", type=int, default=100000, help="변환할 행 수 (기본: 100000)")
+    parser.add_argument("--days", type=int, default=20, help="시작일시가 걸쳐 있는 일수 (기본: 20)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (기본: 5)")
+    args = parser.parse_args(argv)
+    values = make_started_values(max(1, args.rows), max(1, args.days))
+    runs = max(1, args.runs)
+    print(f"rows {len(values)}, distinct started {len(set(values))}")
+
+    # 캐시 없이 fromisoformat 자체의 비용을 보려고 값마다 다른 문자열(마이크로초 부분)을 쓴다
+    unique = [f"{value[:20]}{i % 1000000:06d}{value[23:]}" for i, value in enumerate(values)]
+    report("baseline", measure(baseline, values, runs))
+    report("decode cold", measure(decode_started, unique, runs, before=clear_cache))
+    report("decode warm", measure(decode_started, values, runs))
+    worklogs = [{"id": str(i), "started": value, "timeSpent": "1h", "timeSpentSeconds": 3600,
+                 "author": {"accountId": "acc", "displayName": "홍길동"}, "updated": value,
+                 "comment": {"type": "doc", "content": [{"type": "paragraph",
+                                                         "content": [{"type": "text", "text": "작업"}]}]}}
+                for i, value in enumerate(values)]
+    report("worklog_to_row", measure(lambda wl: worklog_to_row("PROJ-1", wl), worklogs, runs, before=clear_cache))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+bench/startup.py
+main.py(GUI)의 시작 시간을 측정하고 예산(budget)을 넘는지 확인한다.
+
+- import: `import main`에 걸리는 시간 (창을 만들기 전까지)
+- window: 프로세스 시작부터 첫 창이 그려질 때까지의 시간 (JIRA_WORKLOG_STARTUP_PROBE 모드)
+- heavy: 시작 시점에 불러오면 안 되는 모듈(pandas, requests …)이 로드되었는지
+
+사용 예 (저장소 루트에서):
+    uv run python bench/startup.py            # 5회 측정, 중앙값이 예산을 넘으면 종료 코드 1
+    uv run python bench/startup.py --runs 10
+
+창 측정은 화면과 jira_api_token.txt / members.csv가 있는 환경에서만 가능하며, 없으면 건너뛴다.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+# 시작 시간 예산 (ms, 중앙값 기준). 사내 Windows 노트북 기준으로 정한 값이다.
+IMPORT_BUDGET_MS = 300
+WINDOW_BUDGET_MS = 1500
+# GUI 시작 시 import되면 안 되는 모듈 (조회/저장 시점에 불러온다)
+HEAVY_MODULES = ("pandas", "numpy", "requests", "urllib3", "jira_client")
+
+_IMPORT_SNIPPET = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import main\n"
+    "ms = (time.perf_counter() - t) * 1000\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(f'{{ms:.1f}} {{\",\".join(heavy)}}')\n"
+)
+
+
+def measure_import() -> tuple[float, list]:
+    snippet = _IMPORT_SNIPPET.format(heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", snippet], cwd=_ROOT, capture_output=True, text=True, check=True)
+    ms, _, heavy = out.stdout.strip().partition(" ")
+    return float(ms), [m for m in heavy.split(",") if m]
+
+
+def measure_window() -> float | None:
+    """첫 창이 그려질 때까지의 시간(ms). 창을 띄울 수 없는 환경이면 None."""
+    env = dict(os.environ, JIRA_WORKLOG_STARTUP_PROBE="1")
+    try:
+        out = subprocess.run([sys.executable, "main.py"], cwd=_ROOT, env=env,
+                             capture_output=True, text=True, timeout=60)
+    except subprocess.TimeoutExpired:
+        return None
+    for line in out.stdout.splitlines():
+        if line.startswith("startup_probe "):
+            fields = dict(item.split("=") for item in line.split()[1:])
+            return float(fields["window_ms"])
+    return None
+
+
+def report(name: str, samples: list, budget: float) -> bool:
+    median = statistics.median(samples)
+    ok = median <= budget
+    print(f"{name:<7} median {median:7.1f} ms  max {max(samples):7.1f} ms  "
+          f"budget {budget:.0f} ms  {'OK' if ok else 'OVER'}")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="main.py 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (기본: 5)")
+    args = parser.parse_args(argv)
+
+    ok = True
+    import_ms, heavy_loaded = [], set()
+    start = time.perf_counter()
+    for _ in range(max(1, args.runs)):
+        ms, heavy = measure_import()
+        import_ms.append(ms)
+        heavy_loaded.update(heavy)
+    ok &= report("import", import_ms, IMPORT_BUDGET_MS)
+    if heavy_loaded:
+        print(f"heavy   시작 시 로드된 모듈: {', '.join(sorted(heavy_loaded))}  OVER")
+        ok = False
+    else:
+        print("heavy   없음  OK")
+
+    window_ms = [ms for ms in (measure_window() for _ in range(max(1, args.runs))) if ms is not None]
+    if window_ms:
+        ok &= report("window", window_ms, WINDOW_BUDGET_MS)
+    else:
+        print("window  창을 띄울 수 없는 환경이라 건너뜀")
+    print(f"(측정 {time.perf_counter() - start:.1f}s)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+bench/timesheet.py
+인원 × 날짜 집계표(timesheet.Timesheet)를 만드는 시간을 큰 합성 데이터로 측정하고 예산(budget)을 넘는지 확인한다.
+
+- build: 행 → 타입 컬럼 DataFrame → 인원 × 날짜 표, 칸별 판정, 주별 소계, 이슈 내역
+- table / display: 내보내기용 표, 화면 표 문자열
+- baseline: 이전 방식 (dict 누적 + 인원마다 daily_totals로 날짜를 도는 worklog_cli.out_of_band)
+
+기본값은 50명 × 1년, 평일마다 1~4건 (주말은 가끔) 이다.
+
+사용 예 (저장소 루트에서):
+    uv run python bench/timesheet.py          # 5회 측정, build 중앙값이 예산을 넘으면 종료 코드 1
+    uv run python bench/timesheet.py --members 100 --days 730
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from timesheet import Timesheet  # noqa: E402
+from worklog_api import seconds_by_author_day  # noqa: E402
+from worklog_cli import out_of_band  # noqa: E402
+
+# 집계표 생성 예산 (ms, 중앙값 기준). 50명 × 1년을 GUI에서 기다리지 않고 볼 수 있는 수준
+BUILD_BUDGET_MS = 1000
+
+
+def make_rows(members: int, days: int, seed: int = 0) -> tuple:
+    """(행 목록, 대상자 목록, 시작일, 종료일)."""
+    rng = random.Random(seed)
+    authors = [(f"acc-{i:03d}", f"인원{i:03d}") for i in range(members)]
+    start = date(2025, 1, 1)
+    day_strs = [(start + timedelta(days=d)).isoformat() for d in range(days)]
+    weekend = {s for d, s in enumerate(day_strs) if (start + timedelta(days=d)).weekday() >= 5}
+    rows = []
+    for aid, name in authors:
+        for day in day_strs:
+            if day in weekend and rng.random() > 0.05:
+                continue
+            for _ in range(rng.randint(1, 4)):
+                key = f"PROJ-{rng.randint(1, 400)}"
+                rows.append({
+                    "issueKey": key, "issueSummary": f"summary of {key}", "authorAccountId": aid,
+                    "authorDisplayName": name, "startedDate": day,
+                    "timeSpentSeconds": rng.choice((1800, 3600, 5400, 7200, 10800)),
+                })
+    return rows, authors, day_strs[0], day_strs[-1]
+
+
+def baseline(rows: list, authors: list, date_from: str, date_to: str) -> list:
+    return out_of_band(seconds_by_author_day(rows), authors, date_from, date_to)
+
+
+def measure(func, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name: str, samples: list):
+    print(f"{name:<10} median {statistics.median(samples):8.1f} ms  max {max(samples):8.1f} ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="인원 × 날짜 집계표 생성 시간 측정")
+    parser.add_argument("--members", type=int, default=50, help="인원 수 (기본: 50)")
+    parser.add_argument("--days", type=int, default=365, help="기간 일수 (기본: 365)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (기본: 5)")
+    parser.add_argument("--budget", type=float, default=BUILD_BUDGET_MS,
+                        help=f"build 예산 ms (기본: {BUILD_BUDGET_MS})")
+    args = parser.parse_args(argv)
+    rows, authors, date_from, date_to = make_rows(max(1, args.members), max(1, args.days))
+    runs = max(1, args.runs)
+    print(f"members {len(authors)}, days {args.days}, rows {len(rows)}")
+
+    sheet = Timesheet.build(rows, authors, date_from, date_to)
+    if sheet.out_of_band() != baseline(rows, authors, date_from, date_to):
+        print("결과 불일치: Timesheet.out_of_band와 이전 방식의 결과가 다릅니다.")
+        return 1
+
+    build = measure(lambda: Timesheet.build(rows, authors, date_from, date_to), runs)
+    report("build", build)
+    report("table", measure(sheet.table, runs))
+    report("display", measure(sheet.display_rows, runs))
+    report("baseline", measure(lambda: baseline(rows, authors, date_from, date_to), runs))
+    median = statistics.median(build)
+    if median > args.budget:
+        print(f"예산 초과: build 중앙값 {median:.1f} ms > {args.budget:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+edit_queue.py
+worklog 수정 요청을 모아서 백그라운드에서 Jira에 반영하는 쓰기 지연(write-behind) 큐.
+
+- 같은 worklogId에 대한 아직 보내지 않은 수정(timeSpent, comment, started)은 하나로 합쳐 한 번의 PUT으로 보낸다.
+- worklog 하나당 동시에 하나의 요청만 보내므로, 같은 worklog의 수정은 들어온 순서대로 반영된다.
+- 일시적인 오류(요청 제한, 5xx, 네트워크 오류)는 지수 백오프(Retry-After가 있으면 그 값)로 다시 시도한다.
+  재시도는 이 큐만 하므로 send는 전송 계층의 재시도를 끄고 보내야 한다 (재시도 횟수가 곱해지지 않게).
+- 보내지 못한 수정은 파일(pending_edits.json)에 저장해 두었다가 프로그램을 다시 시작하면 이어서 보낸다.
+- 아직 보낼 수 없는 상태(인증 정보 없음 등)면 send가 EditNotReady를 던지고, 시도 횟수에 세지 않고 나중에 다시 보낸다.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+PENDING_EDITS_FILE = "pending_edits.json"
+EDIT_WORKERS = 4
+EDIT_MAX_RETRIES = 5
+# 다시 시도할 HTTP 상태 코드 (응답이 없는 네트워크 오류도 다시 시도한다)
+TRANSIENT_STATUS = (408, 429, 500, 502, 503, 504)
+# 수정 항목 이름 (update_worklog_remote 인자와 같은 의미)
+EDIT_FIELDS = ("timeSpent", "comment", "started")
+# EditNotReady로 미룬 수정을 다시 보내 보기까지 기다리는 시간(초)
+NOT_READY_RETRY_SEC = 30
+
+
+class EditNotReady(Exception):
+    """send가 아직 보낼 수 없는 상태(인증 정보 없음 등)일 때 던진다. 실패로 보지 않고 나중에 다시 보낸다."""
+
+
+def is_transient_error(e: Exception) -> bool:
+    """다시 시도하면 성공할 수 있는 오류인지 판단한다. requests의 예외는 모두 OSError를 상속한다."""
+    if not isinstance(e, OSError):
+        return False
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    return status is None or status in TRANSIENT_STATUS
+
+
+class EditQueue:
+    """
+    send(issue_key, worklog_id, changes) -> 결과 worklog(dict) 를 백그라운드 스레드에서 호출한다.
+    on_result(edit, result, error)는 수정 하나가 끝날 때(성공 또는 더 이상 재시도하지 않는 실패) 호출되며,
+    edit는 {"issueKey", "worklogId", "changes", "attempts"} 형태이다. (GUI에서는 after()로 넘겨서 사용)
+    start=False로 만들면 파일의 수정만 읽어 두고, start()를 호출할 때 작업 스레드를 시작한다.
+    """
+
+    def __init__(self, send, on_result=None, path: str = PENDING_EDITS_FILE,
+                 workers: int = EDIT_WORKERS, max_retries: int = EDIT_MAX_RETRIES, start: bool = True):
+        self._send = send
+        self._on_result = on_result
+        self._path = Path(path) if path else None
+        self._max_retries = max_retries
+        self._pending = OrderedDict()
+        self._not_before = {}
+        self._in_flight = {}
+        self._cond = threading.Condition()
+        self._workers = max(1, workers)
+        self._started = False
+        self._load()
+        if start:
+            self.start()
+
+    def start(self):
+        """작업 스레드를 시작한다 (이미 시작했으면 아무것도 하지 않음)."""
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+        for i in range(self._workers):
+            threading.Thread(target=self._worker, name=f"edit-queue-{i}", daemon=True).start()
+
+    def submit(self, issue_key: str, worklog_id: str, changes: dict):
+        """수정을 큐에 넣는다. 같은 worklog의 보내지 않은 수정이 있으면 합친다 (나중 값이 우선)."""
+        changes = {k: v for k, v in changes.items() if k in EDIT_FIELDS and v is not None}
+        if not changes:
+            return
+        worklog_id = str(worklog_id)
+        with self._cond:
+            edit = self._pending.get(worklog_id)
+            if edit is None:
+                edit = {"issueKey": issue_key, "worklogId": worklog_id, "changes": {}, "attempts": 0}
+                self._pending[worklog_id] = edit
+            edit["changes"].update(changes)
+            self._save()
+            self._cond.notify()
+
+    def is_pending(self, worklog_id: str) -> bool:
+        """아직 보내지 않았거나 보내는 중인 수정이 있는지."""
+        with self._cond:
+            return str(worklog_id) in self._pending or str(worklog_id) in self._in_flight
+
+    def _take(self) -> dict:
+        """보낼 수 있는 수정(해당 worklog의 요청이 진행 중이 아니고 재시도 대기 시간이 지난 것)을 꺼낸다."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = None
+                for worklog_id, edit in self._pending.items():
+                    if worklog_id in self._in_flight:
+                        continue
+                    ready_at = self._not_before.get(worklog_id, 0.0)
+                    if ready_at <= now:
+                        del self._pending[worklog_id]
+                        self._not_before.pop(worklog_id, None)
+                        self._in_flight[worklog_id] = edit
+                        return edit
+                    wait = ready_at - now if wait is None else min(wait, ready_at - now)
+                self._cond.wait(wait)
+
+    def _worker(self):
+        while True:
+            edit = self._take()
+            try:
+                result = self._send(edit["issueKey"], edit["worklogId"], dict(edit["changes"]))
+            except Exception as e:
+                self._failed(edit, e)
+            else:
+                self._finish(edit)
+                self._notify(edit, result, None)
+
+    def _notify(self, edit: dict, result, error):
+        """on_result 호출. 콜백에서 난 오류로 작업 스레드가 죽지 않도록 여기서 막는다."""
+        if self._on_result is None:
+            return
+        try:
+            self._on_result(edit, result, error)
+        except Exception:
+            pass
+
+    def _finish(self, edit: dict):
+        with self._cond:
+            self._in_flight.pop(edit["worklogId"], None)
+            self._save()
+            self._cond.notify_all()
+
+    def _failed(self, edit: dict, error: Exception):
+        if isinstance(error, EditNotReady):
+            self._retry_later(edit, NOT_READY_RETRY_SEC)
+            return
+        edit["attempts"] += 1
+        if not is_transient_error(error) or edit["attempts"] > self._max_retries:
+            self._finish(edit)
+            self._notify(edit, None, error)
+            return
+        from jira_transport import backoff_delay, parse_retry_after
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        self._retry_later(edit, backoff_delay(edit["attempts"] - 1, parse_retry_after(headers.get("Retry-After"))))
+
+    def _retry_later(self, edit: dict, delay: float):
+        """보낸 수정을 다시 큐에 넣고 delay초 뒤에 보낸다."""
+        with self._cond:
+            worklog_id = edit["worklogId"]
+            self._in_flight.pop(worklog_id, None)
+            newer = self._pending.pop(worklog_id, None)
+            if newer is not None:
+                # 보내는 동안 들어온 수정이 더 최신이므로 그 값이 우선한다
+                edit["changes"].update(newer["changes"])
+            self._pending[worklog_id] = edit
+            self._not_before[worklog_id] = time.monotonic() + delay
+            self._save()
+            self._cond.notify_all()
+
+    def _load(self):
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            edits = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for edit in edits:
+            worklog_id = str(edit.get("worklogId", ""))
+            if worklog_id and edit.get("issueKey") and edit.get("changes"):
+                merged = self._pending.setdefault(worklog_id, {
+                    "issueKey": edit["issueKey"], "worklogId": worklog_id, "changes": {}, "attempts": 0,
+                })
+                merged["changes"].update(edit["changes"])
+
+    def _save(self):
+        """보내지 않은 수정(보내는 중인 것 포함)을 파일에 저장한다. self._cond를 잡은 상태에서 호출한다."""
+        if self._path is None:
+            return
+        # 보내는 중인 수정을 먼저 저장해 두어야 다시 읽을 때 나중 수정이 그 위에 합쳐진다
+        edits = list(self._in_flight.values()) + list(self._pending.values())
+        try:
+            if not edits:
+                if self._path.exists():
+                    self._path.unlink()
+                return
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            tmp.write_text(json.dumps(edits, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError:
+            pass
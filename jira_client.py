@@ -0,0 +1,69 @@
+"""
+jira_client.py
+애플리케이션 전체에서 공유하는 Jira 세션(JiraClient)과 커넥션 풀 설정.
+requests/urllib3를 불러오므로, GUI 시작 시간을 줄이기 위해 worklog_api와 분리해 두고 처음 조회할 때 import한다.
+"""
+
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.connection import HTTPConnection
+
+from jira_transport import AdaptiveLimiter, TransportSession
+from worklog_api import FETCH_WORKERS, get_current_account_id
+
+class KeepAliveAdapter(HTTPAdapter):
+    """유휴 상태의 커넥션이 VPN/방화벽에서 끊기지 않도록 TCP keep-alive를 켠 어댑터."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+class JiraClient(TransportSession):
+    """
+    애플리케이션 전체에서 공유하는 Jira 세션.
+    조회/수정/이슈 팝업이 같은 keep-alive 커넥션 풀을 재사용하여 매 요청마다 TCP+TLS 연결을 새로 맺지 않고,
+    현재 사용자의 accountId(/myself)는 한 번만 조회해서 기억한다. 응답은 gzip으로 받아 자동으로 풀린다.
+    요청 제한(429/503)은 jira_transport의 재시도/AIMD 동시성 제어가 처리하며, 동시 요청 한도는 풀 크기를 넘지 않는다.
+    """
+
+    def __init__(self, user_email: str, api_token: str, pool_size: int = FETCH_WORKERS):
+        super().__init__(limiter=AdaptiveLimiter(initial=max(1, pool_size // 2), maximum=pool_size))
+        self.auth = HTTPBasicAuth(user_email, api_token)
+        self.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        adapter = KeepAliveAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self._account_id = None
+        self._account_lock = threading.Lock()
+
+    def account_id(self) -> str:
+        with self._account_lock:
+            if self._account_id is None:
+                self._account_id = get_current_account_id(self)
+            return self._account_id
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(user_email: str, api_token: str) -> JiraClient:
+    """인증 정보별로 하나의 JiraClient를 만들어 재사용한다."""
+    with _clients_lock:
+        client = _clients.get((user_email, api_token))
+        if client is None:
+            client = JiraClient(user_email, api_token)
+            _clients[(user_email, api_token)] = client
+        return client
+
+def get_session(user_email: str, api_token: str) -> requests.Session:
+    return JiraClient(user_email, api_token)
+
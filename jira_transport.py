@@ -0,0 +1,146 @@
+"""
+jira_transport.py
+Jira / Confluence REST 호출이 함께 쓰는 전송 계층.
+HTTP 429/503 응답을 받으면 Retry-After를 따르거나 지터가 들어간 지수 백오프로 재시도하고
+(POST처럼 두 번 처리되면 안 되는 요청은 처리되지 않았다고 확실한 429일 때만),
+동시에 보내는 요청 수를 AIMD(성공하면 조금씩 늘리고, 제한에 걸리면 절반으로 줄임) 방식으로 조절한다.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+# 재시도 대상 상태 코드 (요청 제한 / 일시적 서비스 불가)
+RETRY_STATUS = (429, 503)
+# 같은 요청을 다시 보내도 결과가 같은 메서드. 그 밖의 메서드(POST/PATCH)는 503이면 서버에서 이미 처리됐을 수도
+# 있으므로(예: worklog가 두 번 생성됨) 재시도하지 않고, 요청을 받지 않았다는 뜻인 429만 재시도한다
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+MAX_RETRIES = 6
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+def parse_retry_after(value) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환한다. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """
+    재시도 전 대기 시간.
+    Retry-After가 있으면 그 값에 약간의 지터를 더하고, 없으면 full jitter 지수 백오프를 사용한다.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, BACKOFF_BASE)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+class AdaptiveLimiter:
+    """
+    동시 요청 수를 AIMD로 조절하는 제한기.
+    - 성공 응답이 현재 한도만큼 쌓이면 한도를 1 늘린다 (additive increase)
+    - 429/503을 받으면 한도를 절반으로 줄인다 (multiplicative decrease).
+      동시에 날아간 요청들이 한꺼번에 제한에 걸려도 한 번만 줄이도록 짧은 유예 시간을 둔다.
+    - Retry-After를 받으면 그 시간 동안 모든 요청을 멈춘다.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16, decrease_cooldown: float = 1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._decrease_cooldown = decrease_cooldown
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                self._cond.wait()
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def on_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def on_throttle(self, retry_after: float | None = None):
+        with self._cond:
+            now = time.monotonic()
+            if now - self._last_decrease >= self._decrease_cooldown:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._last_decrease = now
+            self._successes = 0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+
+class TransportSession(requests.Session):
+    """
+    재시도와 동시성 제어가 들어간 requests.Session.
+    모든 요청(get/post/put …)이 request()를 거치므로 기존 API 함수는 수정 없이 그대로 사용할 수 있다.
+    요청마다 retries=를 주면 그 요청의 재시도 횟수를 바꾼다 (예: 자체 재시도가 있는 수정 큐는 retries=0).
+    """
+
+    def __init__(self, limiter: AdaptiveLimiter | None = None, max_retries: int = MAX_RETRIES):
+        super().__init__()
+        self.limiter = limiter or AdaptiveLimiter()
+        self.max_retries = max_retries
+
+    def request(self, method, url, *args, retries: int | None = None, **kwargs):
+        max_retries = self.max_retries if retries is None else retries
+        idempotent = str(method).upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            with self.limiter:
+                resp = super().request(method, url, *args, **kwargs)
+            if resp.status_code not in RETRY_STATUS:
+                self.limiter.on_success()
+                return resp
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            self.limiter.on_throttle(retry_after)
+            if attempt >= max_retries or (resp.status_code != 429 and not idempotent):
+                return resp
+            resp.close()
+            time.sleep(backoff_delay(attempt, retry_after))
+            attempt += 1
@@ -1,216 +1,30 @@
+import time
+_STARTUP_T0 = time.perf_counter()
+
+import os
 import threading
 import calendar
 
-import requests
-from requests.auth import HTTPBasicAuth
-import pandas as pd
-from datetime import datetime, date
-from pathlib import Path
+from datetime import datetime, date, timedelta
 import sys
 import subprocess
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
-BASE_URL = "https://higen-rnd.atlassian.net/rest/api/3/"
-
-def read_text(path: str) -> str:
-    p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"파일이 없습니다: {path}")
-    return p.read_text(encoding="utf-8").strip()
-
-def load_members(path: str) -> list:
-    """
-    members.csv 파일을 읽어서 (이름, accountId, email) 튜플 리스트를 반환한다.
-    파일 형식: 이름,accountId,email
-    """
-    p = Path(path)
-    members = []
-    if not p.exists():
-        return members
-    
-    try:
-        lines = p.read_text(encoding="utf-8").splitlines()
-        # 헤더(첫번째 행) 건너뛰기
-        if lines:
-            lines = lines[1:]
-        for line in lines:
-            if not line.strip() or line.strip().startswith("#"):
-                continue
-            parts = line.split(",")
-            if len(parts) >= 3:
-                name = parts[0].strip()
-                aid = parts[1].strip()
-                email = parts[2].strip()
-                if name and aid and email:
-                    members.append((name, aid, email))
-            elif len(parts) >= 2:
-                # Fallback for old CSV format (no email) - user must fix
-                pass
-    except Exception:
-        pass
-    return members
-
-def get_session(user_email: str, api_token: str) -> requests.Session:
-    s = requests.Session()
-    s.auth = HTTPBasicAuth(user_email, api_token)
-    s.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
-    return s
-
-def get_current_account_id(sess: requests.Session) -> str:
-    r = sess.get(BASE_URL + "myself", timeout=30)
-    r.raise_for_status()
-    data = r.json()
-    return data["accountId"]
-
-def validate_date_str(date_str: str) -> str:
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return date_str
-    except ValueError:
-        raise ValueError("날짜 형식이 올바르지 않습니다. 예: 2025-09-17")
-
-def enhanced_search_issue_keys(sess: requests.Session, jql: str, fields=None, page_size=100) -> list:
-    if fields is None:
-        fields = ["key"]
-    all_keys = []
-    next_token = None
-    url = BASE_URL + "search/jql"
-    while True:
-        payload = {
-            "jql": jql,
-            "fields": fields,
-            "maxResults": page_size
-        }
-        if next_token:
-            payload["nextPageToken"] = next_token
-        r = sess.post(url, json=payload, timeout=60)
-        r.raise_for_status()
-        data = r.json()
-        issues = data.get("issues", []) or []
-        all_keys.extend([it.get("key") for it in issues if it.get("key")])
-        next_token = data.get("nextPageToken")
-        if not next_token:
-            break
-    return sorted(set(all_keys))
-
-def iter_issue_worklogs(sess: requests.Session, issue_key: str, page_size=100):
-    url = f"{BASE_URL}issue/{issue_key}/worklog"
-    start_at = 0
-    while True:
-        r = sess.get(url, params={"startAt": start_at, "maxResults": page_size}, timeout=60)
-        r.raise_for_status()
-        data = r.json()
-        worklogs = data.get("worklogs", []) or []
-        total = data.get("total", len(worklogs))
-        for wl in worklogs:
-            yield wl
-        start_at += len(worklogs)
-        if start_at >= total:
-            break
-
-def extract_comment_text(adf) -> str:
-    try:
-        if isinstance(adf, str):
-            return adf.strip()
-        texts = []
-        def walk(node):
-            if isinstance(node, dict):
-                ntype = node.get("type")
-                if ntype == "text" and "text" in node:
-                    texts.append(node["text"])
-                elif ntype == "emoji":
-                    short = (node.get("attrs") or {}).get("shortName")
-                    if short:
-                        texts.append(short)
-                elif ntype == "mention":
-                    m = node.get("attrs") or {}
-                    label = m.get("text") or m.get("displayName") or m.get("id")
-                    if label:
-                        texts.append(str(label))
-                for key in ("content", "children"):
-                    if key in node and isinstance(node[key], list):
-                        for child in node[key]:
-                            walk(child)
-            elif isinstance(node, list):
-                for child in node:
-                    walk(child)
-        walk(adf)
-        return " ".join(texts).strip()
-    except Exception:
-        return ""
-
-def to_adf_comment(text: str) -> dict:
-    return {
-        "type": "doc",
-        "version": 1,
-        "content": [
-            {
-                "type": "paragraph",
-                "content": [
-                    {"type": "text", "text": text or ""}
-                ]
-            }
-        ]
-    }
-
-def format_started_kor(started_str: str) -> str:
-    try:
-        dt = datetime.strptime(started_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-        weekdays = ["월", "화", "수", "목", "금", "토", "일"]
-        w = weekdays[dt.weekday()]
-        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}({w}) {dt.hour:02d}:{dt.minute:02d}"
-    except Exception:
-        return started_str
-
-def update_worklog_remote(issue_key, worklog_id, time_spent, comment, started,
-                         api_token=None, user_email=None):
-    url = f"{BASE_URL}issue/{issue_key}/worklog/{worklog_id}"
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    data = {}
-    if time_spent is not None:
-        data["timeSpent"] = time_spent
-    if comment is not None:
-        data["comment"] = to_adf_comment(comment)
-    if started:
-        data["started"] = started
-    if api_token is None:
-        api_token = read_text("jira_api_token.txt")
-    if user_email is None:
-        raise ValueError("User email is required.")
-    r = requests.put(
-        url,
-        auth=HTTPBasicAuth(user_email, api_token),
-        headers=headers,
-        json=data,
-        timeout=30
-    )
-    r.raise_for_status()
-    return r.json()
-
-def fetch_issue_info_enhanced(sess: requests.Session, issue_key: str) -> dict:
-    """
-    Enhanced JQL 기반으로 특정 이슈의 주요 정보를 반환 (summary, status, assignee, updated 등)
-    """
-    url = BASE_URL + "search/jql"
-    jql = f'key = "{issue_key}"'
-    fields = ["project", "summary", "status", "assignee", "updated", "creator", "reporter", "startdate", "duedate", "description"]
-    payload = {
-        "jql": jql,
-        "fields": fields,
-        "maxResults": 1
-    }
-    r = sess.post(url, json=payload, timeout=45)
-    r.raise_for_status()
-    data = r.json()
-    issues = data.get("issues", [])
-    if not issues:
-        return {}
-    return issues[0].get("fields", {})
+# requests/urllib3(jira_client)는 창을 띄운 뒤 백그라운드에서 불러온다 (_preload_client 참고)
+import worklog_api
+from worklog_api import (
+    WORKLOG_DB, DISPLAY_COLUMNS, ISSUE_COLUMNS, RowWriter, open_export,
+    WorklogStore, QueryCache, read_text, load_members, validate_date_str,
+    IssueInfoCache, format_started_dt, format_started_jira, parse_started, is_daily_hours_ok,
+    Duration, get_time_tracking,
+    iter_worklog_rows, query_worklog_rows, sort_worklog_rows, check_cancelled, QueryCancelled,
+    update_worklog_remote, worklog_to_row, WorklogIndex, bulk_edit_changes, bulk_update_worklogs,
+    read_import_file, plan_worklog_import, create_planned_worklogs,
+)
+from adf_text import adf_to_text
+from edit_queue import EditQueue, EditNotReady
 
 class DatePickerDialog(tk.Toplevel):
     def __init__(self, parent, initial_date=None, title="날짜 선택"):
@@ -468,6 +282,170 @@ class TimePickerDialog(tk.Toplevel):
         self.destroy()
 
 
+class BulkEditDialog(tk.Toplevel):
+    """
+    선택한 worklog 일괄 수정 조건 입력 창.
+    result = {"shift_minutes": int | None, "time_spent": str | None, "find": str | None, "replace": str}
+    """
+
+    def __init__(self, parent, count: int, title="선택 일괄 수정"):
+        super().__init__(parent)
+        self.title(title)
+        self.transient(parent)
+        self.grab_set()
+        self.resizable(False, False)
+
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        parent_w = parent.winfo_width()
+        parent_h = parent.winfo_height()
+        x = parent_x + (parent_w - 360) // 2
+        y = parent_y + (parent_h - 230) // 2
+        self.geometry(f"360x230+{max(0, x)}+{max(0, y)}")
+
+        self.result = None
+        self._build_ui(count)
+
+        self.bind("<Return>", lambda event: self._confirm())
+        self.bind("<Escape>", lambda event: self.destroy())
+
+    def _build_ui(self, count: int):
+        frm = ttk.Frame(self, padding=10)
+        frm.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frm, text=f"선택한 {count}건에 적용합니다. (비워 둔 항목은 바꾸지 않음)").grid(
+            row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
+
+        ttk.Label(frm, text="Started 이동(분):").grid(row=1, column=0, sticky="w", pady=2)
+        self.ent_shift = ttk.Entry(frm, width=24)
+        self.ent_shift.grid(row=1, column=1, sticky="w", pady=2)
+        ttk.Label(frm, text="TimeSpent 변경:").grid(row=2, column=0, sticky="w", pady=2)
+        self.ent_time = ttk.Entry(frm, width=24)
+        self.ent_time.grid(row=2, column=1, sticky="w", pady=2)
+        ttk.Label(frm, text="Comment 찾기:").grid(row=3, column=0, sticky="w", pady=2)
+        self.ent_find = ttk.Entry(frm, width=24)
+        self.ent_find.grid(row=3, column=1, sticky="w", pady=2)
+        ttk.Label(frm, text="바꿀 내용:").grid(row=4, column=0, sticky="w", pady=2)
+        self.ent_replace = ttk.Entry(frm, width=24)
+        self.ent_replace.grid(row=4, column=1, sticky="w", pady=2)
+        ttk.Label(frm, text="예) 이동 30 / -30, 시간 2h 30m", foreground="gray").grid(
+            row=5, column=0, columnspan=2, sticky="w", pady=(4, 0))
+
+        btn_frm = ttk.Frame(frm)
+        btn_frm.grid(row=6, column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(btn_frm, text="적용", command=self._confirm).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frm, text="취소", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        self.ent_shift.focus_set()
+
+    def _confirm(self):
+        shift_text = self.ent_shift.get().strip()
+        time_spent = self.ent_time.get().strip()
+        find = self.ent_find.get()
+        try:
+            shift_minutes = int(shift_text) if shift_text else None
+        except ValueError:
+            messagebox.showwarning("입력 확인", "Started 이동은 분 단위 정수로 입력해주세요. (예: 30, -30)", parent=self)
+            return
+        try:
+            # 셀 수정과 같이 h/m 형식으로 정리한 값을 보낸다 (예: 90m → 1h 30m, 1d → 8h)
+            if time_spent:
+                time_spent = Duration.parse(time_spent).format()
+        except ValueError as e:
+            messagebox.showwarning("입력 확인", str(e), parent=self)
+            return
+        if not (shift_minutes or time_spent or find):
+            messagebox.showwarning("입력 확인", "변경할 항목을 하나 이상 입력해주세요.", parent=self)
+            return
+        self.result = {
+            "shift_minutes": shift_minutes,
+            "time_spent": time_spent or None,
+            "find": find or None,
+            "replace": self.ent_replace.get(),
+        }
+        self.destroy()
+
+class TimesheetWindow(tk.Toplevel):
+    """
+    집계표 창: 인원 × 날짜 시간(주계/합계 포함)과 인원별 이슈 내역을 탭으로 보여주고 CSV로 저장한다.
+    sheet는 timesheet.Timesheet이며, 범위 밖 칸은 ▼(8시간 미만) / ▲(9시간 초과)로 표시한다.
+    """
+
+    def __init__(self, parent, sheet, date_from: str, date_to: str):
+        super().__init__(parent)
+        self.title(f"집계표 {date_from} ~ {date_to}")
+        self.geometry("1000x420")
+        self.minsize(600, 300)
+        self._sheet = sheet
+        self._file_stem = f"집계표_{date_from}_{date_to}"
+        self._build_ui()
+        self.bind("<Escape>", lambda event: self.destroy())
+
+    def _build_ui(self):
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        columns, rows = self._sheet.display_rows()
+        matrix = self._add_tree(notebook, "인원 × 날짜", ["Author"] + columns)
+        matrix.column("Author", width=80, anchor=tk.CENTER)
+        for col in columns:
+            weekly = col.startswith("주계") or col == "합계"
+            matrix.column(col, width=110 if weekly else 70, anchor=tk.CENTER)
+        matrix.tag_configure("out_of_band", foreground="red")
+        for name, cells, bad in rows:
+            matrix.insert("", tk.END, values=[name] + cells, tags=("out_of_band",) if bad else ())
+
+        issues = self._sheet.issues
+        tree = self._add_tree(notebook, "이슈별 내역", list(issues.columns))
+        tree.column("Summary", width=360, anchor=tk.W)
+        for author, key, summary, hours, share in issues.itertuples(index=False):
+            tree.insert("", tk.END, values=(author, key, summary, f"{hours:.2f}", f"{share:.1%}"))
+
+        frm = ttk.Frame(self, padding=(10, 0, 10, 10))
+        frm.pack(fill=tk.X)
+        ttk.Label(frm, text="▼ 8시간 미만  ▲ 9시간 초과 (기록 없는 주말은 빈칸)", foreground="gray").pack(side=tk.LEFT)
+        ttk.Button(frm, text="닫기", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(frm, text="이슈 내역 CSV 저장", command=self._save_issues).pack(side=tk.RIGHT, padx=(0, 8))
+        ttk.Button(frm, text="집계표 CSV 저장", command=self._save_table).pack(side=tk.RIGHT, padx=(0, 8))
+
+    @staticmethod
+    def _add_tree(notebook, title: str, columns: list):
+        frm = ttk.Frame(notebook)
+        notebook.add(frm, text=title)
+        tree = ttk.Treeview(frm, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=80, anchor=tk.CENTER, stretch=False)
+        vsb = ttk.Scrollbar(frm, orient="vertical", command=tree.yview)
+        hsb = ttk.Scrollbar(frm, orient="horizontal", command=tree.xview)
+        tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        frm.rowconfigure(0, weight=1)
+        frm.columnconfigure(0, weight=1)
+        return tree
+
+    def _save(self, write, initialfile: str):
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="CSV로 저장",
+            initialfile=initialfile,
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            write(path)
+            messagebox.showinfo("완료", "CSV 저장이 완료되었습니다.", parent=self)
+        except Exception as e:
+            messagebox.showerror("오류", f"CSV 저장 중 오류가 발생했습니다:\n{e}", parent=self)
+
+    def _save_table(self):
+        self._save(self._sheet.write_csv, f"{self._file_stem}.csv")
+
+    def _save_issues(self):
+        self._save(self._sheet.write_issues_csv, f"{self._file_stem}_이슈.csv")
+
 class EntryPopup(ttk.Entry):
     def __init__(self, parent, tree, iid, col_index, text, finish_edit_callback, **kw):
         super().__init__(parent, **kw)
@@ -493,6 +471,28 @@ class EntryPopup(ttk.Entry):
     def on_focus_out(self, event=None):
         self.destroy()
 
+ALL_MEMBERS_LABEL = "전체 인원"
+# 조회 결과가 이 행 수를 넘으면 보이는 행만 Treeview에 만드는 가상 표 모드로 표시한다
+VIRTUAL_TABLE_THRESHOLD = 2000
+# 일반 모드에서 한 번에 Treeview에 넣는 행 수 (나머지는 이벤트 루프에 양보하며 이어서 넣는다)
+TABLE_CHUNK_SIZE = 500
+# 조회 중 받은 행을 표에 반영하는 최소 간격(초). 첫 이슈의 결과는 바로 반영한다.
+STREAM_FLUSH_INTERVAL = 0.1
+# 조회 요청을 실제로 시작하기 전 기다리는 시간(ms). 그 사이에 다시 요청되면 마지막 요청만 실행한다.
+QUERY_DEBOUNCE_MS = 250
+# 미리 조회(prefetch): 조회가 끝나면 앞뒤 하루와 콤보박스의 다음 인원 결과를 백그라운드에서 받아 캐시해 둔다
+PREFETCH_ENABLED = True
+PREFETCH_NEXT_MEMBERS = 2
+PREFETCH_WORKERS = 2
+# 미리 조회 결과 캐시: 최대 행 수(메모리 한도)와 유효 시간(초). 일반 조회 결과는 넣지 않는다
+QUERY_CACHE_MAX_ROWS = 50000
+QUERY_CACHE_TTL = 300
+# 조회가 끝나면 결과에 나온 이슈의 상세 정보(더블클릭 팝업)를 미리 받아 둔다. 이보다 이슈가 많으면 앞쪽만 받는다
+ISSUE_INFO_PREFETCH_MAX = 500
+# 표에 이슈 정보 컬럼(Summary/Status/Project)을 처음부터 보여줄지 여부 (툴바의 '이슈 정보'로 켜고 끔)
+# 꺼 두면 CSV 저장도 이전과 같은 컬럼(DISPLAY_COLUMNS)만 쓴다
+SHOW_ISSUE_COLUMNS = False
+
 class JiraWorklogGUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -500,8 +500,40 @@ class JiraWorklogGUI(tk.Tk):
         self.geometry("1000x300")
         self.minsize(600, 300)
         self._worker = None
-        self._df_display = pd.DataFrame()
         self._entry_popup = None
+        self._store = None
+        self._query_range = (date.today().isoformat(), date.today().isoformat())
+        self._query_authors = []
+        self._rows = []
+        # 결과 표 상태: 가상 모드 여부, 가상 모드에서 맨 위에 보이는 행 번호, 선택된 행 번호(전체 결과 기준)
+        self._virtual = False
+        self._view_start = 0
+        self._selected_rows = set()
+        # Shift+방향키 범위 선택의 기준 행과, 그 기준이 유효한 포커스 행 (포커스가 다른 곳으로 옮겨지면 새로 잡는다)
+        self._select_anchor = (None, None)
+        # 다음 선택 변경이 Ctrl/Shift 없는 클릭·방향키에서 온 것인지 (그러면 화면 밖 선택도 지우고 새로 고른다)
+        self._select_replace = False
+        self._fill_gen = 0
+        self._inserted = 0
+        self._chunk_scheduled = False
+        self._querying = False
+        # 조회 스케줄러: 조회마다 세대 번호를 올리고, 이전 세대의 결과/오류는 무시한다
+        self._query_gen = 0
+        self._cancel_event = None
+        self._pending_query = None
+        self._cache = QueryCache(max_rows=QUERY_CACHE_MAX_ROWS, ttl=QUERY_CACHE_TTL)
+        self._prefetch_cancel = None
+        self._issue_info = IssueInfoCache()
+        self._index = WorklogIndex()
+        # 수정 큐: 보내지 못한 수정은 pending_edits.json에 남아 다음 실행 때 이어서 보낸다.
+        # 작업 스레드는 인증 정보를 읽고 메인 루프가 돈 뒤에 시작한다 (아래 self.after(0, ...start))
+        # worklogId → 수정이 진행 중인 worklog의 마지막으로 서버가 확인한 행 (반영에 실패하면 이 값으로 되돌린다)
+        self._edit_confirmed = {}
+        self._bulk_running = False
+        self._edit_queue = EditQueue(
+            self._send_edit, on_result=lambda edit, result, error: self.after(0, self._on_edit_result, edit, result, error),
+            start=False,
+        )
         self._api_token = read_text("jira_api_token.txt")
         self._user_email = "" 
         
@@ -513,6 +545,8 @@ class JiraWorklogGUI(tk.Tk):
 
         # Load members, if empty launch add_member.py
         self._check_and_load_members()
+        # 창이 그려진 뒤 HTTP 클라이언트 모듈을 미리 불러와 첫 조회가 느려지지 않게 한다
+        self.after(500, self._preload_client)
         
         # Check auth email again (user might have entered it in add_member.py)
         if not self._auth_email:
@@ -547,9 +581,23 @@ class JiraWorklogGUI(tk.Tk):
              self.cbo_users.current(0)
              self._on_user_select(None)
         
-        self.entry_date.config(state="normal")
-        self.entry_date.insert(0, date.today().isoformat())
-        self.entry_date.config(state="readonly")
+        self._set_date_entry(self.entry_date, date.today().isoformat())
+        self._set_date_entry(self.entry_date_to, date.today().isoformat())
+        # 지난 실행에서 보내지 못한 수정을 이어서 보낸다 (on_result의 after()는 메인 루프가 돌아야 동작)
+        self.after(0, self._edit_queue.start)
+
+    def _preload_client(self):
+        threading.Thread(target=self._run_preload_client, daemon=True).start()
+
+    def _run_preload_client(self):
+        import jira_client
+        if not (self._auth_email and getattr(self, "_api_token", "")):
+            return
+        try:
+            # 소요시간 변환(1d가 몇 시간인지, 단위 없는 숫자의 단위)에 쓰는 사이트 설정을 미리 읽어 둔다
+            get_time_tracking(jira_client.get_client(self._auth_email, self._api_token))
+        except Exception:
+            pass
 
     def _check_and_load_members(self):
         self._members = load_members("members.csv")
@@ -566,11 +614,24 @@ class JiraWorklogGUI(tk.Tk):
             if not self._members:
                 messagebox.showwarning("경고", "사용자가 등록되지 않았습니다. 프로그램 기능을 사용할 수 없습니다.")
 
+    def _user_values(self) -> list:
+        """대상자 콤보박스 항목. 두 명 이상이면 마지막에 '전체 인원' 항목을 둔다."""
+        values = [name for name, aid, email in self._members]
+        if len(self._members) > 1:
+            values.append(ALL_MEMBERS_LABEL)
+        return values
+
     def _on_user_select(self, event):
         idx = self.cbo_users.current()
         if idx >= 0 and idx < len(self._members):
             _, _, email = self._members[idx]
             self._user_email = email
+        self._requery_if_running()
+
+    def _requery_if_running(self):
+        """조회 중에 날짜/대상자를 바꾸면 진행 중인 조회를 취소하고 바뀐 조건으로 다시 조회한다."""
+        if self._querying:
+            self.on_query()
 
     def _build_top(self):
         frm = ttk.Frame(self, padding=(10, 10, 10, 5))
@@ -578,15 +639,19 @@ class JiraWorklogGUI(tk.Tk):
         self.btn_select_date = ttk.Button(frm, text="조회날짜", command=self.on_select_query_date)
         self.btn_select_date.pack(side=tk.LEFT)
         self.entry_date = ttk.Entry(frm, width=12, state="readonly")
-        self.entry_date.pack(side=tk.LEFT, padx=(6, 10))
+        self.entry_date.pack(side=tk.LEFT, padx=(6, 4))
+        # 종료날짜가 시작날짜와 같으면 하루 조회, 다르면 기간 조회
+        self.btn_select_date_to = ttk.Button(frm, text="~", width=3, command=self.on_select_query_date_to)
+        self.btn_select_date_to.pack(side=tk.LEFT)
+        self.entry_date_to = ttk.Entry(frm, width=12, state="readonly")
+        self.entry_date_to.pack(side=tk.LEFT, padx=(4, 10))
 
         # Email Input Removed
         
         ttk.Label(frm, text="대상자:").pack(side=tk.LEFT)
         self.cbo_users = ttk.Combobox(frm, width=15, state="readonly")
-        user_values = [name for name, aid, email in self._members]
-        self.cbo_users['values'] = user_values
-        if user_values:
+        self.cbo_users['values'] = self._user_values()
+        if self._members:
             self.cbo_users.current(0)
         self.cbo_users.pack(side=tk.LEFT, padx=(6, 10))
         self.cbo_users.bind("<<ComboboxSelected>>", self._on_user_select)
@@ -595,17 +660,29 @@ class JiraWorklogGUI(tk.Tk):
         self.btn_query.pack(side=tk.LEFT)
         self.btn_save_csv = ttk.Button(frm, text="CSV 저장", command=self.on_save_csv, state=tk.DISABLED)
         self.btn_save_csv.pack(side=tk.LEFT, padx=(10, 0))
+        self.btn_timesheet = ttk.Button(frm, text="집계표", command=self.on_timesheet, state=tk.DISABLED)
+        self.btn_timesheet.pack(side=tk.LEFT, padx=(10, 0))
+        self.btn_import_csv = ttk.Button(frm, text="CSV 가져오기", command=self.on_import_csv)
+        self.btn_import_csv.pack(side=tk.LEFT, padx=(10, 0))
         
+        self.btn_bulk_edit = ttk.Button(frm, text="선택 일괄 수정", command=self.on_bulk_edit)
+        self.btn_bulk_edit.pack(side=tk.LEFT, padx=(10, 0))
+
         self.btn_add_member = ttk.Button(frm, text="Add Member", command=self.on_add_member)
         self.btn_add_member.pack(side=tk.LEFT, padx=(10, 0))
 
+        self.var_issue_columns = tk.BooleanVar(value=SHOW_ISSUE_COLUMNS)
+        self.chk_issue_columns = ttk.Checkbutton(frm, text="이슈 정보", variable=self.var_issue_columns,
+                                                 command=self._apply_issue_columns)
+        self.chk_issue_columns.pack(side=tk.LEFT, padx=(10, 0))
+
         self.progress = ttk.Progressbar(frm, mode="indeterminate", length=180)
         self.progress.pack(side=tk.RIGHT)
 
     def _build_table(self):
         frm = ttk.Frame(self, padding=(10, 5, 10, 5))
         frm.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        cols = ("issueKey", "worklogId", "started", "timeSpent", "authorDisplayName", "commentText")
+        cols = tuple(DISPLAY_COLUMNS + ISSUE_COLUMNS)
         self.cols = cols
         self.tree = ttk.Treeview(frm, columns=cols, show="headings", height=6, selectmode="extended")
         self.tree.heading("issueKey", text="Issue Key")
@@ -620,28 +697,64 @@ class JiraWorklogGUI(tk.Tk):
         self.tree.column("timeSpent", width=70, anchor=tk.CENTER)
         self.tree.column("authorDisplayName", width=50, anchor=tk.CENTER)
         self.tree.column("commentText", width=360, anchor=tk.W)
-        vsb = ttk.Scrollbar(frm, orient="vertical", command=self.tree.yview)
+        self.tree.heading("issueSummary", text="Summary")
+        self.tree.heading("issueStatus", text="Status")
+        self.tree.heading("issueProject", text="Project")
+        self.tree.column("issueSummary", width=240, anchor=tk.W)
+        self.tree.column("issueStatus", width=70, anchor=tk.CENTER)
+        self.tree.column("issueProject", width=90, anchor=tk.CENTER)
+        self._apply_issue_columns()
+        # 세로 스크롤은 가상 표 모드에서 전체 결과 기준으로 움직이도록 직접 처리한다
+        self.vsb = ttk.Scrollbar(frm, orient="vertical", command=self._on_vscroll)
         hsb = ttk.Scrollbar(frm, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        self.tree.configure(yscroll=self._on_tree_yscroll, xscroll=hsb.set)
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self.vsb.grid(row=0, column=1, sticky="ns")
         hsb.grid(row=1, column=0, sticky="ew")
         frm.rowconfigure(0, weight=1)
         frm.columnconfigure(0, weight=1)
         self.tree.bind("<Double-1>", self._on_tree_double_click)
+        self.tree.bind("<ButtonPress-1>", self._on_tree_press)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", lambda e: self._render_window() if self._virtual else None)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_tree_mousewheel)
+        for seq in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.tree.bind(seq, self._on_tree_key)
         self.tree.tag_configure("duplicate", foreground="red")
+        try:
+            self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        except (TypeError, ValueError):
+            self._row_height = 20
+
+    def _apply_issue_columns(self):
+        """이슈 정보 컬럼(Summary/Status/Project) 표시 여부를 체크박스 값에 맞춘다."""
+        shown = DISPLAY_COLUMNS + (ISSUE_COLUMNS if self.var_issue_columns.get() else [])
+        self.tree.configure(displaycolumns=shown)
+
+    def _shown_columns(self) -> list:
+        return [col for col in self.tree.cget("displaycolumns") if col in self.cols] or list(self.cols)
 
     def _build_bottom(self):
         frm = ttk.Frame(self, padding=(10, 5, 10, 10))
         frm.pack(side=tk.BOTTOM, fill=tk.X)
         self.lbl_status = ttk.Label(frm, text="전체합계시간: 0.00 h", font=("Malgun Gothic", 16, "bold"), foreground="red")
         self.lbl_status.pack(side=tk.LEFT)
+        # 기간 조회 시 날짜별 합계 (한 주 7칸씩)
+        self.frm_daily = ttk.Frame(frm)
+        self.frm_daily.pack(side=tk.LEFT, padx=(12, 0))
         self.lbl_hint = ttk.Label(
             frm,
             text="* Issue Key 셀을 더블클릭하면 해당 이슈의 정보를 확인할 수 있습니다.\n* Started, TimeSpent, Comment 셀을 더블클릭후 수정하면 Jira에 바로 반영됩니다."
         )
         self.lbl_hint.pack(side=tk.RIGHT)
 
+    def _set_date_entry(self, entry, value: str):
+        entry.config(state="normal")
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+        entry.config(state="readonly")
+
     def on_select_query_date(self):
         current_date_str = self.entry_date.get().strip()
         try:
@@ -653,18 +766,40 @@ class JiraWorklogGUI(tk.Tk):
         self.wait_window(dp)
         if dp.result is not None:
             selected_str = dp.result.isoformat()
-            self.entry_date.config(state="normal")
-            self.entry_date.delete(0, tk.END)
-            self.entry_date.insert(0, selected_str)
-            self.entry_date.config(state="readonly")
+            # 하루 조회 중이었거나 종료날짜가 시작날짜보다 앞서면 종료날짜도 함께 이동
+            date_to_str = self.entry_date_to.get().strip()
+            if date_to_str == current_date_str or date_to_str < selected_str:
+                self._set_date_entry(self.entry_date_to, selected_str)
+            self._set_date_entry(self.entry_date, selected_str)
+            self._requery_if_running()
+
+    def on_select_query_date_to(self):
+        try:
+            initial_d = datetime.strptime(self.entry_date_to.get().strip(), "%Y-%m-%d").date()
+        except Exception:
+            initial_d = date.today()
+
+        dp = DatePickerDialog(self, initial_date=initial_d, title="조회 종료날짜 선택")
+        self.wait_window(dp)
+        if dp.result is not None:
+            selected_str = dp.result.isoformat()
+            if selected_str < self.entry_date.get().strip():
+                messagebox.showwarning("날짜 오류", "종료날짜는 시작날짜보다 빠를 수 없습니다.")
+                return
+            self._set_date_entry(self.entry_date_to, selected_str)
+            self._requery_if_running()
 
     def on_query(self):
-        if self._worker and self._worker.is_alive():
-            messagebox.showinfo("안내", "이미 조회 중입니다. 잠시만 기다려주세요.")
+        if self._bulk_running:
+            messagebox.showinfo("안내", "일괄 수정 중입니다. 잠시만 기다려주세요.")
             return
-        date_str = self.entry_date.get().strip()
+        date_from = self.entry_date.get().strip()
+        date_to = self.entry_date_to.get().strip() or date_from
         try:
-            validate_date_str(date_str)
+            validate_date_str(date_from)
+            validate_date_str(date_to)
+            if date_to < date_from:
+                raise ValueError("종료날짜는 시작날짜보다 빠를 수 없습니다.")
         except Exception as e:
             messagebox.showerror("날짜 오류", str(e))
             return
@@ -674,16 +809,61 @@ class JiraWorklogGUI(tk.Tk):
              messagebox.showwarning("입력 확인", "대상자를 선택해주세요.")
              return
              
-        name, target_account_id, target_user_email = self._members[selected_idx]
-        self._user_email = target_user_email
+        if selected_idx >= len(self._members):
+            # 전체 인원: members.csv의 모든 인원을 한 번에 조회
+            authors = [(aid, name) for name, aid, email in self._members]
+        else:
+            name, target_account_id, target_user_email = self._members[selected_idx]
+            self._user_email = target_user_email
+            authors = [(target_account_id, name)]
+
+        self._schedule_query(date_from, date_to, authors)
+
+    def _schedule_query(self, date_from: str, date_to: str, authors: list):
+        """
+        조회를 예약한다. 진행 중인 조회는 취소(더 이상 요청을 보내지 않음)하고,
+        QUERY_DEBOUNCE_MS 안에 다시 요청되면 앞의 요청은 실행하지 않고 마지막 요청만 실행한다.
+        """
+        self._query_gen += 1
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+        if self._pending_query is not None:
+            self.after_cancel(self._pending_query)
+            self._pending_query = None
+        # 실제 조회가 시작되면 미리 조회는 바로 멈춘다
+        self._stop_prefetch()
+        key = QueryCache.make_key(date_from, date_to, [aid for aid, _ in authors])
+        previous = QueryCache.make_key(*self._query_range, [aid for aid, _ in self._query_authors])
 
         self._lock_ui(True)
         self._clear_table()
+        self._rows = []
+        self._index = WorklogIndex()
         self.lbl_status.config(text="전체합계시간: 0.00 h", foreground="red")
-        
-        self._worker = threading.Thread(target=self._run_query_worker, args=(date_str, self._auth_email, target_account_id), daemon=True)
+        self._query_range = (date_from, date_to)
+        self._query_authors = authors
+        self._show_summary([])
+
+        # 미리 조회한 결과는 다른 날짜/인원으로 넘어갈 때 한 번만 쓴다.
+        # 보고 있던 조건을 다시 조회하면 Jira 웹이나 다른 사람이 바꾼 내용이 보이도록 항상 새로 받는다
+        cached = self._cache.take(key) if key != previous else None
+        if cached is not None:
+            self._update_result(cached)
+            self._schedule_prefetch(date_from, date_to, authors)
+            return
+        self._pending_query = self.after(QUERY_DEBOUNCE_MS, self._start_query,
+                                         self._query_gen, date_from, date_to, authors)
+
+    def _start_query(self, gen: int, date_from: str, date_to: str, authors: list):
+        self._pending_query = None
+        if gen != self._query_gen:
+            return
+        cancel = threading.Event()
+        self._cancel_event = cancel
+        self._worker = threading.Thread(target=self._run_query_worker,
+                                        args=(gen, cancel, date_from, date_to, self._auth_email, authors), daemon=True)
         self._worker.start()
-        self.progress.start(10)
 
     def on_add_member(self):
         try:
@@ -694,8 +874,7 @@ class JiraWorklogGUI(tk.Tk):
             self._members = load_members("members.csv")
             
             # Update Combobox
-            user_values = [name for name, aid, email in self._members]
-            self.cbo_users['values'] = user_values
+            self.cbo_users['values'] = self._user_values()
             
             # Retain selection if possible, or select first
             current_idx = self.cbo_users.current()
@@ -714,7 +893,7 @@ class JiraWorklogGUI(tk.Tk):
             messagebox.showerror("오류", f"사용자 추가 프로그램 실행 중 오류: {e}")
 
     def on_save_csv(self):
-        if self._df_display is None or self._df_display.empty:
+        if not self._rows:
             messagebox.showinfo("안내", "저장할 데이터가 없습니다.")
             return
         path = filedialog.asksaveasfilename(
@@ -725,119 +904,253 @@ class JiraWorklogGUI(tk.Tk):
         if not path:
             return
         try:
-            self._df_display.to_csv(path, index=False, encoding="utf-8-sig")
+            # 조회 결과 행을 그대로 한 행씩 기록 (DataFrame 복사본을 만들지 않음)
+            # 표에 보이는 컬럼 그대로 저장 (이슈 정보 컬럼을 켰으면 함께 저장)
+            with open_export(path, "csv") as out:
+                RowWriter(out, "csv", columns=self._shown_columns()).write_all(self._rows)
             messagebox.showinfo("완료", "CSV 저장이 완료되었습니다.")
         except Exception as e:
             messagebox.showerror("오류", f"CSV 저장 중 오류가 발생했습니다:\n{e}")
 
-    def _run_query_worker(self, date_str: str, auth_email: str, target_account_id: str = None):
+    def on_timesheet(self):
+        """현재 조회 결과(대상자, 기간)로 인원 × 날짜 집계표 창을 연다."""
+        if self._querying:
+            messagebox.showinfo("안내", "조회 중입니다. 잠시만 기다려주세요.")
+            return
+        date_from, date_to = self._query_range
+        args = (list(self._rows), list(self._query_authors), date_from, date_to)
+        self.btn_timesheet.config(state=tk.DISABLED)
+        threading.Thread(target=self._run_timesheet, args=args, daemon=True).start()
+
+    def _run_timesheet(self, rows: list, authors: list, date_from: str, date_to: str):
+        try:
+            # pandas는 집계표를 처음 열 때 불러온다 (시작 시간에 영향을 주지 않도록)
+            from timesheet import Timesheet
+            sheet = Timesheet.build(rows, authors, date_from, date_to)
+        except Exception as e:
+            self.after(0, self._on_timesheet_done, None, date_from, date_to, e)
+            return
+        self.after(0, self._on_timesheet_done, sheet, date_from, date_to, None)
+
+    def _on_timesheet_done(self, sheet, date_from: str, date_to: str, error):
+        if not self._querying:
+            self.btn_timesheet.config(state=tk.NORMAL)
+        if error is not None:
+            messagebox.showerror("집계표 오류", f"집계표를 만드는 중 오류가 발생했습니다:\n{error}")
+            return
+        TimesheetWindow(self, sheet, date_from, date_to)
+
+    def _run_query_worker(self, gen: int, cancel: threading.Event, date_from: str, date_to: str,
+                          auth_email: str, authors: list):
         try:
             api_token = read_text("jira_api_token.txt")
             # auth_email passed as arg (used for login)
             if not auth_email:
                  raise ValueError("인증용 이메일이 설정되지 않았습니다. (jira_api_email.txt)")
                  
-            sess = get_session(auth_email, api_token)
-            
-            my_account_id = get_current_account_id(sess)
+            from jira_client import get_client
+            sess = get_client(auth_email, api_token)
             # acountID.txt creation removed as per user request
+            # 시작할 때 시간 추적 설정을 읽지 못했으면 다시 읽는다 (읽어 둔 뒤에는 요청 없이 바로 반환)
+            get_time_tracking(sess)
 
-            
-            if not target_account_id:
-                # Should not happen with new logic, but fallback
-                target_account_id = my_account_id
-                jql_author = "currentUser()"
-            else:
-                jql_author = f"'{target_account_id}'"
-
-            jql = f"worklogAuthor = {jql_author} AND worklogDate = '{date_str}'"
-            issue_keys = enhanced_search_issue_keys(sess, jql=jql, fields=["key"], page_size=100)
-            if not issue_keys:
-                df_display = pd.DataFrame(columns=[
-                    "issueKey", "worklogId", "started", "timeSpent", "authorDisplayName", "commentText"
-                ])
-                total_hours = 0.0
-                self.after(0, self._update_result, df_display, total_hours)
-                return
-            rows = []
-            for key in issue_keys:
-                for wl in iter_issue_worklogs(sess, key, page_size=100):
-                    wl_author = wl.get("author", {}) or {}
-                    wl_account = wl_author.get("accountId", "")
-                    # 정확한 필터링: JQL로 1차 거르지만, worklogAuthor가 여러명일 수 있는 이슈 내에서
-                    # 해당 날짜/해당 작성자의 worklog만 추려야 함.
-                    if wl_account != target_account_id:
-                        continue
-                    started_raw = wl.get("started", "")
-                    if not started_raw:
-                        continue
-                    def parse_started_date(started_str):
-                        dt = datetime.strptime(started_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-                        return dt.date().isoformat()
-                    if parse_started_date(started_raw) != date_str:
-                        continue
-                    row = {
-                        "issueKey": key,
-                        "worklogId": wl.get("id"),
-                        "started": format_started_kor(started_raw),
-                        "timeSpent": wl.get("timeSpent"),
-                        "timeSpentSeconds": wl.get("timeSpentSeconds", 0) or 0,
-                        "authorDisplayName": wl_author.get("displayName", ""),
-                        "authorAccountId": wl_account,
-                        "updated": wl.get("updated", ""),
-                        "commentText": extract_comment_text(wl.get("comment")),
-                    }
+            store = self._get_store() if worklog_api.QUERY_ENGINE == "store" else None
+            account_ids = [aid for aid, _ in authors]
+            rows, batch = [], []
+            state = {"last_flush": 0.0, "progress": (0, None)}
+
+            def flush(force=False):
+                # 받은 행을 모아서 일정 간격으로 표에 넘긴다 (첫 결과는 바로)
+                now = time.monotonic()
+                if not force and now - state["last_flush"] < STREAM_FLUSH_INTERVAL:
+                    return
+                state["last_flush"] = now
+                done, total = state["progress"]
+                self.after(0, self._append_rows, gen, batch[:], done, total)
+                batch.clear()
+
+            def on_progress(done, total):
+                state["progress"] = (done, total)
+                flush(force=(done == 0 or done == total))
+
+            row_iter = iter_worklog_rows(sess, date_from, date_to, account_ids, store=store,
+                                         progress=on_progress, cancel=cancel)
+            try:
+                for row in row_iter:
+                    check_cancelled(cancel)
                     rows.append(row)
-            df = pd.DataFrame(rows, columns=[
-                "issueKey", "worklogId", "started", "timeSpent", "timeSpentSeconds",
-                "authorDisplayName", "authorAccountId", "updated", "commentText"
-            ])
-            df_display = df.drop(columns=["timeSpentSeconds", "authorAccountId", "updated"], errors="ignore")
-            if df.empty:
-                total_hours = 0.0
-            else:
-                total_seconds = int(df["timeSpentSeconds"].sum())
-                total_hours = total_seconds / 3600.0
-            self.after(0, self._update_result, df_display, total_hours)
+                    batch.append(row)
+                    flush()
+            finally:
+                # 취소되면 아직 시작하지 않은 이슈 조회도 취소된다
+                row_iter.close()
+            flush(force=True)
+            # 다 받은 뒤 인원 → 날짜 순으로 다시 정렬해서 표시
+            sort_worklog_rows(rows, account_ids, by_worklog_id=worklog_api.query_engine_for(date_from) == "bulk")
+            self.after(0, self._finish_query, gen, rows)
+        except QueryCancelled:
+            pass
         except Exception as e:
-            self.after(0, self._handle_error, e)
+            self.after(0, self._query_failed, gen, e)
 
-    def _update_result(self, df_display: pd.DataFrame, total_hours: float):
-        self._df_display = df_display
-        self._fill_table_from_df(df_display)
-        in_range = 8.0 - 0.001 <= total_hours <= 9.0 + 0.001
-        color = "black" if in_range else "red"
-        self.lbl_status.config(text=f"전체합계시간: {total_hours:.2f} h", foreground=color)
+    def _get_store(self) -> WorklogStore:
+        if self._store is None:
+            self._store = WorklogStore(WORKLOG_DB)
+        return self._store
+
+    def _finish_query(self, gen: int, rows: list):
+        # 더 새로운 조회가 시작되었으면 지난 조회 결과로 표를 덮어쓰지 않는다
+        if gen == self._query_gen:
+            self._cancel_event = None
+            self._update_result(rows)
+            date_from, date_to = self._query_range
+            self._schedule_prefetch(date_from, date_to, self._query_authors)
+
+    def _prefetch_targets(self, date_from: str, date_to: str, authors: list) -> list:
+        """
+        미리 조회할 (시작일, 종료일, 대상자) 목록: 같은 대상자의 앞뒤 하루, 같은 기간의 다음 인원들.
+        앞뒤 하루는 한 사람의 하루 조회일 때만 받는다. 기간/전체 인원 조회를 통째로 옮겨 받으면
+        팀 × 기간 조회를 두 번 더 보내는 셈이라 요청 제한에 걸리기 쉽다.
+        """
+        targets = []
+        if date_from == date_to and len(authors) == 1:
+            for delta in (-1, 1):
+                day = (date.fromisoformat(date_from) + timedelta(days=delta)).isoformat()
+                targets.append((day, day, authors))
+        idx = self.cbo_users.current()
+        if 0 <= idx < len(self._members):
+            for name, aid, email in self._members[idx + 1: idx + 1 + PREFETCH_NEXT_MEMBERS]:
+                targets.append((date_from, date_to, [(aid, name)]))
+        return [t for t in targets
+                if QueryCache.make_key(t[0], t[1], [aid for aid, _ in t[2]]) not in self._cache]
+
+    def _schedule_prefetch(self, date_from: str, date_to: str, authors: list):
+        # 로컬 저장소 조회는 이미 빠르고, 저장소를 두 스레드가 함께 동기화하지 않도록 미리 조회하지 않는다
+        if not PREFETCH_ENABLED or worklog_api.QUERY_ENGINE == "store" or not self._auth_email:
+            return
+        targets = self._prefetch_targets(date_from, date_to, authors)
+        if not targets:
+            return
+        self._stop_prefetch()
+        cancel = threading.Event()
+        self._prefetch_cancel = cancel
+        threading.Thread(target=self._run_prefetch, args=(cancel, targets, self._auth_email), daemon=True).start()
+
+    def _stop_prefetch(self):
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+    def _run_prefetch(self, cancel: threading.Event, targets: list, auth_email: str):
+        """백그라운드 미리 조회. 적은 스레드로 하나씩 조회하며, 실패는 무시하고 취소되면 바로 멈춘다."""
+        try:
+            from jira_client import get_client
+            sess = get_client(auth_email, self._api_token)
+            for date_from, date_to, authors in targets:
+                account_ids = [aid for aid, _ in authors]
+                key = QueryCache.make_key(date_from, date_to, account_ids)
+                if key in self._cache:
+                    continue
+                try:
+                    rows = query_worklog_rows(sess, date_from, date_to, account_ids,
+                                              max_workers=PREFETCH_WORKERS, cancel=cancel)
+                except QueryCancelled:
+                    return
+                except Exception:
+                    continue
+                if cancel.is_set():
+                    return
+                self._cache.put(key, rows)
+        except Exception:
+            pass
+
+    def _query_failed(self, gen: int, e: Exception):
+        if gen == self._query_gen:
+            self._cancel_event = None
+            self._handle_error(e)
+
+    def _append_rows(self, gen: int, batch: list, done: int, total):
+        """조회 중 받은 행을 표 끝에 붙이고, 합계와 진행률(완료 이슈 / 전체 이슈)을 갱신한다."""
+        if gen != self._query_gen or not self._querying:
+            return
+        self._show_progress(done, total)
+        if not batch:
+            return
+        start = len(self._rows)
+        self._rows.extend(batch)
+        for idx in range(start, len(self._rows)):
+            self._index.add(idx, self._rows[idx])
+        if not self._virtual and len(self._rows) > VIRTUAL_TABLE_THRESHOLD:
+            # 결과가 많아지면 조회 중에도 가상 표 모드로 전환한다
+            self._fill_gen += 1
+            self._chunk_scheduled = False
+            self.tree.delete(*self.tree.get_children())
+            self._virtual = True
+        if self._virtual:
+            self._render_window()
+        elif not self._chunk_scheduled:
+            self._insert_chunk(self._fill_gen)
+        self._update_total_hours()
+
+    def _show_progress(self, done: int, total):
+        if total is None:
+            return
+        if str(self.progress.cget("mode")) != "determinate":
+            self.progress.stop()
+            self.progress.config(mode="determinate")
+        self.progress.config(maximum=max(1, total), value=done)
+
+    def _update_result(self, rows: list):
+        self._rows = rows
+        self._index = WorklogIndex(rows)
+        self._fill_table(rows)
+        self._update_total_hours()
         self._lock_ui(False)
+        self._prefetch_issue_info(rows)
 
-    def _update_total_hours(self):
-        total_hours = 0.0
-        import re
-        all_items = self.tree.get_children()
-        for item in all_items:
-            vals = self.tree.item(item, "values")
-            if vals and len(vals) >= 4:
-                time_spent_str = vals[3]
-                tokens = re.findall(r'(\d+(?:\.\d+)?)\s*([wdhm])', time_spent_str.lower())
-                if tokens:
-                    for val_str, unit in tokens:
-                        val = float(val_str)
-                        if unit == 'w':
-                            total_hours += val * 40
-                        elif unit == 'd':
-                            total_hours += val * 8
-                        elif unit == 'h':
-                            total_hours += val
-                        elif unit == 'm':
-                            total_hours += val / 60.0
-                else:
-                    try:
-                        total_hours += float(time_spent_str)
-                    except ValueError:
-                        pass
-        in_range = 8.0 - 0.001 <= total_hours <= 9.0 + 0.001
+    def _prefetch_issue_info(self, rows: list):
+        """결과에 나온 이슈들의 상세 정보를 key in (...) 검색으로 한꺼번에 받아 둔다 (팝업이 바로 열리도록)."""
+        if not self._auth_email:
+            return
+        keys = [key for key in dict.fromkeys(row["issueKey"] for row in rows)
+                if self._issue_info.peek(key) is None][:ISSUE_INFO_PREFETCH_MAX]
+        if keys:
+            threading.Thread(target=self._run_issue_info_prefetch, args=(keys, self._auth_email), daemon=True).start()
+
+    def _run_issue_info_prefetch(self, keys: list, auth_email: str):
+        try:
+            from jira_client import get_client
+            sess = get_client(auth_email, self._api_token)
+            self._issue_info.get_many(sess, keys)
+        except Exception:
+            # 미리 받기에 실패해도 팝업을 열 때 이슈 하나만 다시 조회한다
+            pass
+
+    def _show_totals(self, total_hours: float, summary: list):
+        """
+        합계 표시. summary(날짜별 또는 인원별 항목)가 있으면 항목 중 하나라도
+        8~9시간을 벗어날 때 전체 합계를 빨간색으로 표시한다.
+        """
+        if summary:
+            in_range = all(ok for _, _, ok in summary)
+        else:
+            in_range = is_daily_hours_ok(total_hours)
         color = "black" if in_range else "red"
         self.lbl_status.config(text=f"전체합계시간: {total_hours:.2f} h", foreground=color)
+        self._show_summary(summary)
+
+    def _show_summary(self, summary: list):
+        for widget in self.frm_daily.winfo_children():
+            widget.destroy()
+        for i, (label, hours, ok) in enumerate(summary):
+            lbl = ttk.Label(self.frm_daily, text=f"{label} {hours:.2f}h", foreground="black" if ok else "red")
+            lbl.grid(row=i // 7, column=i % 7, padx=(0, 8), sticky="w")
+
+    def _update_total_hours(self):
+        # 합계는 색인(self._index)에 누적된 값을 사용하므로 행 수와 관계없이 바로 계산된다
+        date_from, date_to = self._query_range
+        self._show_totals(self._index.total_seconds / 3600.0,
+                          self._index.summary(self._query_authors, date_from, date_to))
 
     def _handle_error(self, e: Exception):
         self._lock_ui(False)
@@ -845,58 +1158,188 @@ class JiraWorklogGUI(tk.Tk):
 
     def _lock_ui(self, lock: bool):
         state = tk.DISABLED if lock else tk.NORMAL
-        self.btn_query.config(state=state)
+        # 조회 버튼은 조회 중에도 누를 수 있다 (진행 중인 조회를 취소하고 새로 조회)
         self.btn_save_csv.config(
-            state=state if (self._df_display is not None and not self._df_display.empty and not lock) else tk.DISABLED
+            state=state if (self._rows and not lock) else tk.DISABLED
         )
+        # 기록이 하나도 없어도 집계표(모두 0시간)는 의미가 있으므로 조회가 끝나면 켠다
+        self.btn_timesheet.config(state=state)
+        self._querying = lock
+        self.progress.stop()
+        # 전체 이슈 수를 알기 전까지는 움직이는 막대, 알고 나면 완료 이슈 / 전체 이슈 (_show_progress)
+        self.progress.config(mode="indeterminate", value=0)
         if lock:
             self.progress.start(10)
-        else:
-            self.progress.stop()
 
     def _clear_table(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # 진행 중인 나눠 넣기도 함께 중단한다
+        self._fill_gen += 1
+        self._inserted = 0
+        self._chunk_scheduled = False
+        self._virtual = False
+        self._view_start = 0
+        self._selected_rows = set()
+        self._select_anchor = (None, None)
+        self.tree.delete(*self.tree.get_children())
+        self.vsb.set(0.0, 1.0)
 
-    def _fill_table_from_df(self, df_display: pd.DataFrame):
+    def _fill_table(self, rows: list):
+        """
+        조회 결과를 표에 채운다. Treeview 항목의 iid는 self._rows의 행 번호이다.
+        행이 VIRTUAL_TABLE_THRESHOLD보다 많으면 보이는 행만 만드는 가상 표 모드로,
+        그 이하이면 TABLE_CHUNK_SIZE 행씩 나눠 넣어 넣는 동안에도 화면이 멈추지 않게 한다.
+        """
         self._clear_table()
-        if df_display is None or df_display.empty:
+        if not rows:
             self.btn_save_csv.config(state=tk.DISABLED)
             return
-        for _, row in df_display.iterrows():
-            values = (
-                row.get("issueKey", ""),
-                row.get("worklogId", ""),
-                row.get("started", ""),
-                row.get("timeSpent", ""),
-                row.get("authorDisplayName", ""),
-                row.get("commentText", ""),
-            )
-            self.tree.insert("", tk.END, values=values)
         self.btn_save_csv.config(state=tk.NORMAL)
-        self._update_duplicate_tags()
-
-    def _update_duplicate_tags(self):
-        all_items = self.tree.get_children()
-        started_values = []
-        item_started_map = {}
-        for item in all_items:
-            vals = self.tree.item(item, "values")
-            if vals and len(vals) >= 3:
-                started_val = vals[2]
-                started_values.append(started_val)
-                item_started_map[item] = started_val
-        
-        counts = {}
-        for val in started_values:
-            counts[val] = counts.get(val, 0) + 1
-        duplicate_started = {val for val, count in counts.items() if count > 1}
-        
-        for item, started_val in item_started_map.items():
-            if started_val in duplicate_started:
-                self.tree.item(item, tags=("duplicate",))
-            else:
-                self.tree.item(item, tags=())
+        if len(rows) > VIRTUAL_TABLE_THRESHOLD:
+            self._virtual = True
+            self._render_window()
+        else:
+            self._insert_chunk(self._fill_gen)
+
+    def _row_values(self, idx: int) -> tuple:
+        row = self._rows[idx]
+        return tuple(row.get(col, "") for col in self.cols)
+
+    def _row_tags(self, idx: int) -> tuple:
+        return ("duplicate",) if self._index.is_duplicate(self._rows[idx]) else ()
+
+    def _insert_chunk(self, gen: int):
+        """아직 표에 넣지 않은 행을 TABLE_CHUNK_SIZE 행씩 넣고, 남으면 이벤트 루프에 양보한 뒤 이어서 넣는다."""
+        if gen != self._fill_gen:
+            return
+        self._chunk_scheduled = False
+        start = self._inserted
+        end = min(start + TABLE_CHUNK_SIZE, len(self._rows))
+        for idx in range(start, end):
+            self.tree.insert("", tk.END, iid=str(idx), values=self._row_values(idx), tags=self._row_tags(idx))
+        self._inserted = end
+        if end < len(self._rows):
+            self._chunk_scheduled = True
+            self.after(1, self._insert_chunk, gen)
+
+    def _visible_row_count(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return int(self.tree.cget("height"))
+        # 헤더 한 줄을 뺀 나머지에 들어가는 행 수
+        return max(1, height // self._row_height - 1)
+
+    def _render_window(self):
+        """가상 표 모드: self._view_start부터 화면에 보이는 만큼의 행만 Treeview에 만든다."""
+        total = len(self._rows)
+        count = self._visible_row_count()
+        start = max(0, min(self._view_start, total - count))
+        end = min(total, start + count)
+        self._view_start = start
+        self.tree.delete(*self.tree.get_children())
+        for idx in range(start, end):
+            self.tree.insert("", tk.END, iid=str(idx), values=self._row_values(idx), tags=self._row_tags(idx))
+        # 다시 그리면서 하는 선택은 self._selected_rows를 그대로 옮기는 것이므로 화면 밖 선택을 지우지 않는다
+        self._select_replace = False
+        self.tree.selection_set([str(idx) for idx in range(start, end) if idx in self._selected_rows])
+        if total:
+            self.vsb.set(start / total, end / total)
+
+    def _scroll_to(self, start: int):
+        start = max(0, min(start, len(self._rows) - self._visible_row_count()))
+        if start == self._view_start:
+            return
+        if self._entry_popup:
+            self._entry_popup.destroy()
+            self._entry_popup = None
+        self._view_start = start
+        self._render_window()
+
+    def _on_vscroll(self, *args):
+        if not self._virtual:
+            self.tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._rows)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible_row_count() if args[2] == "pages" else 1)
+            self._scroll_to(self._view_start + step)
+
+    def _on_tree_yscroll(self, first, last):
+        if not self._virtual:
+            self.vsb.set(first, last)
+
+    def _on_tree_mousewheel(self, event):
+        if not self._virtual:
+            return None
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self._scroll_to(self._view_start + step)
+        return "break"
+
+    def _on_tree_key(self, event):
+        """
+        가상 표 모드에서 화면 끝을 넘어 위/아래로 이동하면 창을 한 줄(한 페이지)씩 옮긴다.
+        Shift를 누르고 있으면 기준 행부터 이동한 행까지로 선택을 넓힌다. (화면 밖의 행 포함)
+        """
+        if not self._virtual:
+            return None
+        focus = self.tree.focus()
+        idx = int(focus) if focus else self._view_start
+        count = self._visible_row_count()
+        step = {"Up": -1, "Down": 1, "Prior": -count, "Next": count}[event.keysym]
+        target = max(0, min(len(self._rows) - 1, idx + step))
+        extend = bool(event.state & 0x0001)  # Shift
+        if not extend and abs(step) == 1 and self._view_start <= target < self._view_start + count:
+            self._select_replace = True
+            return None  # 화면 안에서의 이동은 Treeview 기본 동작
+        if target < self._view_start:
+            self._view_start = target
+        elif target >= self._view_start + count:
+            self._view_start = target - count + 1
+        if extend:
+            anchor, anchor_focus = self._select_anchor
+            if anchor is None or anchor_focus != idx:
+                anchor = idx
+            self._select_anchor = (anchor, target)
+            self._selected_rows = set(range(min(anchor, target), max(anchor, target) + 1))
+        else:
+            self._selected_rows = {target}
+        self._render_window()
+        self.tree.focus(str(target))
+        return "break"
+
+    def _on_tree_press(self, event):
+        # Ctrl/Shift 클릭은 선택을 늘리거나 바꾸고, 그냥 클릭은 새로 고른다
+        self._select_replace = not event.state & 0x0005  # Shift | Control
+
+    def _on_tree_select(self, event=None):
+        if not self._virtual:
+            return
+        replace, self._select_replace = self._select_replace, False
+        if replace:
+            # Ctrl/Shift 없이 고르면 화면 밖에 남아 있던 선택도 함께 지운다
+            self._selected_rows = {int(item) for item in self.tree.selection()}
+            return
+        # 가상 표 모드의 Ctrl/Shift 선택: 화면 밖에 있는 행의 선택 상태는 그대로 두고, 보이는 행의 선택만 반영한다
+        visible = {int(item) for item in self.tree.get_children()}
+        self._selected_rows -= visible
+        self._selected_rows.update(int(item) for item in self.tree.selection())
+
+    def _selected_row_indices(self) -> list:
+        """선택된 행 번호(self._rows 기준) 목록. 가상 표 모드에서는 화면 밖의 선택도 포함한다."""
+        if self._virtual:
+            return sorted(self._selected_rows)
+        return sorted(int(item) for item in self.tree.selection())
+
+    def _retag_rows(self, indices):
+        """중복 표시가 바뀔 수 있는 행만 다시 칠한다 (화면에 없는 행은 그릴 때 반영된다)."""
+        for idx in indices:
+            if self.tree.exists(str(idx)):
+                self.tree.item(str(idx), tags=self._row_tags(idx))
 
     def _on_tree_double_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -906,13 +1349,17 @@ class JiraWorklogGUI(tk.Tk):
         col = self.tree.identify_column(event.x)
         if not rowid or not col or col == "#0":
             return
-        col_index = int(col[1:]) - 1
-        col_name = self.cols[col_index]
+        # 이슈 정보 컬럼을 숨기면 화면의 컬럼 순서(#N)와 values 순서가 다를 수 있어 컬럼 이름으로 찾는다
+        col_name = self.tree.column(col, "id")
+        col_index = self.cols.index(col_name)
         values = self.tree.item(rowid, "values")
         if col_name == "issueKey":  # 이슈 상세 팝업
             issue_key = values[col_index]
             self.show_issue_info_popup(issue_key)
             return
+        if self._querying or self._bulk_running:
+            # 조회가 끝나면 행 순서가 다시 정렬되므로 조회/일괄 수정 중에는 수정하지 않는다
+            return
         if col_name == "started":
             # Parse existing cell value for initial value
             initial_dt = None
@@ -944,8 +1391,8 @@ class JiraWorklogGUI(tk.Tk):
             new_dt = datetime(sel_date.year, sel_date.month, sel_date.day, sel_hour, sel_min)
             new_dt_tz = new_dt.astimezone()
             
-            display_val = format_started_kor(new_dt_tz.strftime("%Y-%m-%dT%H:%M:%S.000%z"))
-            raw_val = new_dt_tz.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+            display_val = format_started_dt(new_dt_tz)
+            raw_val = format_started_jira(new_dt_tz)
             
             self._on_edit_finish(display_val, rowid, col_index, raw_value=raw_val)
             return
@@ -964,112 +1411,306 @@ class JiraWorklogGUI(tk.Tk):
     def _on_edit_finish(self, new_value, rowid, col_index, raw_value=None):
         item_values = list(self.tree.item(rowid, "values"))
         colname = self.cols[col_index]
-        old_value = item_values[col_index]
-        item_values[col_index] = new_value
-        self.tree.item(rowid, values=item_values)
-        self._update_duplicate_tags()
         if colname == "timeSpent":
-            self._update_total_hours()
-        idx = list(self.tree.get_children()).index(rowid)
-        if self._df_display is not None and not self._df_display.empty:
+            # 분 단위로 맞춘 초 값이 기준이며, 보내고 표시하는 값은 그 값을 h/m로 다시 쓴 것 (예: 90m → 1h 30m)
             try:
-                self._df_display.at[self._df_display.index[idx], colname] = new_value
-            except Exception:
-                pass
+                duration = Duration.parse(new_value)
+            except ValueError as e:
+                self._entry_popup = None
+                messagebox.showwarning("입력 확인", str(e))
+                return
+            new_value = duration.format()
+        item_values[col_index] = new_value
+        self.tree.item(rowid, values=item_values)
+        idx = int(rowid)
+        old_row = dict(self._rows[idx]) if idx < len(self._rows) else None
+        if old_row is not None:
+            row = self._rows[idx]
+            row[colname] = new_value
+            if colname == "timeSpent":
+                row["timeSpentSeconds"] = duration.seconds
+            elif colname == "started":
+                # Started 표시값 "2026-06-04(목) 08:32"의 앞 10자리가 날짜
+                row["startedDate"] = new_value[:10]
+            self._retag_rows(self._index.replace(idx, old_row, row))
+            if colname in ("timeSpent", "started"):
+                self._update_total_hours()
+        # 캐시된(미리 조회한) 결과에 수정 전 값이 남지 않도록 비운다
+        self._cache.clear()
         issue_key = item_values[self.cols.index("issueKey")]
-        worklog_id = item_values[self.cols.index("worklogId")]
- 
-        def do_update():
-            try:
-                if colname == "timeSpent":
-                    update_worklog_remote(
-                        issue_key, worklog_id,
-                        time_spent=new_value,
-                        comment=None,
-                        started=None,
-                        api_token=self._api_token,
-                        user_email=self._auth_email
-                    )
-                elif colname == "commentText":
-                    update_worklog_remote(
-                        issue_key, worklog_id,
-                        time_spent=None,
-                        comment=new_value,
-                        started=None,
-                        api_token=self._api_token,
-                        user_email=self._auth_email
-                    )
-                elif colname == "started":
-                    started_val = raw_value
-                    if not started_val:
-                        try:
-                            # 2026-06-04(목) 08:32 -> ISO
-                            parts = new_value.split(")")
-                            date_part = parts[0].split("(")[0].strip()
-                            time_part = parts[1].strip()
-                            dt = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M")
-                            started_val = dt.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
-                        except Exception:
-                            started_val = datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
-                    update_worklog_remote(
-                        issue_key, worklog_id,
-                        time_spent=None,
-                        comment=None,
-                        started=started_val,
-                        api_token=self._api_token,
-                        user_email=self._auth_email
-                    )
-            except Exception as e:
-                # 오류 시 롤백
-                self.after(0, lambda: messagebox.showerror("Jira 업데이트 실패", f"Jira Worklog 반영 오류: {e}"))
-                item_values[col_index] = old_value
-                self.after(0, lambda: self.tree.item(rowid, values=item_values))
-                self.after(0, self._update_duplicate_tags)
-                if colname == "timeSpent":
-                    self.after(0, self._update_total_hours)
-                if self._df_display is not None and not self._df_display.empty:
-                    try:
-                        self._df_display.at[self._df_display.index[idx], colname] = old_value
-                    except Exception:
-                        pass
-        threading.Thread(target=do_update, daemon=True).start()
+        worklog_id = str(item_values[self.cols.index("worklogId")])
+        if old_row is not None and worklog_id not in self._edit_confirmed:
+            # 진행 중인 수정이 없으면 지금 행이 서버 값이다 (이어지는 수정은 성공 응답으로 갱신된다)
+            self._edit_confirmed[worklog_id] = old_row
+
+        if colname == "timeSpent":
+            changes = {"timeSpent": new_value}
+        elif colname == "commentText":
+            changes = {"comment": new_value}
+        else:
+            started_val = raw_value
+            if not started_val:
+                try:
+                    # 2026-06-04(목) 08:32 -> ISO
+                    parts = new_value.split(")")
+                    date_part = parts[0].split("(")[0].strip()
+                    time_part = parts[1].strip()
+                    dt = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M")
+                    started_val = format_started_jira(dt.astimezone())
+                except Exception:
+                    started_val = format_started_jira(datetime.now().astimezone())
+            changes = {"started": started_val}
+            if old_row is not None:
+                self._rows[idx]["startedRaw"] = started_val
+                self._rows[idx]["startedAt"] = parse_started(started_val)
+        # 수정 큐가 같은 worklog의 수정을 합쳐서 백그라운드로 보낸다 (결과는 _on_edit_result)
+        self._edit_queue.submit(issue_key, worklog_id, changes)
         self._entry_popup = None
 
-    def show_issue_info_popup(self, issue_key):
-        email_for_popup = self._user_email
+    def on_bulk_edit(self):
+        if self._querying or self._bulk_running:
+            messagebox.showinfo("안내", "조회 또는 일괄 수정이 끝난 뒤에 사용할 수 있습니다.")
+            return
+        indices = self._selected_row_indices()
+        if not indices:
+            messagebox.showinfo("안내", "수정할 행을 먼저 선택해주세요. (Shift/Ctrl로 여러 행 선택)")
+            return
+        dlg = BulkEditDialog(self, len(indices))
+        self.wait_window(dlg)
+        if dlg.result is None:
+            return
 
+        updates, skipped = [], 0
+        for idx in indices:
+            row = self._rows[idx]
+            if self._edit_queue.is_pending(row["worklogId"]):
+                # 아직 반영 중인 수정과 순서가 섞이지 않도록 건너뛴다
+                skipped += 1
+                continue
+            changes = bulk_edit_changes(row, **dlg.result)
+            if changes:
+                updates.append((row["issueKey"], str(row["worklogId"]), changes))
+        if not updates:
+            messagebox.showinfo("안내", "변경할 내용이 있는 행이 없습니다.")
+            return
+        if not messagebox.askyesno("일괄 수정", f"{len(updates)}건을 Jira에 반영합니다. 계속할까요?"):
+            return
 
-        def extract_adf_text_with_newline(adf) -> str:
-            """
-            Atlassian Document Format dict에서 순수 텍스트만 추출하고,
-            단락(문단, 헤딩, 리스트) 별로 줄바꿈을 삽입한다.
-            """
-            texts = []
-            def walk(node):
-                if isinstance(node, dict):
-                    ntype = node.get("type")
-                    # 텍스트 노드
-                    if ntype == "text" and "text" in node:
-                        texts.append(node["text"])
-                    # 줄바꿈이 들어가는 주요 블록
-                    elif ntype in ("paragraph", "heading", "listItem"):
-                        for key in ("content", "children"):
-                            if key in node and isinstance(node[key], list):
-                                for child in node[key]:
-                                    walk(child)
-                        texts.append("\n")
-                    # 일반 블록(리스트, 도큐먼트, etc)
-                    else:
-                        for key in ("content", "children"):
-                            if key in node and isinstance(node[key], list):
-                                for child in node[key]:
-                                    walk(child)
-                elif isinstance(node, list):
-                    for child in node:
-                        walk(child)
-            walk(adf)
-            # 줄바꿈 연속, 앞/뒤 공백 제거
-            return "\n".join(line.strip() for line in "".join(texts).splitlines() if line.strip())
+        self._bulk_running = True
+        self.btn_bulk_edit.config(state=tk.DISABLED)
+        self._show_progress(0, len(updates))
+        threading.Thread(target=self._run_bulk_edit, args=(updates, skipped), daemon=True).start()
+
+    def _run_bulk_edit(self, updates: list, skipped: int):
+        try:
+            from jira_client import get_client
+            sess = get_client(self._auth_email, self._api_token)
+            results = bulk_update_worklogs(
+                sess, updates, progress=lambda done, total: self.after(0, self._show_progress, done, total)
+            )
+        except Exception as e:
+            results = [(update, None, e) for update in updates]
+        self.after(0, self._on_bulk_done, results, skipped)
+
+    def _on_bulk_done(self, results: list, skipped: int):
+        self._bulk_running = False
+        self.btn_bulk_edit.config(state=tk.NORMAL)
+        if not self._querying:
+            self.progress.config(mode="indeterminate", value=0)
+
+        positions = {str(row["worklogId"]): idx for idx, row in enumerate(self._rows)}
+        failures = []
+        for (issue_key, worklog_id, _changes), result, error in results:
+            if error is not None:
+                failures.append(f"{issue_key} / {worklog_id}: {error}")
+                continue
+            if self._store is not None:
+                self._store.upsert(None, [result], issue_key_map={str(result.get("issueId")): issue_key})
+            idx = positions.get(worklog_id)
+            if idx is None:
+                continue
+            # 서버가 돌려준 worklog로 행을 바꾼다 (실패한 행은 그대로 유지)
+            current = self._rows[idx]
+            new_row = worklog_to_row(issue_key, result, {col: current.get(col, "") for col in ISSUE_COLUMNS})
+            self._rows[idx] = new_row
+            self._retag_rows(self._index.replace(idx, current, new_row))
+            if self.tree.exists(str(idx)):
+                self.tree.item(str(idx), values=self._row_values(idx))
+        self._cache.clear()
+        self._update_total_hours()
+
+        summary = f"성공 {len(results) - len(failures)}건, 실패 {len(failures)}건"
+        if skipped:
+            summary += f", 반영 대기 중이라 건너뜀 {skipped}건"
+        if failures:
+            detail = "\n".join(failures[:10]) + ("\n..." if len(failures) > 10 else "")
+            messagebox.showwarning("일괄 수정 결과", f"{summary}\n\n{detail}")
+        else:
+            messagebox.showinfo("일괄 수정 결과", summary)
+
+    def on_import_csv(self):
+        if self._querying or self._bulk_running:
+            messagebox.showinfo("안내", "조회 또는 일괄 작업이 끝난 뒤에 사용할 수 있습니다.")
+            return
+        path = filedialog.askopenfilename(
+            title="worklog CSV 가져오기",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            records = read_import_file(path)
+        except Exception as e:
+            messagebox.showerror("오류", f"CSV를 읽는 중 오류가 발생했습니다:\n{e}")
+            return
+        if not records:
+            messagebox.showinfo("안내", "가져올 행이 없습니다.")
+            return
+        self._bulk_running = True
+        self.btn_bulk_edit.config(state=tk.DISABLED)
+        self.btn_import_csv.config(state=tk.DISABLED)
+        self.progress.config(mode="indeterminate")
+        self.progress.start(10)
+        threading.Thread(target=self._run_import_plan, args=(records,), daemon=True).start()
+
+    def _run_import_plan(self, records: list):
+        try:
+            from jira_client import get_client
+            sess = get_client(self._auth_email, self._api_token)
+            items, out_of_band = plan_worklog_import(sess, records)
+        except Exception as e:
+            self.after(0, self._on_import_done, None, e)
+            return
+        self.after(0, self._on_import_planned, sess, items, out_of_band)
+
+    def _on_import_planned(self, sess, items: list, out_of_band: list):
+        self.progress.stop()
+        invalid = [f"{item['line']}행: {item['message']}" for item in items if item["status"] == "invalid"]
+        if invalid:
+            detail = "\n".join(invalid[:10]) + ("\n..." if len(invalid) > 10 else "")
+            self._on_import_done(None, ValueError(f"잘못된 행이 있어 가져오지 않았습니다.\n\n{detail}"))
+            return
+        new = sum(1 for item in items if item["status"] == "new")
+        exists = sum(1 for item in items if item["status"] == "exists")
+        duplicate = sum(1 for item in items if item["status"] == "duplicate")
+        if not new:
+            self._on_import_done(items, None)
+            return
+        message = f"{new}건을 Jira에 기록합니다."
+        skipped = [f"이미 기록된 {exists}건"] if exists else []
+        if duplicate:
+            skipped.append(f"파일 안에서 중복된 {duplicate}건")
+        if skipped:
+            message += f" ({', '.join(skipped)}은 건너뜀)"
+        if out_of_band:
+            days = "\n".join(f"{day}: {hours:.2f}h" for day, hours in out_of_band)
+            message += f"\n\n기록 후 하루 합계가 8~9시간을 벗어나는 날짜가 있습니다.\n{days}"
+        if not messagebox.askyesno("CSV 가져오기", f"{message}\n\n계속할까요?"):
+            self._on_import_done(None, None)
+            return
+        self._show_progress(0, new)
+        threading.Thread(target=self._run_import_create, args=(sess, items), daemon=True).start()
+
+    def _run_import_create(self, sess, items: list):
+        try:
+            create_planned_worklogs(
+                sess, items, progress=lambda done, total: self.after(0, self._show_progress, done, total)
+            )
+        except Exception as e:
+            self.after(0, self._on_import_done, None, e)
+            return
+        self.after(0, self._on_import_done, items, None)
+
+    def _on_import_done(self, items, error):
+        self._bulk_running = False
+        self.btn_bulk_edit.config(state=tk.NORMAL)
+        self.btn_import_csv.config(state=tk.NORMAL)
+        self.progress.stop()
+        if not self._querying:
+            self.progress.config(mode="indeterminate", value=0)
+        if error is not None:
+            messagebox.showerror("CSV 가져오기", str(error))
+            return
+        if items is None:
+            return
+
+        failures = []
+        for item in items:
+            if item["status"] == "created" and self._store is not None:
+                result = item["worklog"]
+                self._store.upsert(None, [result], issue_key_map={str(result.get("issueId")): item["issueKey"]})
+            elif item["status"] == "failed":
+                failures.append(f"{item['line']}행 {item['issueKey']}: {item['message']}")
+        self._cache.clear()
+
+        created = sum(1 for item in items if item["status"] == "created")
+        exists = sum(1 for item in items if item["status"] == "exists")
+        duplicate = sum(1 for item in items if item["status"] == "duplicate")
+        summary = f"기록 {created}건, 이미 있어 건너뜀 {exists}건, 파일 내 중복 {duplicate}건, 실패 {len(failures)}건"
+        if created:
+            summary += "\n\n조회를 다시 하면 새로 기록한 worklog가 표시됩니다."
+        if failures:
+            detail = "\n".join(failures[:10]) + ("\n..." if len(failures) > 10 else "")
+            messagebox.showwarning("CSV 가져오기 결과", f"{summary}\n\n{detail}")
+        else:
+            messagebox.showinfo("CSV 가져오기 결과", summary)
+
+    def _send_edit(self, issue_key: str, worklog_id: str, changes: dict) -> dict:
+        """
+        수정 큐의 작업 스레드에서 호출된다. 합쳐진 수정을 한 번의 PUT으로 보낸다.
+        인증 정보가 아직 없으면 EditNotReady로 미뤄서, 수정을 버리지 않고 나중에 다시 보낸다.
+        재시도는 수정 큐의 백오프가 맡으므로 전송 계층의 재시도는 끈다 (retries=0).
+        """
+        if not (getattr(self, "_auth_email", "") and getattr(self, "_api_token", "")):
+            raise EditNotReady("인증 정보(jira_api_email.txt / jira_api_token.txt)가 아직 설정되지 않았습니다.")
+        return update_worklog_remote(
+            issue_key, worklog_id,
+            time_spent=changes.get("timeSpent"),
+            comment=changes.get("comment"),
+            started=changes.get("started"),
+            api_token=self._api_token,
+            user_email=self._auth_email,
+            retries=0,
+        )
+
+    def _on_edit_result(self, edit: dict, result, error):
+        worklog_id = edit["worklogId"]
+        pending = self._edit_queue.is_pending(worklog_id)
+        if error is None:
+            if result and self._store is not None:
+                # 로컬 저장소도 즉시 갱신 (다음 동기화를 기다리지 않음)
+                self._store.upsert(None, [result], issue_key_map={str(result.get("issueId")): edit["issueKey"]})
+            confirmed = self._edit_confirmed.pop(worklog_id, None)
+            if result and confirmed is not None:
+                confirmed = worklog_to_row(edit["issueKey"], result, {col: confirmed.get(col, "") for col in ISSUE_COLUMNS})
+                if pending:
+                    # 뒤이은 수정이 실패하면 서버가 확인한 이 값으로 되돌린다
+                    self._edit_confirmed[worklog_id] = confirmed
+                else:
+                    # 더 보낼 수정이 없으면 서버가 돌려준 값으로 행을 맞춘다 (앞선 수정이 실패해 되돌린 경우 포함)
+                    self._restore_row(confirmed)
+            return
+        # 오류 시 서버가 마지막으로 확인한 값으로 되돌린다.
+        # 뒤이은 수정이 아직 남아 있으면 그 결과도 이 값을 기준으로 반영되도록 기록을 남겨 둔다
+        messagebox.showerror("Jira 업데이트 실패", f"Jira Worklog 반영 오류: {error}")
+        confirmed = self._edit_confirmed.get(worklog_id) if pending else self._edit_confirmed.pop(worklog_id, None)
+        if confirmed is not None:
+            self._restore_row(confirmed)
+
+    def _restore_row(self, row: dict):
+        """같은 worklogId의 행을 row로 바꾼다 (표에 없으면 아무것도 하지 않음)."""
+        for idx, current in enumerate(self._rows):
+            if current.get("worklogId") == row.get("worklogId"):
+                self._rows[idx] = dict(row)
+                self._retag_rows(self._index.replace(idx, current, self._rows[idx]))
+                if self.tree.exists(str(idx)):
+                    self.tree.item(str(idx), values=self._row_values(idx))
+                self._update_total_hours()
+                self._cache.clear()
+                return
+
+    def show_issue_info_popup(self, issue_key):
+        email_for_popup = self._user_email
 
         def worker():
             try:
@@ -1078,8 +1719,10 @@ class JiraWorklogGUI(tk.Tk):
                 # However, this worker is short lived.
                 # Better to use self._user_email assuming query was run or user entered it.
                 # For safety, let's capture it in show_issue_info_popup scope
-                sess = get_session(self._auth_email, self._api_token)
-                info = fetch_issue_info_enhanced(sess, issue_key)
+                from jira_client import get_client
+                sess = get_client(self._auth_email, self._api_token)
+                # 캐시에 있으면 요청 없이, 같은 이슈를 조회 중이면 그 결과를 기다려서 사용한다
+                info = self._issue_info.get(sess, issue_key)
                 fields = []
                 if info:
                     project = (info.get("project", "")).get("name", "")
@@ -1094,7 +1737,7 @@ class JiraWorklogGUI(tk.Tk):
                                 if info.get("reporter") else "")
                     startdate = "Not Known" #info[0]["fields"].get("customfield_10429") if issues else None
                     duedate = info.get("duedate", "")
-                    description = extract_adf_text_with_newline(info.get("description", ""))
+                    description = adf_to_text(info.get("description"), "block")
                     fields = [
                         f"# Project: {project}",
                         f"",
@@ -1132,7 +1775,17 @@ class JiraWorklogGUI(tk.Tk):
         btn = ttk.Button(win, text="닫기", command=win.destroy)
         btn.pack(pady=(0, 10))
 
+# 시작 시간 측정 모드 (bench/startup.py). 창을 처음 그린 직후 import/창 표시 시간(ms)을 출력하고 종료한다.
+STARTUP_PROBE_ENV = "JIRA_WORKLOG_STARTUP_PROBE"
+
 if __name__ == "__main__":
+    import_ms = (time.perf_counter() - _STARTUP_T0) * 1000
     app = JiraWorklogGUI()
     app.iconbitmap('robot_1211_V01.ico')
+    if os.environ.get(STARTUP_PROBE_ENV):
+        app.update()
+        window_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+        print(f"startup_probe import_ms={import_ms:.1f} window_ms={window_ms:.1f}", flush=True)
+        app.destroy()
+        sys.exit(0)
     app.mainloop()
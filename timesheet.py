@@ -0,0 +1,199 @@
+"""
+timesheet.py
+조회 결과 행으로 인원 × 날짜 근무시간 표(타임시트)를 만드는 집계 엔진 (월간/연간 근무시간 점검용).
+
+- 행을 타입이 정해진 컬럼(인원/날짜/이슈는 범주형, 작업 시간은 int64 초)의 DataFrame으로 한 번 바꾼 뒤
+  groupby / unstack으로 한꺼번에 집계한다. 인원·날짜마다 도는 Python 반복은 없다.
+- 날짜별 칸마다 8~9시간 기준 판정(flags), 주별 소계(weekly), 인원별 이슈 내역(issues)을 함께 만든다.
+  판정 규칙은 worklog_api.daily_totals와 같다. (기록이 없는 평일은 0시간, 주말은 기록이 있을 때만 판정)
+- 시간은 정수 초로 합친 뒤 표시할 때만 시간으로 나눈다.
+
+pandas는 불러오는 데 시간이 걸리므로 GUI/CLI는 집계표가 필요할 때만 이 모듈을 import한다.
+"""
+
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+from worklog_api import (
+    DAILY_HOURS_MAX, DAILY_HOURS_MIN, DAILY_HOURS_TOLERANCE, iter_dates, open_export, validate_date_str,
+)
+
+# 칸별 판정: 범위 안 / 8시간 미만 / 9시간 초과 / 판정하지 않음(기록 없는 주말)
+FLAG_OK, FLAG_UNDER, FLAG_OVER, FLAG_NONE = "ok", "under", "over", ""
+# 화면 표에서 범위 밖 칸 뒤에 붙이는 표시
+FLAG_MARKS = {FLAG_UNDER: "▼", FLAG_OVER: "▲"}
+ISSUE_BREAKDOWN_COLUMNS = ["Author", "Issue Key", "Summary", "Hours", "Share"]
+
+_FRAME_FIELDS = itemgetter("authorAccountId", "startedDate", "issueKey", "issueSummary", "timeSpentSeconds")
+_WEEKDAYS = np.array(["월", "화", "수", "목", "금", "토", "일"])
+
+
+def rows_frame(rows, authors: list, date_from: str, date_to: str) -> pd.DataFrame:
+    """
+    조회 결과 행을 집계용 DataFrame(author, day, issueKey, summary, seconds)으로 바꾼다.
+    author/day는 대상자 순서와 조회 기간 날짜를 범주로 가지므로, 범위 밖 행은 NaN이 되어 집계에서 빠진다.
+    """
+    columns = tuple(zip(*map(_FRAME_FIELDS, rows))) or ((),) * 5
+    aids, days, keys, summaries, seconds = columns
+    return pd.DataFrame({
+        "author": pd.Categorical(aids, categories=list(dict.fromkeys(aid for aid, _ in authors))),
+        "day": pd.Categorical(days, categories=list(iter_dates(date_from, date_to))),
+        "issueKey": pd.Categorical(keys),
+        "summary": pd.Categorical(summaries),
+        "seconds": pd.to_numeric(pd.Series(seconds, dtype=object)).fillna(0).astype("int64"),
+    })
+
+
+class Timesheet:
+    """
+    인원 × 날짜 근무시간 표. build()로 만든다.
+
+    - seconds: 인원(accountId) × 날짜(DatetimeIndex) 작업 시간(초, int64). 기록이 없으면 0
+    - flags: seconds와 같은 모양의 칸별 판정 (FLAG_OK / FLAG_UNDER / FLAG_OVER / FLAG_NONE)
+    - weekly: 인원 × 주(월요일 날짜) 소계(초)
+    - issues: 인원별 이슈 내역 (ISSUE_BREAKDOWN_COLUMNS, 인원 순서 → 시간 많은 순)
+    """
+
+    def __init__(self, authors: list, seconds: pd.DataFrame, counts: pd.DataFrame, issues: pd.DataFrame):
+        self.authors = authors
+        self.names = dict(authors)
+        self.seconds = seconds
+        self.days = seconds.columns
+        hours = seconds.to_numpy() / 3600.0
+        # 기록이 없는 평일은 0시간으로 판정하고, 주말은 기록이 있을 때만 판정한다
+        judged = (self.days.weekday < 5)[None, :] | (counts.to_numpy() > 0)
+        self.flags = pd.DataFrame(
+            np.select(
+                [~judged, hours < DAILY_HOURS_MIN - DAILY_HOURS_TOLERANCE,
+                 hours > DAILY_HOURS_MAX + DAILY_HOURS_TOLERANCE],
+                [FLAG_NONE, FLAG_UNDER, FLAG_OVER], FLAG_OK,
+            ),
+            index=seconds.index, columns=self.days,
+        )
+        self.week_starts = self.days - pd.to_timedelta(self.days.weekday, unit="D")
+        self.weekly = seconds.T.groupby(self.week_starts).sum().T
+        self.issues = issues
+
+    @classmethod
+    def build(cls, rows, authors: list, date_from: str, date_to: str) -> "Timesheet":
+        """조회 결과 행(rows)과 대상자 [(accountId, 이름)]로 date_from ~ date_to 기간의 표를 만든다."""
+        validate_date_str(date_from)
+        validate_date_str(date_to)
+        if date_to < date_from:
+            raise ValueError("종료일은 시작일보다 빠를 수 없습니다.")
+        frame = rows_frame(rows, authors, date_from, date_to)
+
+        # 범주형 두 컬럼을 observed=False로 묶으면 기록이 없는 인원/날짜까지 빠짐없는 격자가 된다
+        grouped = frame.groupby(["author", "day"], observed=False)["seconds"]
+        # 대상자가 없으면 unstack 결과에 날짜 컬럼도 없으므로 조회 기간 날짜로 다시 맞춘다 (빈 표)
+        days = frame["day"].cat.categories
+        seconds = grouped.sum().unstack("day").reindex(columns=days, fill_value=0)
+        counts = grouped.size().unstack("day").reindex(columns=days, fill_value=0)
+        days = pd.to_datetime(seconds.columns.astype(str), format="%Y-%m-%d")
+        seconds.columns = counts.columns = days
+        seconds.columns.name = counts.columns.name = None
+        return cls(authors, seconds.astype("int64"), counts, cls._issue_breakdown(frame, dict(authors)))
+
+    @staticmethod
+    def _issue_breakdown(frame: pd.DataFrame, names: dict) -> pd.DataFrame:
+        frame = frame.dropna(subset=["author", "day"])
+        by_issue = frame.groupby(["author", "issueKey"], observed=True)["seconds"].sum().reset_index()
+        summaries = frame.groupby("issueKey", observed=True)["summary"].first()
+        member_total = by_issue.groupby("author", observed=True)["seconds"].transform("sum")
+        by_issue["share"] = (by_issue["seconds"] / member_total.where(member_total > 0)).fillna(0.0)
+        # 인원은 대상자 순서(범주 순서), 인원 안에서는 시간이 많은 이슈부터
+        by_issue = by_issue.sort_values(["author", "seconds"], ascending=[True, False], kind="stable")
+        return pd.DataFrame({
+            "Author": by_issue["author"].map(names).astype(str).to_numpy(),
+            "Issue Key": by_issue["issueKey"].astype(str).to_numpy(),
+            "Summary": by_issue["issueKey"].map(summaries).astype(object).fillna("").to_numpy(),
+            "Hours": (by_issue["seconds"] / 3600.0).round(2).to_numpy(),
+            "Share": by_issue["share"].round(3).to_numpy(),
+        }, columns=ISSUE_BREAKDOWN_COLUMNS)
+
+    @property
+    def hours(self) -> pd.DataFrame:
+        return self.seconds / 3600.0
+
+    def total_seconds(self) -> pd.Series:
+        return self.seconds.sum(axis=1)
+
+    def out_of_band_days(self) -> pd.Series:
+        """인원별 8~9시간 범위를 벗어난 날 수."""
+        return self.flags.isin((FLAG_UNDER, FLAG_OVER)).sum(axis=1)
+
+    def out_of_band(self) -> list:
+        """8~9시간 범위를 벗어난 (이름, 날짜, 시간) 목록. 인원 순서 → 날짜 순이다."""
+        flags = self.flags.to_numpy()
+        members, days = np.nonzero((flags == FLAG_UNDER) | (flags == FLAG_OVER))
+        hours = self.seconds.to_numpy()[members, days] / 3600.0
+        names = [self.names.get(aid, aid) for aid in self.seconds.index]
+        day_strs = self.days.strftime("%Y-%m-%d")
+        return [(names[m], day_strs[d], h) for m, d, h in zip(members, days, hours.tolist())]
+
+    def _column_layout(self) -> tuple:
+        """
+        표 컬럼 순서. 주마다 날짜 컬럼 뒤에 주계 컬럼을 둔다.
+        (컬럼 이름 목록, 각 컬럼이 [날짜별 값 | 주별 소계]를 이어 붙인 배열에서 가져올 위치)
+        """
+        # 기간이 해를 넘기면 같은 월-일이 두 번 나오므로 연도까지 표시한다
+        fmt = "%m-%d" if self.days[0].year == self.days[-1].year else "%Y-%m-%d"
+        day_labels = self.days.strftime(fmt) + "(" + _WEEKDAYS[self.days.weekday] + ")"
+        week_no = pd.Index(self.weekly.columns).get_indexer(self.week_starts)
+        last_day = pd.Series(self.days).groupby(week_no).max().dt.strftime(fmt).tolist()
+        first_day = pd.Series(self.days).groupby(week_no).min().dt.strftime(fmt).tolist()
+        names, positions = [], []
+        for i, label in enumerate(day_labels):
+            names.append(label)
+            positions.append(i)
+            if i == len(day_labels) - 1 or week_no[i + 1] != week_no[i]:
+                w = week_no[i]
+                names.append(f"주계 {first_day[w]}~{last_day[w]}")
+                positions.append(len(day_labels) + w)
+        return names, np.array(positions, dtype=np.int64)
+
+    def table(self) -> pd.DataFrame:
+        """
+        내보내기용 표: 인원별 한 행, 날짜별 시간(소수 둘째 자리) 사이사이에 주계,
+        마지막에 합계와 범위 밖 일수 컬럼.
+        """
+        names, take = self._column_layout()
+        hours = np.concatenate([self.seconds.to_numpy(), self.weekly.to_numpy()], axis=1) / 3600.0
+        table = pd.DataFrame(hours[:, take].round(2), columns=names)
+        table.insert(0, "Author", [self.names.get(aid, aid) for aid in self.seconds.index])
+        table["합계"] = (self.total_seconds().to_numpy() / 3600.0).round(2)
+        table["범위 밖 일수"] = self.out_of_band_days().to_numpy()
+        return table
+
+    def display_rows(self) -> tuple:
+        """
+        화면 표용 (컬럼 이름 목록, [(이름, 칸 문자열 목록, 범위 밖 여부)]).
+        범위 밖 칸에는 FLAG_MARKS 표시를 붙이고, 판정하지 않는 빈 주말 칸은 비워 둔다.
+        """
+        names, take = self._column_layout()
+        flags = self.flags.to_numpy()
+        day_text = np.char.mod("%.2f", self.seconds.to_numpy() / 3600.0).astype(object)
+        day_text = day_text + np.select([flags == FLAG_UNDER, flags == FLAG_OVER],
+                                        [FLAG_MARKS[FLAG_UNDER], FLAG_MARKS[FLAG_OVER]], "").astype(object)
+        day_text[flags == FLAG_NONE] = ""
+        week_text = np.char.mod("%.2f", self.weekly.to_numpy() / 3600.0).astype(object)
+        cells = np.concatenate([day_text, week_text], axis=1)[:, take]
+        totals = np.char.mod("%.2f", self.total_seconds().to_numpy() / 3600.0).tolist()
+        bad = self.out_of_band_days().to_numpy()
+        rows = [
+            (self.names.get(aid, aid), cells[i].tolist() + [totals[i]], bool(bad[i]))
+            for i, aid in enumerate(self.seconds.index)
+        ]
+        return names + ["합계"], rows
+
+    def write_csv(self, path: str):
+        """인원 × 날짜 표(table)를 CSV로 저장한다. (Excel용 utf-8-sig)"""
+        with open_export(path, "csv") as out:
+            self.table().to_csv(out, index=False)
+
+    def write_issues_csv(self, path: str):
+        """인원별 이슈 내역(issues)을 CSV로 저장한다."""
+        with open_export(path, "csv") as out:
+            self.issues.to_csv(out, index=False)
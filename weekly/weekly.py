@@ -6,6 +6,7 @@ main.py와 동일한 인증 방식(jira_api_token.txt / jira_api_email.txt) 사
 
 import re
 import subprocess
+import sys
 import threading
 from pathlib import Path
 
@@ -20,6 +21,11 @@ _HERE = Path(__file__).resolve().parent
 _ROOT = _HERE.parent
 OUTPUT_DIR = _HERE / "output"
 
+# 프로젝트 루트의 공용 전송 계층(요청 제한 재시도/동시성 제어) 사용
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+from jira_transport import TransportSession
+
 CONFLUENCE_BASE = "https://higen-rnd.atlassian.net/wiki/rest/api/"
 
 # ─── 공통 유틸 ────────────────────────────────────────────────────────────────
@@ -31,7 +37,7 @@ def read_text(path: Path) -> str:
 
 
 def get_session(user_email: str, api_token: str) -> requests.Session:
-    s = requests.Session()
+    s = TransportSession()
     s.auth = HTTPBasicAuth(user_email, api_token)
     s.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
     return s
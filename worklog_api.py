@@ -0,0 +1,1411 @@
+"""
+worklog_api.py
+Jira worklog 조회/수정 API와 조회 결과 행 모델.
+tkinter/pandas에 의존하지 않으므로 GUI(main.py)와 CLI(worklog_cli.py)가 함께 사용한다.
+requests는 jira_client를 통해 실제로 Jira를 호출할 때 불러오므로, 이 모듈만 import할 때는 가볍다.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import csv
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from adf_text import adf_to_text
+
+if TYPE_CHECKING:
+    import requests
+
+BASE_URL = "https://higen-rnd.atlassian.net/rest/api/3/"
+# 이슈별 worklog 동시 조회 스레드 수 (세션 커넥션 풀 크기도 이 값에 맞춘다)
+FETCH_WORKERS = 8
+# worklog 조회 방식: "search" = JQL 검색 후 이슈별 worklog 조회, "bulk" = worklog/updated + worklog/list 일괄 조회,
+# "store" = 로컬 저장소(worklogs.db)를 변경분만 동기화한 뒤 로컬에서 조회
+QUERY_ENGINE = "search"
+# bulk 조회 시 조회일 이전 며칠 동안 수정된 worklog까지 살펴볼지 (미리 기록해 둔 worklog 대비).
+# 시작일이 오늘 기준 이보다 오래된 기간은 search로 조회한다 (query_engine_for)
+BULK_LOOKBACK_DAYS = 7
+# worklog/list 한 번에 요청할 수 있는 최대 worklog ID 개수
+WORKLOG_LIST_CHUNK = 1000
+# 로컬 worklog 저장소(SQLite) 파일과 최초 동기화 범위(일)
+WORKLOG_DB = "worklogs.db"
+STORE_INITIAL_SYNC_DAYS = 90
+
+def read_text(path: str) -> str:
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"파일이 없습니다: {path}")
+    return p.read_text(encoding="utf-8").strip()
+
+def load_members(path: str) -> list:
+    """
+    members.csv 파일을 읽어서 (이름, accountId, email) 튜플 리스트를 반환한다.
+    파일 형식: 이름,accountId,email
+    """
+    p = Path(path)
+    members = []
+    if not p.exists():
+        return members
+    
+    try:
+        lines = p.read_text(encoding="utf-8").splitlines()
+        # 헤더(첫번째 행) 건너뛰기
+        if lines:
+            lines = lines[1:]
+        for line in lines:
+            if not line.strip() or line.strip().startswith("#"):
+                continue
+            parts = line.split(",")
+            if len(parts) >= 3:
+                name = parts[0].strip()
+                aid = parts[1].strip()
+                email = parts[2].strip()
+                if name and aid and email:
+                    members.append((name, aid, email))
+            elif len(parts) >= 2:
+                # Fallback for old CSV format (no email) - user must fix
+                pass
+    except Exception:
+        pass
+    return members
+
+# 세션/커넥션 풀(requests, urllib3)은 import 비용이 커서 jira_client 모듈로 분리하고 처음 사용할 때 불러온다.
+# 기존처럼 `from worklog_api import get_client`로 가져와도 동작한다.
+_CLIENT_NAMES = ("KeepAliveAdapter", "JiraClient", "get_client", "get_session")
+
+def __getattr__(name):
+    if name in _CLIENT_NAMES:
+        import jira_client
+        return getattr(jira_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_current_account_id(sess: requests.Session) -> str:
+    r = sess.get(BASE_URL + "myself", timeout=30)
+    r.raise_for_status()
+    data = r.json()
+    return data["accountId"]
+
+def validate_date_str(date_str: str) -> str:
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return date_str
+    except ValueError:
+        raise ValueError("날짜 형식이 올바르지 않습니다. 예: 2025-09-17")
+
+class QueryCancelled(Exception):
+    """조회가 취소되어 더 이상 요청을 보내지 않고 중단할 때 발생한다."""
+
+def check_cancelled(cancel):
+    """cancel(threading.Event)이 설정되어 있으면 QueryCancelled를 발생시킨다."""
+    if cancel is not None and cancel.is_set():
+        raise QueryCancelled("조회가 취소되었습니다.")
+
+# 조회 검색에서 이슈 키와 함께 받아 행에 붙이는 이슈 필드 (추가 요청 없음)
+ISSUE_SUMMARY_FIELDS = ["summary", "status", "project"]
+# 행의 이슈 정보 컬럼 (테이블에서 선택적으로 표시)
+ISSUE_COLUMNS = ["issueSummary", "issueStatus", "issueProject"]
+
+def enhanced_search_issues(sess: requests.Session, jql: str, fields=None, page_size=100, cancel=None) -> list:
+    """JQL 검색 결과 이슈({"id", "key", "fields"})를 모든 페이지에서 모아 이슈 키 순으로 반환한다."""
+    if fields is None:
+        fields = ["key"]
+    issues = {}
+    next_token = None
+    url = BASE_URL + "search/jql"
+    while True:
+        check_cancelled(cancel)
+        payload = {
+            "jql": jql,
+            "fields": fields,
+            "maxResults": page_size
+        }
+        if next_token:
+            payload["nextPageToken"] = next_token
+        r = sess.post(url, json=payload, timeout=60)
+        r.raise_for_status()
+        data = r.json()
+        for it in data.get("issues", []) or []:
+            if it.get("key"):
+                issues[it["key"]] = it
+        next_token = data.get("nextPageToken")
+        if not next_token:
+            break
+    return [issues[key] for key in sorted(issues)]
+
+def issue_summary(fields: dict) -> dict:
+    """검색 결과 이슈의 fields에서 행의 이슈 정보 컬럼(ISSUE_COLUMNS) 값을 뽑는다."""
+    fields = fields or {}
+    return {
+        "issueSummary": fields.get("summary") or "",
+        "issueStatus": (fields.get("status") or {}).get("name", ""),
+        "issueProject": (fields.get("project") or {}).get("name", ""),
+    }
+
+def iter_issue_worklogs(sess: requests.Session, issue_key: str, page_size=100,
+                        started_after: int = None, started_before: int = None):
+    """
+    이슈의 worklog를 페이지 단위로 조회한다.
+    started_after/started_before(epoch 밀리초)가 주어지면 서버에서 시작일시로 걸러서 받으므로,
+    장기 이슈라도 조회 기간의 worklog만 내려받고 그 범위를 다 받으면 바로 멈춘다.
+    """
+    url = f"{BASE_URL}issue/{issue_key}/worklog"
+    start_at = 0
+    while True:
+        params = {"startAt": start_at, "maxResults": page_size}
+        if started_after is not None:
+            params["startedAfter"] = int(started_after)
+        if started_before is not None:
+            params["startedBefore"] = int(started_before)
+        r = sess.get(url, params=params, timeout=60)
+        r.raise_for_status()
+        data = r.json()
+        worklogs = data.get("worklogs", []) or []
+        total = data.get("total", len(worklogs))
+        for wl in worklogs:
+            yield wl
+        start_at += len(worklogs)
+        if start_at >= total or not worklogs:
+            break
+
+def started_window_ms(date_from: str, date_to: str) -> tuple:
+    """
+    조회 기간을 worklog startedAfter/startedBefore 값(epoch ms)으로 변환한다.
+    worklog마다 시간대가 다를 수 있어 앞뒤로 하루씩 여유를 두고, 정확한 날짜 비교는 로컬에서 한다.
+    """
+    start = datetime.strptime(date_from, "%Y-%m-%d") - timedelta(days=1)
+    end = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=2)
+    return int(start.astimezone().timestamp() * 1000), int(end.astimezone().timestamp() * 1000)
+
+def iter_worklogs_concurrent(sess: requests.Session, issue_keys: list, keep=None,
+                             max_workers: int = FETCH_WORKERS, page_size=100, started_window: tuple = None,
+                             progress=None, cancel=None):
+    """
+    여러 이슈의 worklog를 최대 max_workers개의 스레드로 동시에 조회하면서, 앞쪽 이슈부터 끝나는 대로 바로 반환한다.
+    keep(wl)이 주어지면 True인 worklog만 남긴다.
+    started_window=(startedAfter, startedBefore)가 주어지면 그 구간의 worklog만 서버에서 받는다.
+    (issue_key, worklog) 튜플을 issue_keys 순서 → 이슈 내 Jira 반환 순서로 내보내므로
+    동시 실행 순서와 관계없이 항상 같은 순서를 보장한다.
+    미리 받아 두는 이슈 수를 max_workers의 2배로 제한하여 메모리 사용량이 이슈 수에 비례해 늘지 않는다.
+    progress(완료 이슈 수, 전체 이슈 수)가 주어지면 시작할 때와 이슈 하나의 worklog를 모두 내보낼 때마다 호출한다.
+    cancel(threading.Event)이 설정되면 새 요청(다음 이슈, 다음 페이지)을 보내지 않고 QueryCancelled로 멈춘다.
+    """
+    started_after, started_before = started_window or (None, None)
+
+    def fetch_one(key):
+        result = []
+        check_cancelled(cancel)
+        for wl in iter_issue_worklogs(sess, key, page_size=page_size,
+                                      started_after=started_after, started_before=started_before):
+            # 다음 페이지를 요청하기 전에 취소 여부를 확인한다
+            check_cancelled(cancel)
+            if keep is None or keep(wl):
+                result.append(wl)
+        return result
+
+    total = len(issue_keys)
+    if progress is not None:
+        progress(0, total)
+    if not issue_keys:
+        return
+    workers = max(1, min(max_workers, len(issue_keys)))
+    pending = deque()
+    keys = iter(issue_keys)
+    done = 0
+    ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="worklog-fetch")
+    try:
+        for key in keys:
+            pending.append((key, ex.submit(fetch_one, key)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            check_cancelled(cancel)
+            key, fut = pending.popleft()
+            worklogs = fut.result()
+            next_key = next(keys, None)
+            if next_key is not None:
+                pending.append((next_key, ex.submit(fetch_one, next_key)))
+            for wl in worklogs:
+                yield key, wl
+            done += 1
+            if progress is not None:
+                progress(done, total)
+    finally:
+        # 오류가 나거나 소비자가 중간에 멈추면 아직 시작하지 않은 요청은 취소한다
+        ex.shutdown(wait=False, cancel_futures=True)
+
+def fetch_worklogs_concurrent(sess: requests.Session, issue_keys: list, keep=None,
+                              max_workers: int = FETCH_WORKERS, page_size=100, started_window: tuple = None,
+                              progress=None, cancel=None) -> list:
+    """iter_worklogs_concurrent의 결과를 (issue_key, worklog) 튜플 리스트로 모아서 반환한다."""
+    return list(iter_worklogs_concurrent(sess, issue_keys, keep=keep, max_workers=max_workers,
+                                         page_size=page_size, started_window=started_window, progress=progress,
+                                         cancel=cancel))
+
+def iter_worklog_change_pages(sess: requests.Session, endpoint: str, since_ms: int):
+    """
+    worklog/updated 또는 worklog/deleted 를 since_ms(epoch 밀리초)부터 페이지 단위로 조회하여
+    (values, until) 튜플을 반환한다. 페이지당 최대 1000건이며, 다음 페이지는 응답의 until 값부터 이어서 조회한다.
+    """
+    url = BASE_URL + endpoint
+    since = int(since_ms)
+    while True:
+        r = sess.get(url, params={"since": since}, timeout=60)
+        r.raise_for_status()
+        data = r.json()
+        until = data.get("until")
+        yield data.get("values", []) or [], int(until) if until is not None else since
+        if data.get("lastPage", True):
+            break
+        if until is None or int(until) <= since:
+            break
+        since = int(until)
+
+def fetch_worklogs_by_ids(sess: requests.Session, worklog_ids: list, chunk_size=WORKLOG_LIST_CHUNK) -> list:
+    """worklog/list 로 worklog 본문을 chunk_size개씩 묶어 조회한다."""
+    url = BASE_URL + "worklog/list"
+    worklogs = []
+    for i in range(0, len(worklog_ids), chunk_size):
+        chunk = [int(wid) for wid in worklog_ids[i:i + chunk_size]]
+        r = sess.post(url, json={"ids": chunk}, timeout=60)
+        r.raise_for_status()
+        worklogs.extend(r.json() or [])
+    return worklogs
+
+def resolve_issues(sess: requests.Session, issue_ids, chunk_size=100) -> dict:
+    """
+    이슈 ID 목록을 {issueId: {"key", 이슈 정보 컬럼…}} 딕셔너리로 변환한다. (worklog/list 응답에는 issueId만 있음)
+    키를 찾는 같은 검색에서 ISSUE_SUMMARY_FIELDS도 함께 받는다.
+    """
+    ids = sorted({str(i) for i in issue_ids if i})
+    url = BASE_URL + "search/jql"
+    mapping = {}
+    for i in range(0, len(ids), chunk_size):
+        jql = f"id in ({', '.join(ids[i:i + chunk_size])})"
+        next_token = None
+        while True:
+            payload = {"jql": jql, "fields": ["key"] + ISSUE_SUMMARY_FIELDS, "maxResults": chunk_size}
+            if next_token:
+                payload["nextPageToken"] = next_token
+            r = sess.post(url, json=payload, timeout=60)
+            r.raise_for_status()
+            data = r.json()
+            for it in data.get("issues", []) or []:
+                if it.get("id") and it.get("key"):
+                    mapping[str(it["id"])] = {"key": it["key"], **issue_summary(it.get("fields"))}
+            next_token = data.get("nextPageToken")
+            if not next_token:
+                break
+    return mapping
+
+def iter_worklogs_bulk(sess: requests.Session, since_ms: int, keep=None, cancel=None, issue_info: dict = None):
+    """
+    worklog/updated + worklog/list 기반 일괄 조회 엔진.
+    since_ms 이후 수정된 worklog ID를 1000개 단위로 받아 본문을 조회하고 keep(wl)으로 로컬 필터링한 뒤,
+    이슈 키를 붙여 (issue_key, worklog) 튜플로 한 묶음씩 바로 반환한다.
+    이슈별 worklog 전체를 페이지 단위로 훑지 않으므로 worklog가 많은 장기 이슈의 비용이 사라진다.
+    issue_info(dict)가 주어지면 키를 찾으면서 받은 이슈 정보를 {이슈 키: 이슈 정보 컬럼} 으로 채운다.
+    """
+    issues = {}
+    for values, _until in iter_worklog_change_pages(sess, "worklog/updated", since_ms):
+        check_cancelled(cancel)
+        ids = [item["worklogId"] for item in values if item.get("worklogId") is not None]
+        worklogs = fetch_worklogs_by_ids(sess, ids) if ids else []
+        if keep is not None:
+            worklogs = [wl for wl in worklogs if keep(wl)]
+        missing = {str(wl.get("issueId")) for wl in worklogs if str(wl.get("issueId")) not in issues}
+        if missing:
+            resolved = resolve_issues(sess, missing)
+            issues.update(resolved)
+            if issue_info is not None:
+                issue_info.update({info["key"]: info for info in resolved.values()})
+        pairs = [((issues.get(str(wl.get("issueId"))) or {}).get("key", str(wl.get("issueId"))), wl)
+                 for wl in worklogs]
+        pairs.sort(key=lambda p: (p[0], int(p[1].get("id") or 0)))
+        yield from pairs
+
+def bulk_since_ms(date_str: str, lookback_days: int = BULK_LOOKBACK_DAYS) -> int:
+    """조회일(로컬 자정) 기준 lookback_days 이전 시각을 worklog/updated 의 since 값(epoch ms)으로 변환한다."""
+    day_start = datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=lookback_days)
+    return int(day_start.astimezone().timestamp() * 1000)
+
+def query_engine_for(date_from: str, engine: str = None) -> str:
+    """
+    조회 기간에 실제로 쓸 조회 방식. (engine을 생략하면 QUERY_ENGINE)
+    "bulk"는 사이트 전체에서 since 이후 수정된 worklog를 모두 훑으므로, 시작일이 오늘 기준
+    BULK_LOOKBACK_DAYS보다 오래된 기간은 비용이 끝없이 커지지 않도록 "search"로 조회한다.
+    """
+    engine = engine or QUERY_ENGINE
+    if engine == "bulk" and date_from < (date.today() - timedelta(days=BULK_LOOKBACK_DAYS)).isoformat():
+        return "search"
+    return engine
+
+def extract_comment_text(adf) -> str:
+    """worklog comment(ADF)를 한 줄 텍스트로 변환한다. 변환할 수 없으면 빈 문자열."""
+    try:
+        return adf_to_text(adf, "flat")
+    except Exception:
+        return ""
+
+def to_adf_comment(text: str) -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": text or ""}
+                ]
+            }
+        ]
+    }
+
+# worklog 시작일시 변환 캐시 크기. 같은 시작일시(09:00, 13:00 …)가 행마다 반복되므로 한 번만 변환한다
+STARTED_CACHE_SIZE = 65536
+_WEEKDAYS_KOR = "월화수목금토일"
+
+@lru_cache(maxsize=STARTED_CACHE_SIZE)
+def parse_started(started_str: str) -> datetime:
+    """Jira 시작일시(예: 2025-09-17T09:00:00.000+0900)를 시간대가 있는 datetime으로 변환한다."""
+    try:
+        # Python 3.11부터 fromisoformat이 +0900 같은 시간대도 읽으며 strptime보다 훨씬 빠르다
+        return datetime.fromisoformat(started_str)
+    except ValueError:
+        return datetime.strptime(started_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+def format_started_dt(dt: datetime) -> str:
+    """시작일시를 표시 형식 "2026-06-04(목) 08:32"로 만든다."""
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}({_WEEKDAYS_KOR[dt.weekday()]}) "
+            f"{dt.hour:02d}:{dt.minute:02d}")
+
+def format_started_jira(dt: datetime) -> str:
+    """시작일시를 Jira에 보내는 형식(2026-06-04T08:32:00.000+0900)으로 만든다."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+@lru_cache(maxsize=STARTED_CACHE_SIZE)
+def decode_started(started_str: str) -> tuple:
+    """Jira 시작일시를 (datetime, 표시 문자열, 날짜 YYYY-MM-DD) 로 한 번에 변환한다. 형식이 틀리면 ValueError."""
+    dt = parse_started(started_str)
+    return dt, format_started_dt(dt), dt.date().isoformat()
+
+# 선택한 worklog 일괄 수정 시 동시에 보내는 PUT 요청 수
+BULK_EDIT_WORKERS = 4
+
+def shift_started(started_raw: str, minutes: int) -> str:
+    """Jira 시작일시 문자열을 minutes분 옮긴다 (시간대는 그대로 유지)."""
+    return format_started_jira(parse_started(started_raw) + timedelta(minutes=minutes))
+
+def bulk_edit_changes(row: dict, shift_minutes: int = None, time_spent: str = None,
+                      find: str = None, replace: str = None) -> dict:
+    """
+    일괄 수정 조건을 조회 결과 한 행에 적용했을 때 보낼 수정 내용(update_worklog_remote 인자 이름 기준)을 만든다.
+    바뀌는 것이 없으면 빈 dict (예: 찾을 문자열이 코멘트에 없음).
+    """
+    changes = {}
+    if shift_minutes and row.get("startedRaw"):
+        changes["started"] = shift_started(row["startedRaw"], shift_minutes)
+    if time_spent and parse_time_spent_seconds(time_spent) != row.get("timeSpentSeconds"):
+        changes["timeSpent"] = time_spent
+    if find:
+        comment = row.get("commentText") or ""
+        if find in comment:
+            changes["comment"] = comment.replace(find, replace or "")
+    return changes
+
+def run_concurrent(func, items: list, max_workers: int = BULK_EDIT_WORKERS, progress=None) -> list:
+    """
+    items의 각 항목에 func(item)을 최대 max_workers개씩 동시에 실행한다.
+    결과는 items 순서대로 (item, 결과 또는 None, 오류 또는 None) 목록이며,
+    일부가 실패해도 나머지는 계속 실행한다. progress(완료 수, 전체 수)를 하나 끝날 때마다 호출한다.
+    """
+    results = [None] * len(items)
+    if not items:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))),
+                            thread_name_prefix="worklog-bulk") as ex:
+        futures = {ex.submit(func, item): i for i, item in enumerate(items)}
+        for done, fut in enumerate(as_completed(futures), 1):
+            i = futures[fut]
+            try:
+                results[i] = (items[i], fut.result(), None)
+            except Exception as e:
+                results[i] = (items[i], None, e)
+            if progress is not None:
+                progress(done, len(items))
+    return results
+
+def bulk_update_worklogs(sess: requests.Session, updates: list, max_workers: int = BULK_EDIT_WORKERS,
+                         progress=None) -> list:
+    """updates [(issue_key, worklog_id, changes)] 를 동시에 PUT한다. 결과 형식은 run_concurrent와 같다."""
+    def send(update):
+        issue_key, worklog_id, changes = update
+        return update_worklog_remote(issue_key, worklog_id, time_spent=changes.get("timeSpent"),
+                                     comment=changes.get("comment"), started=changes.get("started"), sess=sess)
+
+    return run_concurrent(send, updates, max_workers=max_workers, progress=progress)
+
+def create_worklog_remote(sess: requests.Session, issue_key: str, started: str, time_spent: str,
+                          comment: str = None) -> dict:
+    """이슈에 worklog를 새로 기록한다 (작성자는 인증한 사용자)."""
+    data = {"started": started, "timeSpent": time_spent}
+    if comment:
+        data["comment"] = to_adf_comment(comment)
+    r = sess.post(f"{BASE_URL}issue/{issue_key}/worklog", json=data, timeout=30)
+    r.raise_for_status()
+    return r.json()
+
+# worklog 가져오기(CSV) 입력 형식. CSV 저장 파일(DISPLAY_COLUMNS)도 그대로 읽을 수 있다 (commentText = comment).
+IMPORT_COLUMNS = ["issueKey", "started", "timeSpent", "comment"]
+_ISSUE_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+_STARTED_INPUT_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:\([^)]*\))?[ T]+(\d{1,2}:\d{2})$")
+
+def parse_started_input(text: str) -> datetime:
+    """
+    가져오기 파일의 시작일시를 시간대가 있는 datetime으로 변환한다.
+    "2026-06-04(목) 08:32"(CSV 저장 형식), "2026-06-04 08:32", Jira 형식(2026-06-04T08:32:00.000+0900)을 받는다.
+    시간대가 없으면 이 PC의 시간대로 본다.
+    """
+    text = (text or "").strip()
+    if "T" in text:
+        try:
+            dt = parse_started(text)
+            return dt if dt.tzinfo is not None else dt.astimezone()
+        except ValueError:
+            pass
+    m = _STARTED_INPUT_RE.match(text)
+    if not m:
+        raise ValueError(f"시작일시 형식이 올바르지 않습니다: {text!r} (예: 2026-06-04 08:30)")
+    return datetime.strptime(f"{m.group(1)} {m.group(2)}", "%Y-%m-%d %H:%M").astimezone()
+
+def read_import_file(path: str) -> list:
+    """가져오기 CSV를 읽어 (줄 번호, 행 dict) 목록으로 반환한다. (utf-8 / utf-8-sig)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [(i, record) for i, record in enumerate(csv.DictReader(f), start=2)
+                if any((v or "").strip() for v in record.values() if isinstance(v, str))]
+
+def write_import_template(path: str):
+    """가져오기 CSV 양식(헤더 + 예시 한 줄)을 만든다."""
+    with open_export(path, "csv") as out:
+        writer = csv.writer(out)
+        writer.writerow(IMPORT_COLUMNS)
+        writer.writerow(["PROJ-123", "2026-06-04 09:00", "2h", "업무 내용"])
+
+def validate_import_record(record: dict) -> dict:
+    """가져오기 행 하나를 검사하고 보낼 값으로 정리한다. 잘못된 행은 ValueError."""
+    issue_key = (record.get("issueKey") or "").strip().upper()
+    if not _ISSUE_KEY_RE.match(issue_key):
+        raise ValueError(f"이슈 키가 올바르지 않습니다: {issue_key!r}")
+    started = parse_started_input(record.get("started"))
+    # 보낼 값과 합계/중복 판정에 쓰는 초가 같도록 분 단위 h/m 형식으로 정리해서 보낸다
+    duration = Duration.parse(record.get("timeSpent"))
+    comment = record.get("comment")
+    if comment is None:
+        comment = record.get("commentText")
+    return {
+        "issueKey": issue_key,
+        "started": format_started_jira(started),
+        "startedDate": started.strftime("%Y-%m-%d"),
+        "timeSpent": duration.format(),
+        "timeSpentSeconds": duration.seconds,
+        "comment": (comment or "").strip(),
+    }
+
+def _import_match_key(issue_key: str, started: str, seconds: int) -> tuple:
+    # 같은 이슈, 같은 시작 시각(분 단위, 시간대 무관), 같은 소요시간이면 이미 기록된 것으로 본다
+    dt = parse_started(started).replace(second=0, microsecond=0)
+    return issue_key, dt.timestamp(), seconds
+
+def plan_worklog_import(sess: requests.Session, records: list) -> tuple:
+    """
+    가져오기 행 [(줄 번호, 행 dict)] 을 검사해서 보낼 계획을 만든다. 아무것도 보내지 않는다.
+    반환값 (items, out_of_band)
+    - items: 행마다 {"line", "status", "message", 정리된 값…}. status는
+      "new"(보낼 것) | "exists"(이미 같은 worklog가 있음 → 다시 실행해도 중복 기록되지 않음)
+      | "duplicate"(파일 안의 앞선 행과 같은 worklog) | "invalid"
+    - out_of_band: 새로 기록하면 하루 합계가 8~9시간을 벗어나는 [(날짜, 시간)]
+    기존 worklog와 하루 합계는 인증한 사용자 기준이다.
+    """
+    # 소요시간(1d, 단위 없는 숫자)을 Jira와 같은 기준으로 초로 바꾸도록 사이트 설정을 먼저 읽는다
+    get_time_tracking(sess)
+    items = []
+    for line, record in records:
+        try:
+            item = validate_import_record(record)
+            item.update(line=line, status="new", message="")
+        except ValueError as e:
+            item = {"line": line, "status": "invalid", "message": str(e),
+                    "issueKey": (record.get("issueKey") or "").strip(), "timeSpentSeconds": 0}
+        items.append(item)
+
+    valid = [item for item in items if item["status"] == "new"]
+    if not valid:
+        return items, []
+    account_id = sess.account_id() if hasattr(sess, "account_id") else get_current_account_id(sess)
+    days = sorted(item["startedDate"] for item in valid)
+    existing = list(iter_worklog_rows(sess, days[0], days[-1], [account_id]))
+    recorded = {_import_match_key(row["issueKey"], row["startedRaw"], row["timeSpentSeconds"])
+                for row in existing if row.get("startedRaw")}
+    first_line = {}
+    for item in valid:
+        key = _import_match_key(item["issueKey"], item["started"], item["timeSpentSeconds"])
+        if key in recorded:
+            item["status"] = "exists"
+            item["message"] = "이미 기록되어 있음"
+        elif key in first_line:
+            item["status"] = "duplicate"
+            item["message"] = f"{first_line[key]}행과 같은 worklog"
+        else:
+            first_line[key] = item["line"]
+
+    seconds = seconds_by_author_day(existing)
+    new_days = set()
+    for item in valid:
+        if item["status"] == "new":
+            key = (account_id, item["startedDate"])
+            seconds[key] = seconds.get(key, 0) + item["timeSpentSeconds"]
+            new_days.add(item["startedDate"])
+    out_of_band = [(day, seconds[(account_id, day)] / 3600.0) for day in sorted(new_days)
+                   if not is_daily_hours_ok(seconds[(account_id, day)] / 3600.0)]
+    return items, out_of_band
+
+def create_planned_worklogs(sess: requests.Session, items: list, max_workers: int = BULK_EDIT_WORKERS,
+                            progress=None) -> list:
+    """plan_worklog_import 결과 중 "new" 항목을 동시에 기록하고, 항목의 status를 "created" / "failed"로 바꾼다."""
+    pending = [item for item in items if item["status"] == "new"]
+
+    def send(item):
+        return create_worklog_remote(sess, item["issueKey"], item["started"], item["timeSpent"], item["comment"])
+
+    results = run_concurrent(send, pending, max_workers=max_workers, progress=progress)
+    for item, result, error in results:
+        if error is None:
+            item["status"], item["message"], item["worklog"] = "created", str(result.get("id", "")), result
+        else:
+            item["status"], item["message"] = "failed", str(error)
+    return items
+
+def update_worklog_remote(issue_key, worklog_id, time_spent, comment, started,
+                         api_token=None, user_email=None, sess: requests.Session = None, retries: int = None):
+    """
+    worklog를 수정한다. retries를 주면 전송 계층(jira_transport)의 재시도 횟수를 바꾼다.
+    (수정 큐처럼 스스로 다시 보내는 곳은 retries=0으로 재시도가 겹치지 않게 한다)
+    """
+    url = f"{BASE_URL}issue/{issue_key}/worklog/{worklog_id}"
+    data = {}
+    if time_spent is not None:
+        data["timeSpent"] = time_spent
+    if comment is not None:
+        data["comment"] = to_adf_comment(comment)
+    if started:
+        data["started"] = started
+    if sess is None:
+        if api_token is None:
+            api_token = read_text("jira_api_token.txt")
+        if user_email is None:
+            raise ValueError("User email is required.")
+        from jira_client import get_client
+        sess = get_client(user_email, api_token)
+    r = sess.put(url, json=data, timeout=30, **({} if retries is None else {"retries": retries}))
+    r.raise_for_status()
+    return r.json()
+
+# 이슈 상세 정보 팝업에 쓰는 필드
+ISSUE_INFO_FIELDS = ["project", "summary", "status", "assignee", "updated", "creator", "reporter", "startdate", "duedate", "description"]
+# 이슈 상세 정보 캐시 유지 시간(초)과, key in (...) 검색 한 번에 묻는 이슈 수
+ISSUE_INFO_TTL = 600
+ISSUE_INFO_BATCH = 100
+
+def fetch_issue_infos(sess: requests.Session, issue_keys: list, cancel=None) -> dict:
+    """
+    여러 이슈의 상세 정보를 key in (...) 검색으로 한꺼번에 조회하여 {이슈 키: fields} 로 반환한다.
+    ISSUE_INFO_BATCH개씩 나눠서 검색하며, 검색 결과에 없는 키는 반환값에도 없다.
+    """
+    url = BASE_URL + "search/jql"
+    infos = {}
+    keys = sorted(set(issue_keys))
+    for i in range(0, len(keys), ISSUE_INFO_BATCH):
+        chunk = keys[i:i + ISSUE_INFO_BATCH]
+        jql = "key in ({})".format(", ".join(f'"{key}"' for key in chunk))
+        next_token = None
+        while True:
+            check_cancelled(cancel)
+            payload = {"jql": jql, "fields": ISSUE_INFO_FIELDS, "maxResults": ISSUE_INFO_BATCH}
+            if next_token:
+                payload["nextPageToken"] = next_token
+            r = sess.post(url, json=payload, timeout=60)
+            r.raise_for_status()
+            data = r.json()
+            for issue in data.get("issues", []) or []:
+                if issue.get("key"):
+                    infos[issue["key"]] = issue.get("fields", {}) or {}
+            next_token = data.get("nextPageToken")
+            if not next_token:
+                break
+    return infos
+
+def parse_started_date(started_str: str) -> str:
+    """worklog started 값(예: 2025-09-17T09:00:00.000+0900)의 날짜를 YYYY-MM-DD로 반환한다."""
+    return decode_started(started_str)[2]
+
+# 조회 결과 행의 전체 컬럼과, 그중 테이블/CSV에 표시되는 컬럼
+ROW_COLUMNS = [
+    "issueKey", "worklogId", "started", "timeSpent", "timeSpentSeconds",
+    "authorDisplayName", "authorAccountId", "updated", "commentText", "startedDate", "startedRaw", "startedAt",
+    "issueSummary", "issueStatus", "issueProject"
+]
+DISPLAY_COLUMNS = ["issueKey", "worklogId", "started", "timeSpent", "authorDisplayName", "commentText"]
+
+def iter_dates(date_from: str, date_to: str):
+    """date_from ~ date_to (양 끝 포함) 날짜를 YYYY-MM-DD 문자열로 반환한다."""
+    d = datetime.strptime(date_from, "%Y-%m-%d").date()
+    end = datetime.strptime(date_to, "%Y-%m-%d").date()
+    while d <= end:
+        yield d.isoformat()
+        d += timedelta(days=1)
+
+def worklog_date_jql(date_from: str, date_to: str) -> str:
+    """조회 기간에 해당하는 worklogDate JQL 조건을 만든다. (기간 전체를 한 번의 검색으로 조회)"""
+    if date_from == date_to:
+        return f"worklogDate = '{date_from}'"
+    return f"worklogDate >= '{date_from}' AND worklogDate <= '{date_to}'"
+
+# 하루 근무시간 기준 범위 (시간). 분 단위 반올림 오차는 DAILY_HOURS_TOLERANCE만큼 허용한다
+DAILY_HOURS_MIN = 8.0
+DAILY_HOURS_MAX = 9.0
+DAILY_HOURS_TOLERANCE = 0.001
+
+def is_daily_hours_ok(hours: float) -> bool:
+    """하루 합계가 8~9시간 범위인지 확인한다."""
+    return DAILY_HOURS_MIN - DAILY_HOURS_TOLERANCE <= hours <= DAILY_HOURS_MAX + DAILY_HOURS_TOLERANCE
+
+def daily_totals(hours_by_day: dict, date_from: str, date_to: str) -> list:
+    """
+    날짜별 합계 시간을 조회 기간의 날짜 순서대로 (날짜, 시간) 리스트로 반환한다.
+    기록이 없는 평일은 0시간으로 포함하고, 주말은 기록이 있을 때만 포함한다.
+    """
+    result = []
+    for day in iter_dates(date_from, date_to):
+        hours = hours_by_day.get(day, 0.0)
+        if day in hours_by_day or datetime.strptime(day, "%Y-%m-%d").weekday() < 5:
+            result.append((day, hours))
+    return result
+
+def format_day_kor(day: str) -> str:
+    """YYYY-MM-DD → MM-DD(요일)"""
+    d = datetime.strptime(day, "%Y-%m-%d")
+    weekdays = ["월", "화", "수", "목", "금", "토", "일"]
+    return f"{d.month:02d}-{d.day:02d}({weekdays[d.weekday()]})"
+
+def seconds_by_author_day(rows) -> dict:
+    """조회 결과 행의 작업 시간(초)을 (accountId, 날짜)별로 합친다."""
+    seconds = {}
+    for row in rows:
+        key = (row["authorAccountId"], row["startedDate"])
+        seconds[key] = seconds.get(key, 0) + (row["timeSpentSeconds"] or 0)
+    return seconds
+
+def summarize_seconds(seconds: dict, authors: list, date_from: str, date_to: str) -> list:
+    """
+    (accountId, 날짜)별 작업 시간(초)으로 하단 합계 표시 항목 [(라벨, 시간, 8~9시간 범위 여부)] 을 만든다.
+    authors는 조회 대상자 [(accountId, 이름)] 목록으로, 기록이 없는 인원도 항목에 포함된다.
+    - 한 명, 하루: 빈 리스트 (전체 합계만 표시)
+    - 한 명, 기간: 날짜별 항목
+    - 여러 명: 인원별 합계 항목. 기간이면 그 인원의 날짜 중 하루라도 8~9시간을 벗어나면 범위 밖으로 본다.
+    """
+    hours_by_author = {}
+    for (aid, day), secs in seconds.items():
+        hours_by_author.setdefault(aid, {})[day] = secs / 3600.0
+
+    summary = []
+    for account_id, name in authors:
+        by_day = hours_by_author.get(account_id, {})
+        if len(authors) == 1:
+            if date_from != date_to:
+                summary.extend(
+                    (format_day_kor(day), h, is_daily_hours_ok(h))
+                    for day, h in daily_totals(by_day, date_from, date_to)
+                )
+            continue
+        total = sum(by_day.values())
+        if date_from == date_to:
+            ok = is_daily_hours_ok(total)
+        else:
+            ok = all(is_daily_hours_ok(h) for _, h in daily_totals(by_day, date_from, date_to))
+        summary.append((name, total, ok))
+    return summary
+
+class WorklogIndex:
+    """
+    조회 결과 행의 합계/중복 색인.
+    전체 합계(초), (accountId, 날짜)별 합계, 같은 작성자의 같은 시작시간(중복 기록)별 행 번호를 들고 있어서
+    행 하나가 수정되면 그 행만 빼고 다시 넣는다. 수정 비용이 전체 행 수와 관계없다.
+    """
+
+    def __init__(self, rows=()):
+        self.total_seconds = 0
+        self.seconds = {}
+        self._day_counts = {}
+        self._by_started = {}
+        for idx, row in enumerate(rows):
+            self.add(idx, row)
+
+    @staticmethod
+    def started_key(row: dict) -> tuple:
+        # 전체 인원 조회 시 서로 다른 사람의 같은 시작시간은 중복이 아니므로 작성자별로 본다
+        return (row["authorAccountId"], row["started"])
+
+    def add(self, idx: int, row: dict):
+        secs = row["timeSpentSeconds"] or 0
+        day_key = (row["authorAccountId"], row["startedDate"])
+        self.total_seconds += secs
+        self.seconds[day_key] = self.seconds.get(day_key, 0) + secs
+        self._day_counts[day_key] = self._day_counts.get(day_key, 0) + 1
+        self._by_started.setdefault(self.started_key(row), set()).add(idx)
+
+    def remove(self, idx: int, row: dict):
+        secs = row["timeSpentSeconds"] or 0
+        day_key = (row["authorAccountId"], row["startedDate"])
+        self.total_seconds -= secs
+        self._day_counts[day_key] -= 1
+        if self._day_counts[day_key]:
+            self.seconds[day_key] -= secs
+        else:
+            # 그 날의 기록이 모두 없어지면 날짜도 지운다 (주말은 기록이 있을 때만 표시)
+            del self._day_counts[day_key]
+            del self.seconds[day_key]
+        key = self.started_key(row)
+        self._by_started[key].discard(idx)
+        if not self._by_started[key]:
+            del self._by_started[key]
+
+    def replace(self, idx: int, old_row: dict, new_row: dict) -> set:
+        """idx 행을 old_row → new_row로 바꾸고, 중복 표시가 달라질 수 있는 행 번호들을 반환한다."""
+        self.remove(idx, old_row)
+        self.add(idx, new_row)
+        return (self._by_started.get(self.started_key(old_row), set())
+                | self._by_started.get(self.started_key(new_row), set()) | {idx})
+
+    def is_duplicate(self, row: dict) -> bool:
+        return len(self._by_started.get(self.started_key(row), ())) > 1
+
+    def summary(self, authors: list, date_from: str, date_to: str) -> list:
+        return summarize_seconds(self.seconds, authors, date_from, date_to)
+
+# Jira는 소요시간을 분 단위로 받으므로 초(s) 단위 입력과 1분 미만 값은 받지 않는다
+_DURATION_TOKEN_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([wdhm])")
+_DURATION_TEXT_RE = re.compile(r"^(?:\s*\d+(?:\.\d+)?\s*[wdhm])+\s*$")
+MIN_TIME_SPENT_SECONDS = 60
+_UNIT_ALIASES = {"minute": "m", "hour": "h", "day": "d", "week": "w"}
+
+class TimeTrackingSettings:
+    """
+    Jira 사이트의 시간 추적 설정. 1d / 1w가 몇 초인지와, 단위 없이 숫자만 입력했을 때의 단위(defaultUnit)를 가진다.
+    값은 get_time_tracking()이 처음 한 번 Jira에서 읽어 캐시한다.
+    known이 False면 사이트 설정을 읽지 못해 Jira 기본값을 가정한 것이다.
+    """
+
+    def __init__(self, hours_per_day: float = 8, days_per_week: float = 5, default_unit: str = "minute",
+                 known: bool = True):
+        self.known = known
+        self.hours_per_day = hours_per_day
+        self.days_per_week = days_per_week
+        self.default_unit = _UNIT_ALIASES.get(default_unit, "m")
+        day = int(round(hours_per_day * 3600))
+        self.unit_seconds = {"s": 1, "m": 60, "h": 3600, "d": day, "w": int(round(day * days_per_week))}
+
+    @classmethod
+    def from_json(cls, data: dict) -> TimeTrackingSettings:
+        return cls(hours_per_day=float(data.get("workingHoursPerDay") or 8),
+                   days_per_week=float(data.get("workingDaysPerWeek") or 5),
+                   default_unit=data.get("defaultUnit") or "minute")
+
+DEFAULT_TIME_TRACKING = TimeTrackingSettings(known=False)
+_time_tracking = None
+_time_tracking_lock = threading.Lock()
+
+def get_time_tracking(sess: requests.Session = None) -> TimeTrackingSettings:
+    """
+    시간 추적 설정을 반환한다. 처음 sess와 함께 호출될 때 한 번만 Jira에서 읽고 이후에는 캐시를 쓴다.
+    configuration/timetracking/options는 관리자 권한이 필요하므로, 실패하면 configuration(전역 설정)을 본다.
+    둘 다 안 되면 DEFAULT_TIME_TRACKING(Jira 기본값, known=False)을 반환하되 캐시하지 않아 다음 호출에서 다시 읽는다.
+    sess 없이 호출하면 읽어 둔 값(없으면 DEFAULT_TIME_TRACKING)을 반환한다.
+    """
+    global _time_tracking
+    if _time_tracking is not None or sess is None:
+        return _time_tracking or DEFAULT_TIME_TRACKING
+    with _time_tracking_lock:
+        if _time_tracking is None:
+            for endpoint, key in (("configuration/timetracking/options", None),
+                                  ("configuration", "timeTrackingConfiguration")):
+                try:
+                    r = sess.get(BASE_URL + endpoint, timeout=30)
+                    r.raise_for_status()
+                    data = r.json()
+                    data = data.get(key) if key else data
+                except Exception:
+                    continue
+                if data:
+                    _time_tracking = TimeTrackingSettings.from_json(data)
+                    break
+    return _time_tracking or DEFAULT_TIME_TRACKING
+
+class Duration:
+    """
+    worklog 소요시간. 분 단위로 맞춘 정수 초(seconds)만 값으로 가진다.
+    입력의 1d / 1w / 단위 없는 숫자는 시간 추적 설정을 따라 읽고, Jira에 보낼 때는 h/m로만 쓴다.
+    """
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: int = 0):
+        self.seconds = int(seconds)
+
+    @classmethod
+    def parse(cls, text: str, settings: TimeTrackingSettings = None) -> Duration:
+        """
+        '1h 30m', '1d', '2.5h', '90'(단위 없으면 defaultUnit) 형식을 읽는다. 1분 미만의 끝자리는 반올림한다.
+        형식이 틀리거나 1분 미만(0, 초 단위 등 Jira가 받지 않는 값)이면 ValueError.
+        사이트 설정을 읽지 못했으면(settings.known이 False) 하루/한 주의 길이를 알 수 없으므로
+        d / w 단위와 단위 없는 숫자도 ValueError로 거절한다.
+        """
+        settings = settings or get_time_tracking()
+        text = (text or "").strip().lower()
+        if _DURATION_TEXT_RE.match(text):
+            tokens = _DURATION_TOKEN_RE.findall(text)
+            guessed = any(unit in "dw" for _, unit in tokens)
+        elif re.fullmatch(r"\d+(?:\.\d+)?", text):
+            tokens = [(text, settings.default_unit)]
+            guessed = True
+        else:
+            raise ValueError(f"소요시간 형식이 올바르지 않습니다: {text!r} (예: 2h, 30m)")
+        if guessed and not settings.known:
+            raise ValueError(f"Jira 시간 추적 설정을 읽지 못해 일/주 단위나 단위 없는 숫자는 쓸 수 없습니다: "
+                             f"{text!r} (h, m 단위로 입력해주세요)")
+        seconds = sum(float(val) * settings.unit_seconds[unit] for val, unit in tokens)
+        if seconds < MIN_TIME_SPENT_SECONDS:
+            raise ValueError(f"소요시간은 1분 이상이어야 합니다: {text!r} (예: 2h, 30m)")
+        # Jira는 분 단위로 기록하므로 행에 두는 초 값도 보내는 값과 같게 분 단위로 맞춘다
+        return cls(int(seconds / 60 + 0.5) * 60)
+
+    def format(self) -> str:
+        """Jira에 보내고 표에 표시하는 형식(예: '9h 30m'). 사이트 설정과 관계없이 값이 같도록 일/주로 묶지 않는다."""
+        hours, minutes = divmod(self.seconds // 60, 60)
+        parts = [f"{hours}h"] if hours else []
+        if minutes:
+            parts.append(f"{minutes}m")
+        return " ".join(parts) or "0m"
+
+    def __repr__(self) -> str:
+        return f"Duration({self.seconds})"
+
+def parse_time_spent_seconds(time_spent: str) -> int:
+    """Jira 소요시간 문자열(예: '1h 30m', '1d')을 초로 변환한다. 읽을 수 없으면 0. (1d/1w는 시간 추적 설정을 따름)"""
+    try:
+        return Duration.parse(time_spent).seconds
+    except ValueError:
+        return 0
+
+def worklog_to_row(issue_key: str, wl: dict, issue: dict = None) -> dict:
+    """
+    Jira worklog 응답을 조회 결과 테이블의 한 행(dict)으로 변환한다.
+    issue는 이슈 정보 컬럼 값(issue_summary 결과)이며, 없으면 빈 문자열로 채운다.
+    """
+    wl_author = wl.get("author", {}) or {}
+    issue = issue or {}
+    started_raw = wl.get("started") or ""
+    started_at, started_display, started_date = decode_started(started_raw) if started_raw else (None, "", "")
+    return {
+        "issueKey": issue_key,
+        "worklogId": wl.get("id"),
+        "started": started_display,
+        "timeSpent": wl.get("timeSpent"),
+        "timeSpentSeconds": wl.get("timeSpentSeconds", 0) or 0,
+        "authorDisplayName": wl_author.get("displayName", ""),
+        "authorAccountId": wl_author.get("accountId", ""),
+        "updated": wl.get("updated", ""),
+        "commentText": extract_comment_text(wl.get("comment")),
+        "startedDate": started_date,
+        # Jira 원본 시작일시 (시간대/초 포함, 수정 시 기준값)와 그 datetime
+        "startedRaw": started_raw,
+        "startedAt": started_at,
+        **{col: issue.get(col, "") for col in ISSUE_COLUMNS},
+    }
+
+class WorklogStore:
+    """
+    worklog ID를 키로 하는 로컬 SQLite 저장소.
+    worklog/updated 의 high-water mark(마지막 until 값)부터 변경분만 받아오고,
+    worklog/deleted 로 삭제된 worklog를 제거하여 로컬 사본을 Jira와 맞춘다.
+    동기화 범위 이전의 날짜는 최초 조회 시 Jira에서 받아 채우고, (작성자, 날짜) 단위로 완료 표시한다.
+    """
+
+    def __init__(self, path: str = WORKLOG_DB):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS worklogs (
+                    worklogId TEXT PRIMARY KEY,
+                    issueId TEXT,
+                    issueKey TEXT,
+                    started TEXT,
+                    startedDate TEXT,
+                    timeSpent TEXT,
+                    timeSpentSeconds INTEGER,
+                    authorAccountId TEXT,
+                    authorDisplayName TEXT,
+                    updated TEXT,
+                    commentText TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_worklogs_author_date ON worklogs (authorAccountId, startedDate);
+                CREATE TABLE IF NOT EXISTS issues (
+                    issueId TEXT PRIMARY KEY,
+                    issueKey TEXT,
+                    summary TEXT,
+                    status TEXT,
+                    project TEXT
+                );
+                CREATE TABLE IF NOT EXISTS covered_days (authorAccountId TEXT, day TEXT, PRIMARY KEY (authorAccountId, day));
+                CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            """)
+            # 이슈 정보 컬럼이 없던 이전 저장소 파일
+            issue_cols = {name for _, name, *_ in self._conn.execute("PRAGMA table_info(issues)")}
+            for col in ("summary", "status", "project"):
+                if col not in issue_cols:
+                    self._conn.execute(f"ALTER TABLE issues ADD COLUMN {col} TEXT")
+
+    def _get_meta(self, name: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, name: str, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, str(value)))
+
+    def sync(self, sess: requests.Session):
+        """마지막 동기화 이후 변경/삭제된 worklog만 Jira에서 받아 로컬 저장소에 반영한다."""
+        with self._lock:
+            updated_since = self._get_meta("updated_since")
+            deleted_since = self._get_meta("deleted_since")
+        if updated_since is None:
+            start = datetime.now() - timedelta(days=STORE_INITIAL_SYNC_DAYS)
+            initial_ms = int(start.timestamp() * 1000)
+            updated_since = deleted_since = initial_ms
+            with self._lock, self._conn:
+                self._set_meta("covered_from", start.date().isoformat())
+
+        for values, until in iter_worklog_change_pages(sess, "worklog/updated", int(updated_since)):
+            ids = [item["worklogId"] for item in values if item.get("worklogId") is not None]
+            worklogs = fetch_worklogs_by_ids(sess, ids) if ids else []
+            self.upsert(sess, worklogs)
+            with self._lock, self._conn:
+                self._set_meta("updated_since", until)
+
+        for values, until in iter_worklog_change_pages(sess, "worklog/deleted", int(deleted_since or updated_since)):
+            ids = [(str(item["worklogId"]),) for item in values if item.get("worklogId") is not None]
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM worklogs WHERE worklogId = ?", ids)
+                self._set_meta("deleted_since", until)
+
+    def upsert(self, sess: requests.Session, worklogs: list, issue_key_map: dict = None, issue_info: dict = None):
+        """
+        worklog 목록을 저장한다. issueId → issueKey는 로컬 캐시에 없을 때만 Jira에 조회한다 (이슈 정보도 함께 받음).
+        issue_info {이슈 키: 이슈 정보 컬럼} 이 주어지면 이슈 정보도 저장한다.
+        """
+        if not worklogs:
+            return
+        key_map = dict(issue_key_map or {})
+        info_by_key = dict(issue_info or {})
+        issue_ids = {str(wl.get("issueId")) for wl in worklogs if wl.get("issueId")}
+        with self._lock:
+            for issue_id, issue_key in self._conn.execute("SELECT issueId, issueKey FROM issues"):
+                key_map.setdefault(issue_id, issue_key)
+        missing = [i for i in issue_ids if i not in key_map]
+        if missing:
+            for issue_id, info in resolve_issues(sess, missing).items():
+                key_map[issue_id] = info["key"]
+                info_by_key.setdefault(info["key"], info)
+
+        records = []
+        for wl in worklogs:
+            issue_id = str(wl.get("issueId") or "")
+            started = wl.get("started", "")
+            author = wl.get("author", {}) or {}
+            records.append((
+                str(wl.get("id")),
+                issue_id,
+                key_map.get(issue_id, issue_id),
+                started,
+                parse_started_date(started) if started else "",
+                wl.get("timeSpent"),
+                wl.get("timeSpentSeconds", 0) or 0,
+                author.get("accountId", ""),
+                author.get("displayName", ""),
+                wl.get("updated", ""),
+                extract_comment_text(wl.get("comment")),
+            ))
+        with self._lock, self._conn:
+            # 이번에 이슈 정보를 모르면 저장된 값을 유지한다
+            self._conn.executemany(
+                "INSERT INTO issues (issueId, issueKey, summary, status, project) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (issueId) DO UPDATE SET issueKey = excluded.issueKey, "
+                "summary = COALESCE(excluded.summary, summary), status = COALESCE(excluded.status, status), "
+                "project = COALESCE(excluded.project, project)",
+                [(i, k, *((info_by_key[k].get(col) for col in ISSUE_COLUMNS) if k in info_by_key
+                          else (None, None, None)))
+                 for i, k in key_map.items() if i in issue_ids],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO worklogs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", records
+            )
+
+    def is_covered(self, account_id: str, date_from: str, date_to: str = None) -> bool:
+        """해당 작성자의 기간 내 worklog가 로컬 저장소에 빠짐없이 들어 있는지 여부."""
+        date_to = date_to or date_from
+        with self._lock:
+            covered_from = self._get_meta("covered_from")
+            if covered_from and date_from >= covered_from:
+                return True
+            covered = {
+                day for (day,) in self._conn.execute(
+                    "SELECT day FROM covered_days WHERE authorAccountId = ? AND day BETWEEN ? AND ?",
+                    (account_id, date_from, date_to),
+                )
+            }
+        return all(day in covered or (covered_from and day >= covered_from)
+                   for day in iter_dates(date_from, date_to))
+
+    def mark_covered(self, account_id: str, date_from: str, date_to: str = None):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO covered_days (authorAccountId, day) VALUES (?, ?)",
+                [(account_id, day) for day in iter_dates(date_from, date_to or date_from)],
+            )
+
+    def rows_for(self, account_ids: list, date_from: str, date_to: str = None) -> list:
+        """로컬 저장소에서 작성자들/기간의 worklog를 조회 결과 행(dict) 목록으로 반환한다."""
+        placeholders = ", ".join("?" for _ in account_ids)
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT w.issueKey, w.worklogId, w.started, w.timeSpent, w.timeSpentSeconds, w.authorDisplayName, "
+                "w.authorAccountId, w.updated, w.commentText, w.startedDate, i.summary, i.status, i.project "
+                "FROM worklogs w LEFT JOIN issues i ON i.issueId = w.issueId "
+                f"WHERE w.authorAccountId IN ({placeholders}) AND w.startedDate BETWEEN ? AND ? "
+                "ORDER BY w.issueKey, CAST(w.worklogId AS INTEGER)",
+                (*account_ids, date_from, date_to or date_from),
+            )
+            records = cur.fetchall()
+        rows = []
+        for (issue_key, worklog_id, started, time_spent, seconds, display_name,
+             account, updated, comment, started_date, summary, status, project) in records:
+            try:
+                started_at, started_display, _ = decode_started(started)
+            except (TypeError, ValueError):
+                started_at, started_display = None, started
+            rows.append({
+                "issueKey": issue_key,
+                "worklogId": worklog_id,
+                "started": started_display,
+                "timeSpent": time_spent,
+                "timeSpentSeconds": seconds or 0,
+                "authorDisplayName": display_name,
+                "authorAccountId": account,
+                "updated": updated,
+                "commentText": comment,
+                "startedDate": started_date,
+                "startedRaw": started,
+                "startedAt": started_at,
+                "issueSummary": summary or "",
+                "issueStatus": status or "",
+                "issueProject": project or "",
+            })
+        return rows
+
+
+def iter_worklog_rows(sess: requests.Session, date_from: str, date_to: str, account_ids: list,
+                      engine: str = None, store: WorklogStore = None, max_workers: int = FETCH_WORKERS,
+                      progress=None, cancel=None):
+    """
+    조회 기간/대상자의 worklog를 조회 결과 행(dict)으로 하나씩 반환한다.
+    이슈 단위로 받는 대로 내보내므로 (조회 엔진이 "store"가 아니면) 전체 결과를 메모리에 모으지 않는다.
+    순서는 이슈 키 순이며, 대상자/날짜별 정렬이 필요하면 sort_worklog_rows / query_worklog_rows를 사용한다.
+    account_ids가 비어 있으면 현재 사용자(currentUser())를 조회한다.
+    engine은 "search" | "bulk" | "store" 중 하나이며, 생략하면 QUERY_ENGINE을 따른다. (실제 방식은 query_engine_for)
+    progress(완료 이슈 수, 전체 이슈 수)는 이슈별로 조회하는 경우("search", 저장소에 없는 기간의 "store")에만 호출된다.
+    cancel(threading.Event)이 설정되면 더 이상 요청을 보내지 않고 QueryCancelled를 발생시킨다.
+    """
+    engine = query_engine_for(date_from, engine)
+    account_ids = list(account_ids)
+    if not account_ids:
+        account_ids = [sess.account_id()] if hasattr(sess, "account_id") else [get_current_account_id(sess)]
+        jql_author = "worklogAuthor = currentUser()"
+    elif len(account_ids) == 1:
+        jql_author = f"worklogAuthor = '{account_ids[0]}'"
+    else:
+        # 여러 명도 한 번의 검색으로 조회하여 공유 이슈의 worklog를 한 번만 가져온다
+        jql_author = "worklogAuthor in (" + ", ".join(f"'{aid}'" for aid in account_ids) + ")"
+    target_accounts = set(account_ids)
+
+    jql = f"{jql_author} AND {worklog_date_jql(date_from, date_to)}"
+    window = started_window_ms(date_from, date_to)
+
+    def keep(wl):
+        # 정확한 필터링: JQL로 1차 거르지만, worklogAuthor가 여러명일 수 있는 이슈 내에서
+        # 해당 날짜/해당 작성자의 worklog만 추려야 함.
+        if (wl.get("author", {}) or {}).get("accountId", "") not in target_accounts:
+            return False
+        started_raw = wl.get("started", "")
+        return bool(started_raw) and date_from <= parse_started_date(started_raw) <= date_to
+
+    if engine == "store":
+        store = store or WorklogStore(WORKLOG_DB)
+        store.sync(sess)
+        if not all(store.is_covered(aid, date_from, date_to) for aid in account_ids):
+            issues = enhanced_search_issues(sess, jql=jql, fields=["key"] + ISSUE_SUMMARY_FIELDS,
+                                            page_size=100, cancel=cancel)
+            pairs = fetch_worklogs_concurrent(sess, [it["key"] for it in issues], keep=keep,
+                                              max_workers=max_workers, started_window=window,
+                                              progress=progress, cancel=cancel)
+            store.upsert(sess, [wl for _, wl in pairs],
+                         issue_key_map={str(wl.get("issueId")): key for key, wl in pairs},
+                         issue_info={it["key"]: issue_summary(it.get("fields")) for it in issues})
+            for aid in account_ids:
+                store.mark_covered(aid, date_from, date_to)
+        yield from store.rows_for(account_ids, date_from, date_to)
+        return
+
+    # 이슈 정보 컬럼은 이슈 키를 얻는 검색에서 함께 받는다 (추가 요청 없음)
+    issue_info = {}
+    if engine == "bulk":
+        pairs = iter_worklogs_bulk(sess, bulk_since_ms(date_from), keep=keep, cancel=cancel, issue_info=issue_info)
+    else:
+        issues = enhanced_search_issues(sess, jql=jql, fields=["key"] + ISSUE_SUMMARY_FIELDS,
+                                        page_size=100, cancel=cancel)
+        issue_info.update((it["key"], issue_summary(it.get("fields"))) for it in issues)
+        pairs = iter_worklogs_concurrent(sess, [it["key"] for it in issues], keep=keep, max_workers=max_workers,
+                                         started_window=window, progress=progress, cancel=cancel)
+    for key, wl in pairs:
+        yield worklog_to_row(key, wl, issue_info.get(key))
+
+def query_worklog_rows(sess: requests.Session, date_from: str, date_to: str, account_ids: list,
+                       engine: str = None, store: WorklogStore = None, max_workers: int = FETCH_WORKERS,
+                       cancel=None) -> list:
+    """
+    조회 기간/대상자의 worklog를 조회 결과 행(dict) 목록으로 반환한다.
+    행은 대상자 순서 → 날짜 → 이슈 키 순으로 정렬된다.
+    """
+    rows = list(iter_worklog_rows(sess, date_from, date_to, account_ids,
+                                  engine=engine, store=store, max_workers=max_workers, cancel=cancel))
+    sort_worklog_rows(rows, account_ids, by_worklog_id=query_engine_for(date_from, engine) == "bulk")
+    return rows
+
+def sort_worklog_rows(rows: list, account_ids: list, by_worklog_id: bool = False) -> list:
+    """
+    조회 결과 행을 인원(대상자 순서) → 날짜별로 묶어서 정렬한다 (제자리 정렬).
+    같은 날짜 안에서는 받은 순서(이슈 키 순서)를 유지하며, by_worklog_id면 먼저 (이슈 키, worklog ID)로 정렬한다.
+    """
+    if by_worklog_id:
+        rows.sort(key=lambda row: (row["issueKey"], int(row["worklogId"] or 0)))
+    author_order = {aid: i for i, aid in enumerate(account_ids)}
+    rows.sort(key=lambda row: (author_order.get(row["authorAccountId"], len(author_order)), row["startedDate"]))
+    return rows
+
+class QueryCache:
+    """
+    조회 결과 캐시 (LRU).
+    키는 (시작일, 종료일, accountId 목록)이며, ttl초가 지난 결과는 버린다.
+    메모리 사용량은 캐시에 들어 있는 전체 행 수(max_rows)로 제한하고, 넘으면 가장 오래 쓰지 않은 결과부터 버린다.
+    미리 조회(prefetch) 스레드가 채우고, 화면 스레드가 take()로 꺼내 쓴다.
+    """
+
+    def __init__(self, max_rows: int = 50000, ttl: float = 300.0):
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._row_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(date_from: str, date_to: str, account_ids) -> tuple:
+        return (date_from, date_to, tuple(account_ids))
+
+    def get(self, key: tuple):
+        """캐시된 행 목록(복사본)을 반환한다. 없거나 만료되었으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, rows = entry
+            if time.monotonic() - stored_at > self.ttl:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return list(rows)
+
+    def take(self, key: tuple):
+        """캐시된 행 목록을 꺼내고 캐시에서는 지운다 (한 번만 쓰는 결과). 없거나 만료되었으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._drop(key)
+            stored_at, rows = entry
+            return rows if time.monotonic() - stored_at <= self.ttl else None
+
+    def __contains__(self, key: tuple) -> bool:
+        return self.get(key) is not None
+
+    def put(self, key: tuple, rows: list):
+        if len(rows) > self.max_rows:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic(), list(rows))
+            self._row_count += len(rows)
+            while self._row_count > self.max_rows:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._row_count = 0
+
+    def _drop(self, key: tuple):
+        _, rows = self._entries.pop(key)
+        self._row_count -= len(rows)
+
+class _Flight:
+    """IssueInfoCache에서 진행 중인 조회 하나. 같은 키를 기다리는 스레드는 event가 설정될 때까지 기다린다."""
+    __slots__ = ("event", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.error = None
+
+class IssueInfoCache:
+    """
+    이슈 상세 정보 캐시. ttl초가 지난 정보는 다시 조회한다.
+    같은 키를 여러 스레드가 동시에 요청하면 한 번만 조회하고 나머지는 그 결과를 기다린다 (single-flight).
+    검색 결과에 없는 이슈는 빈 dict로 캐시하여 같은 키를 반복해서 묻지 않는다.
+    """
+
+    def __init__(self, ttl: float = ISSUE_INFO_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def peek(self, issue_key: str):
+        """캐시된 정보를 반환한다. 없거나 만료되었으면 None (요청하지 않는다)."""
+        with self._lock:
+            return self._fresh(issue_key)
+
+    def get(self, sess: requests.Session, issue_key: str) -> dict:
+        """이슈 하나의 상세 정보. 캐시에 없으면 조회한다."""
+        return self.get_many(sess, [issue_key]).get(issue_key, {})
+
+    def get_many(self, sess: requests.Session, issue_keys, cancel=None) -> dict:
+        """
+        여러 이슈의 상세 정보를 {이슈 키: fields} 로 반환한다.
+        캐시에 없는 키만 한 번의 key in (...) 검색으로 묻고, 다른 스레드가 조회 중인 키는 그 결과를 기다린다.
+        """
+        result, waits, mine = {}, [], []
+        with self._lock:
+            for key in dict.fromkeys(issue_keys):
+                info = self._fresh(key)
+                if info is not None:
+                    result[key] = info
+                elif key in self._flights:
+                    waits.append((key, self._flights[key]))
+                else:
+                    self._flights[key] = _Flight()
+                    mine.append(key)
+
+        if mine:
+            error = None
+            try:
+                infos = fetch_issue_infos(sess, mine, cancel=cancel)
+            except Exception as e:
+                error = e
+            with self._lock:
+                now = time.monotonic()
+                for key in mine:
+                    flight = self._flights.pop(key)
+                    if error is None:
+                        self._entries[key] = (now, infos.get(key, {}))
+                        result[key] = self._entries[key][1]
+                    flight.error = error
+                    flight.event.set()
+            if error is not None:
+                raise error
+
+        for key, flight in waits:
+            flight.event.wait()
+            if flight.error is not None:
+                # 함께 묶인 다른 키 때문에 실패했을 수 있으므로 이 키만 다시 조회한다
+                result.update(self.get_many(sess, [key], cancel=cancel))
+                continue
+            with self._lock:
+                entry = self._entries.get(key)
+            result[key] = entry[1] if entry is not None else {}
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _fresh(self, issue_key: str):
+        entry = self._entries.get(issue_key)
+        if entry is None:
+            return None
+        stored_at, info = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[issue_key]
+            return None
+        return info
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+class RowWriter:
+    """
+    조회 결과 행을 CSV / JSON Lines로 한 행씩 바로 기록한다.
+    GUI의 CSV 저장과 같은 컬럼(DISPLAY_COLUMNS)을 사용하며, 행을 메모리에 모으지 않는다.
+    """
+
+    def __init__(self, out, fmt: str = "csv", columns: list = None):
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt}")
+        self.out = out
+        self.fmt = fmt
+        self.columns = list(columns or DISPLAY_COLUMNS)
+        self.count = 0
+        if fmt == "csv":
+            self._writer = csv.DictWriter(out, fieldnames=self.columns, extrasaction="ignore")
+            self._writer.writeheader()
+
+    def write(self, row: dict):
+        if self.fmt == "csv":
+            self._writer.writerow(row)
+        else:
+            # startedAt(datetime)처럼 JSON에 없는 값은 ISO 문자열로 쓴다
+            self.out.write(json.dumps({col: row.get(col) for col in self.columns}, ensure_ascii=False,
+                                      default=_json_value) + "\n")
+        self.count += 1
+
+    def write_all(self, rows) -> int:
+        for row in rows:
+            self.write(row)
+        return self.count
+
+def open_export(path: str, fmt: str = "csv"):
+    """내보내기 파일을 연다. CSV는 Excel에서 한글이 깨지지 않도록 utf-8-sig(BOM)로 저장한다."""
+    return open(path, "w", encoding="utf-8-sig" if fmt == "csv" else "utf-8", newline="")
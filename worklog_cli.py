@@ -0,0 +1,158 @@
+"""
+worklog_cli.py
+GUI 없이 worklog를 조회하여 CSV / JSON Lines로 출력하는 명령행 도구 (cron, CI의 근무시간 점검 리포트용).
+tkinter를 import하지 않으므로 화면이 없는 환경에서도 실행된다.
+
+사용 예:
+    uv run worklog_cli.py --from 2026-10-12 --to 2026-10-16 --output week.csv
+    uv run worklog_cli.py --members 홍길동 김철수 --from 2026-10-16 --format jsonl
+    uv run worklog_cli.py --from 2026-10-01 --to 2026-10-31 --timesheet 10월.csv --timesheet-issues 10월_이슈.csv
+
+인증 정보는 환경변수 JIRA_API_EMAIL / JIRA_API_TOKEN 이 있으면 그것을, 없으면
+jira_api_email.txt / jira_api_token.txt 를 사용한다.
+
+종료 코드: 0 = 모든 인원/날짜가 8~9시간 범위, 1 = 범위를 벗어난 인원/날짜 있음, 2 = 실행 오류
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+
+import worklog_api
+from worklog_api import (
+    DISPLAY_COLUMNS, FETCH_WORKERS, ISSUE_COLUMNS, RowWriter,
+    daily_totals, get_client, is_daily_hours_ok, iter_worklog_rows, load_members, open_export, read_text,
+    validate_date_str,
+)
+
+EXIT_OK = 0
+EXIT_OUT_OF_BAND = 1
+EXIT_ERROR = 2
+
+
+def load_credentials() -> tuple[str, str]:
+    email = os.environ.get("JIRA_API_EMAIL") or read_text("jira_api_email.txt")
+    token = os.environ.get("JIRA_API_TOKEN") or read_text("jira_api_token.txt")
+    return email, token
+
+
+def select_members(members: list, wanted: list | None) -> list:
+    """members.csv 인원 중 이름 또는 accountId가 wanted에 있는 인원을 (accountId, 이름) 목록으로 반환한다."""
+    if not wanted:
+        return [(aid, name) for name, aid, email in members]
+    selected = []
+    for token in wanted:
+        match = [(aid, name) for name, aid, email in members if token in (name, aid, email)]
+        if not match:
+            raise ValueError(f"members.csv에 없는 대상자입니다: {token}")
+        selected.extend(m for m in match if m not in selected)
+    return selected
+
+
+def tally_seconds(rows, seconds: dict):
+    """행을 그대로 내보내면서 (accountId, 날짜)별 작업 시간(초)을 seconds에 누적한다."""
+    for row in rows:
+        key = (row["authorAccountId"], row["startedDate"])
+        seconds[key] = seconds.get(key, 0) + (row["timeSpentSeconds"] or 0)
+        yield row
+
+
+def collect_rows(rows, collected: list):
+    """행을 그대로 내보내면서 collected에도 모은다 (집계표용)."""
+    for row in rows:
+        collected.append(row)
+        yield row
+
+
+def out_of_band(seconds: dict, authors: list, date_from: str, date_to: str) -> list:
+    """8~9시간 범위를 벗어난 (이름, 날짜, 시간) 목록. 기록이 없는 평일은 0시간으로 본다."""
+    result = []
+    for account_id, name in authors:
+        by_day = {day: s / 3600.0 for (aid, day), s in seconds.items() if aid == account_id}
+        for day, h in daily_totals(by_day, date_from, date_to):
+            if not is_daily_hours_ok(h):
+                result.append((name, day, h))
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Jira worklog 조회 (GUI 없이 CSV / JSON Lines 출력)")
+    parser.add_argument("--members", nargs="+", metavar="NAME",
+                        help="조회할 인원 (members.csv의 이름, accountId 또는 이메일). 생략하면 전체 인원")
+    parser.add_argument("--members-file", default="members.csv", help="인원 목록 파일 (기본: members.csv)")
+    parser.add_argument("--from", dest="date_from", default=date.today().isoformat(),
+                        help="조회 시작일 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--to", dest="date_to", help="조회 종료일 YYYY-MM-DD (기본: 시작일과 같음)")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS,
+                        help=f"이슈별 worklog 동시 조회 수 (기본: {FETCH_WORKERS})")
+    parser.add_argument("--engine", choices=("search", "bulk", "store"), default=worklog_api.QUERY_ENGINE,
+                        help="조회 방식 (기본: %(default)s)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="출력 형식 (기본: csv)")
+    parser.add_argument("--output", "-o", help="출력 파일 경로 (생략하면 표준출력)")
+    parser.add_argument("--issue-columns", action="store_true",
+                        help="이슈 요약/상태/프로젝트 컬럼도 출력 (조회 검색에서 함께 받으므로 추가 요청 없음)")
+    parser.add_argument("--timesheet", metavar="PATH",
+                        help="인원 × 날짜 집계표(주계, 합계, 범위 밖 일수)를 CSV로 저장 (--output이 없으면 행 출력은 생략)")
+    parser.add_argument("--timesheet-issues", metavar="PATH",
+                        help="인원별 이슈 시간 내역을 CSV로 저장 (--output이 없으면 행 출력은 생략)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    date_from = args.date_from
+    date_to = args.date_to or date_from
+    seconds = {}
+    try:
+        validate_date_str(date_from)
+        validate_date_str(date_to)
+        if date_to < date_from:
+            raise ValueError("종료일은 시작일보다 빠를 수 없습니다.")
+        authors = select_members(load_members(args.members_file), args.members)
+        if not authors:
+            raise ValueError(f"조회할 인원이 없습니다. ({args.members_file})")
+        email, token = load_credentials()
+        sess = get_client(email, token)
+        # 받는 대로 한 행씩 기록하므로 기간/인원이 커져도 결과 전체를 메모리에 들고 있지 않는다.
+        # (출력 순서는 이슈 키 순이며, 대상자/날짜별 정렬은 하지 않는다)
+        rows = iter_worklog_rows(sess, date_from, date_to, [aid for aid, _ in authors],
+                                 engine=args.engine, max_workers=max(1, args.workers))
+        rows = tally_seconds(rows, seconds)
+        columns = DISPLAY_COLUMNS + (ISSUE_COLUMNS if args.issue_columns else [])
+        # 집계표는 기간 전체의 행이 필요하므로 이때만 행을 모아 둔다
+        collected = [] if (args.timesheet or args.timesheet_issues) else None
+        if collected is not None:
+            rows = collect_rows(rows, collected)
+
+        if args.output:
+            # GUI의 CSV 저장과 같은 인코딩 (Excel에서 한글이 깨지지 않도록 BOM 포함)
+            with open_export(args.output, args.format) as out:
+                RowWriter(out, args.format, columns=columns).write_all(rows)
+        elif collected is not None:
+            for _ in rows:
+                pass
+        else:
+            RowWriter(sys.stdout, args.format, columns=columns).write_all(rows)
+            sys.stdout.flush()
+
+        if collected is not None:
+            # pandas는 집계표를 만들 때만 불러온다
+            from timesheet import Timesheet
+            sheet = Timesheet.build(collected, authors, date_from, date_to)
+            if args.timesheet:
+                sheet.write_csv(args.timesheet)
+            if args.timesheet_issues:
+                sheet.write_issues_csv(args.timesheet_issues)
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    violations = out_of_band(seconds, authors, date_from, date_to)
+    for name, day, hours in violations:
+        print(f"[8~9h 범위 밖] {name} {day} {hours:.2f}h", file=sys.stderr)
+    return EXIT_OUT_OF_BAND if violations else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
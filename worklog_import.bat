@@ -0,0 +1,2 @@
+@echo off
+uv run python worklog_import.py %*
@@ -0,0 +1,99 @@
+"""
+worklog_import.py
+CSV 파일의 행을 Jira worklog로 한꺼번에 기록하는 명령행 도구.
+입력은 issueKey, started, timeSpent, comment 열을 가진 CSV이며, GUI의 CSV 저장 파일도 그대로 읽는다.
+
+- 보내기 전에 모든 행을 검사하고, 새로 기록하면 하루 합계가 8~9시간을 벗어나는 날짜가 있으면 멈춘다 (--force로 무시).
+- 이미 같은 worklog(같은 이슈, 같은 시작 시각, 같은 소요시간)가 있는 행은 건너뛰므로 다시 실행해도 중복 기록되지 않는다.
+- worklog는 인증한 사용자(jira_api_email.txt) 이름으로 기록된다.
+
+사용 예:
+    uv run worklog_import.py --template import.csv
+    uv run worklog_import.py import.csv --dry-run
+    uv run worklog_import.py import.csv
+
+종료 코드: 0 = 실패 없이 기록(또는 이미 있음, --force로 범위 밖도 기록), 1 = 잘못된 행 / 8~9h 범위 밖 / 기록 실패가 있음,
+2 = 실행 오류
+"""
+
+import argparse
+import sys
+
+from worklog_api import (
+    BULK_EDIT_WORKERS,
+    create_planned_worklogs, get_client, plan_worklog_import, read_import_file, write_import_template,
+)
+from worklog_cli import EXIT_ERROR, EXIT_OK, EXIT_OUT_OF_BAND, load_credentials
+
+STATUS_LABELS = {
+    "new": "기록 예정",
+    "exists": "건너뜀",
+    "duplicate": "파일 내 중복",
+    "invalid": "오류",
+    "created": "기록",
+    "failed": "실패",
+}
+
+
+def print_items(items: list):
+    for item in items:
+        label = STATUS_LABELS.get(item["status"], item["status"])
+        detail = f" {item['message']}" if item.get("message") else ""
+        print(f"{item['line']}행 [{label}] {item.get('issueKey', '')} {item.get('started', '')} "
+              f"{item.get('timeSpent', '')}{detail}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CSV 파일로 Jira worklog 일괄 기록")
+    parser.add_argument("file", nargs="?", help="가져올 CSV 파일 (issueKey, started, timeSpent, comment)")
+    parser.add_argument("--template", metavar="PATH", help="가져오기 CSV 양식을 만들고 끝낸다")
+    parser.add_argument("--dry-run", action="store_true", help="검사 결과만 출력하고 기록하지 않는다")
+    parser.add_argument("--force", action="store_true", help="하루 합계가 8~9시간을 벗어나도 기록한다")
+    parser.add_argument("--workers", type=int, default=BULK_EDIT_WORKERS,
+                        help=f"동시 기록 수 (기본: {BULK_EDIT_WORKERS})")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.template:
+        write_import_template(args.template)
+        print(f"양식을 만들었습니다: {args.template}")
+        return EXIT_OK
+    if not args.file:
+        parser.error("가져올 CSV 파일을 지정하세요.")
+    try:
+        records = read_import_file(args.file)
+        if not records:
+            raise ValueError(f"가져올 행이 없습니다. ({args.file})")
+        email, token = load_credentials()
+        sess = get_client(email, token)
+        items, out_of_band = plan_worklog_import(sess, records)
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    for day, hours in out_of_band:
+        print(f"[8~9h 범위 밖] {day} {hours:.2f}h (기록 후 합계)", file=sys.stderr)
+    invalid = any(item["status"] == "invalid" for item in items)
+    if args.dry_run or invalid or (out_of_band and not args.force):
+        print_items(items)
+        if invalid:
+            print("잘못된 행이 있어 기록하지 않았습니다.", file=sys.stderr)
+        elif out_of_band and not args.force and not args.dry_run:
+            print("하루 합계가 8~9시간을 벗어나 기록하지 않았습니다. (--force로 무시)", file=sys.stderr)
+        return EXIT_OUT_OF_BAND if invalid or out_of_band else EXIT_OK
+
+    create_planned_worklogs(sess, items, max_workers=max(1, args.workers))
+    print_items(items)
+    counts = {status: sum(1 for item in items if item["status"] == status)
+              for status in ("created", "exists", "duplicate", "failed")}
+    print(f"기록 {counts['created']}건, 건너뜀 {counts['exists']}건, 파일 내 중복 {counts['duplicate']}건, "
+          f"실패 {counts['failed']}건", file=sys.stderr)
+    # 범위 밖 날짜는 --force로 기록을 허락했으므로 실패가 없으면 정상 종료
+    return EXIT_OUT_OF_BAND if counts["failed"] else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())